@@ -0,0 +1,80 @@
+"""
+Things every part of the app shares: the database pool, the school-wide GPA
+rank index, the planner reminder engine and this session's grade writer.
+
+Process-wide objects are st.cache_resource'd, so importing this module (or
+calling the getters on every rerun) never rebuilds them.
+"""
+import os
+
+import streamlit as st
+
+from gpa_db import ConnectionPool, migrate
+from gpa_rank import GpaRankIndex, load_gpas
+from grade_store import GradeWriter
+from planner_store import tasks_for_everyone
+from reminders import ReminderEngine
+
+# =============================
+# DATABASE
+# =============================
+DB_PATH = "gpa_users_v2.db"
+
+# Usernames allowed to bulk import grades in the app, comma-separated
+# (EDUSPHERE_REGISTRARS=ms_smith,counselor1). Nobody by default.
+REGISTRARS = {
+    name.strip() for name in os.environ.get("EDUSPHERE_REGISTRARS", "").split(",") if name.strip()
+}
+
+
+def is_registrar(username):
+    return username in REGISTRARS
+
+
+@st.cache_resource
+def get_db_pool():
+    # One pool per server process, shared by every session.
+    # Use `with db_pool.read()` for SELECTs and `with db_pool.write()` for changes.
+    pool = ConnectionPool(DB_PATH)
+
+    # Schema changes (see MIGRATIONS in gpa_db.py) run here, once per process,
+    # instead of CREATE TABLE statements on every rerun
+    with pool.write() as db:
+        migrate(db)
+
+    return pool
+
+
+@st.cache_resource
+def get_rank_index():
+    # School-wide GPA rank / percentile (see gpa_rank.py), built once per process
+    db_pool = get_db_pool()
+
+    def load():
+        with db_pool.read() as db:
+            return load_gpas(db)
+
+    return GpaRankIndex(load)
+
+
+@st.cache_resource
+def get_reminders():
+    # Due / overdue planner tasks for Today's Focus (see reminders.py); its
+    # background thread runs for the life of the process
+    db_pool = get_db_pool()
+
+    def load(start, end):
+        with db_pool.read() as db:
+            return tasks_for_everyone(db, start, end)
+
+    return ReminderEngine(load)
+
+
+def get_grade_writer():
+    # Grade tabs queue changed rows here; it writes them in one batch after a short pause
+    # (and moves the student in the rank index once the write is done)
+    if "grade_writer" not in st.session_state:
+        st.session_state.grade_writer = GradeWriter(
+            get_db_pool().write, on_saved=get_rank_index().update_many
+        )
+    return st.session_state.grade_writer
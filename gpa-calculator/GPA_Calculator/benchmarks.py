@@ -0,0 +1,528 @@
+"""
+Benchmarks for the GPA math, the grades table and the analytics, on a
+synthetic district-sized database.
+
+    python benchmarks.py [--users 50000] [--courses 20] [--repeat 5]
+                         [--out bench_results.json] [--only NAME ...]
+                         [--compare old_results.json] [--threshold 1.25]
+
+Every run builds the same data from --seed (default: 50k students x 20
+courses, half MS with two semesters and half HS with four quarters, ~10 quiz
+attempts each, and a year of planner tasks) in a temporary SQLite file.
+Each benchmark runs --repeat times; the JSON result has the best and median
+time per benchmark plus the scale, versions and machine it ran on.
+
+--compare prints old vs new for every benchmark and exits with status 1 if
+any got slower than --threshold x its old best time, so two versions can be
+checked against each other on the same machine.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from gpa_db import ConnectionPool, migrate, rebuild_gpa_totals
+from gpa_engine import (
+    ROSTER_SELECT,
+    course_grades,
+    courses,
+    iter_roster,
+    student_gpa,
+    unweighted_gpa,
+    unweighted_gpa_batch,
+    weighted_gpa,
+    weighted_gpa_batch,
+)
+from gpa_rank import GpaRankIndex, load_gpas
+from grade_store import GradeWriter, hs_row, ms_row
+from planner_store import (
+    PRIORITIES,
+    TASK_TYPES,
+    add_rule,
+    add_task,
+    month_range,
+    planned_between,
+    tasks_on,
+    upcoming_tasks,
+)
+from quiz_store import weak_units
+from reminders import ReminderEngine
+from workload import WorkloadPlan
+
+RESULTS_FORMAT = 1
+
+# How many students the per-student benchmarks (one click's worth of work) sample
+SAMPLE_STUDENTS = 1000
+# Students whose grades the save benchmark rewrites per repeat
+SAVE_STUDENTS = 200
+QUIZ_ATTEMPTS_PER_STUDENT = 10
+PLANNER_TASKS = 2000
+
+SUBJECTS = {
+    "Spanish": ["Unit 1", "Unit 2", "Unit 3", "Unit 4"],
+    "Math": ["Linear Equations", "Functions", "Quadratics", "Exponents"],
+    "Science": ["Cells", "Genetics", "Ecology", "Chemistry Basics"],
+}
+
+
+# =============================
+# SYNTHETIC DATA
+# =============================
+def username(i):
+    return f"student{i:07d}"
+
+
+def grade_rows(n_users, n_courses, rng):
+    """
+    Grades-table rows for n_users students. The first half of each
+    student's courses are MS (two semesters), the rest HS (four quarters).
+    """
+    names = list(courses)
+    n_ms = n_courses // 2
+    n_hs = n_courses - n_ms
+    if max(n_ms, n_hs) > len(names):
+        raise ValueError(f"at most {2 * len(names)} courses per student")
+
+    for i in range(n_users):
+        user = username(i)
+        picks = rng.permutation(len(names))
+        grades = np.round(rng.normal(88, 8, size=(n_courses, 4)).clip(40, 100)).tolist()
+        for k in range(n_ms):
+            course = names[picks[k]]
+            gt_year = "1" if isinstance(courses[course], dict) else None
+            yield ms_row(user, course, grades[k][0], grades[k][1], gt_year)
+        for k in range(n_hs):
+            course = names[picks[-1 - k]]
+            gt_year = "2" if isinstance(courses[course], dict) else None
+            yield hs_row(user, course, grades[n_ms + k], gt_year)
+
+
+def quiz_rows(n_users, rng):
+    subjects = [(s, u) for s, units in SUBJECTS.items() for u in units]
+    for i in range(n_users):
+        user = username(i)
+        for k in rng.integers(0, len(subjects), size=QUIZ_ATTEMPTS_PER_STUDENT):
+            subject, unit = subjects[k]
+            total = 10
+            yield user, subject, unit, "Mixed", int(rng.integers(3, total + 1)), total
+
+
+# A heavy planner user (a school year of tasks) and a light one (five tasks)
+HEAVY_PLANNER_USER = username(0)
+LIGHT_PLANNER_USER = username(1)
+SCHOOL_YEAR_START = date(2025, 8, 18)
+SCHOOL_YEAR_DAYS = 300
+
+
+def add_planner_tasks(db, user, n_tasks, rng):
+    names = list(courses)
+    for k in range(n_tasks):
+        add_task(
+            db, user,
+            SCHOOL_YEAR_START + timedelta(days=int(rng.integers(0, SCHOOL_YEAR_DAYS))),
+            names[int(rng.integers(0, len(names)))],
+            f"Task {k}",
+            TASK_TYPES[int(rng.integers(0, len(TASK_TYPES)))],
+            PRIORITIES[int(rng.integers(0, len(PRIORITIES)))],
+            int(rng.integers(1, 7)) * 15,
+        )
+
+
+# The heavy user's repeating tasks: (repeat, every) -- one rule row each
+PLANNER_RULES = [("weekdays", 1), ("weekdays", 1), ("daily", 1), ("weekly", 1), ("every_n", 3)]
+
+
+def add_planner_rules(db, user):
+    names = list(courses)
+    for k, (repeat, every) in enumerate(PLANNER_RULES):
+        add_rule(
+            db, user, SCHOOL_YEAR_START, repeat, names[k % len(names)], f"Routine {k}",
+            "Homework", "Medium", 20, every=every,
+            until=SCHOOL_YEAR_START + timedelta(days=SCHOOL_YEAR_DAYS),
+        )
+
+
+def build_database(path, n_users, n_courses, rng):
+    pool = ConnectionPool(path)
+    with pool.write() as db:
+        migrate(db)
+    with pool.write() as db:
+        db.executemany(
+            "INSERT INTO grades VALUES (?,?,?,?,?,?,?,?,?,?)",
+            grade_rows(n_users, n_courses, rng),
+        )
+        db.executemany(
+            """
+            INSERT INTO quiz_attempts (username, subject, unit, difficulty, score, total)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            quiz_rows(n_users, rng),
+        )
+        rebuild_gpa_totals(db)
+        add_planner_tasks(db, HEAVY_PLANNER_USER, PLANNER_TASKS, rng)
+        add_planner_tasks(db, LIGHT_PLANNER_USER, 5, rng)
+        add_planner_rules(db, HEAVY_PLANNER_USER)
+    return pool
+
+
+# =============================
+# BENCHMARKS
+# =============================
+# Each one is set up once with the shared context and returns a function that
+# does one repeat's worth of work and returns how many operations that was.
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+@benchmark
+def gpa_scalar(ctx):
+    """weighted_gpa + unweighted_gpa, one grade at a time (the What-If path)."""
+    grades = ctx["semester_grades"].tolist()
+    weights = ctx["semester_weights"].tolist()
+
+    def run():
+        for g, w in zip(grades, weights):
+            weighted_gpa(g, w)
+            unweighted_gpa(g)
+        return len(grades)
+    return run
+
+
+@benchmark
+def gpa_batch(ctx):
+    """weighted_gpa_batch + unweighted_gpa_batch over every semester at once."""
+    grades, weights = ctx["semester_grades"], ctx["semester_weights"]
+
+    def run():
+        weighted_gpa_batch(grades, weights)
+        unweighted_gpa_batch(grades)
+        return grades.size
+    return run
+
+
+@benchmark
+def results_analytics(ctx):
+    """The Results & Analytics button: student_gpa (with the breakdown) per student."""
+    students = [course_grades(rows) for rows in ctx["sample_rows"]]
+
+    def run():
+        for ms, hs, gt_years in students:
+            student_gpa(ms, hs, gt_years)
+        return len(students)
+    return run
+
+
+@benchmark
+def roster_aggregate(ctx):
+    """Every student's GPA straight from the grades table (iter_roster batches)."""
+    pool = ctx["pool"]
+
+    def run():
+        n = 0
+        with pool.read() as db:
+            for roster in iter_roster(db):
+                n += len(roster["username"])
+        return n
+    return run
+
+
+@benchmark
+def rank_index(ctx):
+    """Building the school rank index from gpa_totals, then one lookup per student."""
+    pool = ctx["pool"]
+    users = ctx["sample_users"]
+
+    def load():
+        with pool.read() as db:
+            return load_gpas(db)
+
+    def run():
+        index = GpaRankIndex(load)
+        for user in users:
+            index.student(user)
+        return len(index)
+    return run
+
+
+@benchmark
+def grade_save(ctx):
+    """The MS / HS save path: stage every course, flush (upsert + gpa_totals) per student."""
+    pool = ctx["pool"]
+    students = ctx["sample_rows"][:SAVE_STUDENTS]
+    writer = GradeWriter(pool.write, delay=3600)
+    bump = [0]
+
+    def run():
+        bump[0] += 1
+        rows = 0
+        for student_rows in students:
+            for user, course, section, s1, s2, q1, q2, q3, q4, gt_year in student_rows:
+                # a different grade every repeat, so every row really changes
+                if section == "MS":
+                    writer.stage(ms_row(user, course, (s1 + bump[0]) % 100, s2, gt_year))
+                else:
+                    writer.stage(hs_row(user, course, [(q1 + bump[0]) % 100, q2, q3, q4], gt_year))
+            rows += writer.flush()
+        return rows
+    return run
+
+
+@benchmark
+def weak_unit_lookup(ctx):
+    """analyze_weak_units: the grouped quiz_attempts query per student."""
+    pool = ctx["pool"]
+    users = ctx["sample_users"]
+
+    def run():
+        with pool.read() as db:
+            for user in users:
+                weak_units(db, user)
+        return len(users)
+    return run
+
+
+def _planner_days(pool, user):
+    days = [SCHOOL_YEAR_START + timedelta(days=k) for k in range(SCHOOL_YEAR_DAYS)]
+
+    def run():
+        with pool.read() as db:
+            for day in days:
+                tasks_on(db, user, day)
+        return len(days)
+    return run
+
+
+@benchmark
+def planner_day_heavy(ctx):
+    """Organization Helper's day view, every day of the year, for a student with a year of tasks."""
+    return _planner_days(ctx["pool"], HEAVY_PLANNER_USER)
+
+
+@benchmark
+def planner_day_light(ctx):
+    """The same day views for a student with five tasks (should cost about the same)."""
+    return _planner_days(ctx["pool"], LIGHT_PLANNER_USER)
+
+
+@benchmark
+def planner_month_rules(ctx):
+    """Month views (one-off tasks + repeating ones expanded for the month) across the school year."""
+    pool = ctx["pool"]
+    months = sorted({month_range(SCHOOL_YEAR_START + timedelta(days=k)) for k in range(SCHOOL_YEAR_DAYS)})
+
+    def run():
+        with pool.read() as db:
+            for start, end in months:
+                planned_between(db, HEAVY_PLANNER_USER, start, end)
+        return len(months)
+    return run
+
+
+# Study plan: the heavy user's year of tasks at a budget that doesn't quite fit
+PLAN_BUDGET = 180
+PLAN_ADDS = 100
+
+
+def _plan_tasks(ctx):
+    with ctx["pool"].read() as db:
+        tasks = upcoming_tasks(db, HEAVY_PLANNER_USER, SCHOOL_YEAR_START)
+    rng = random.Random(0)
+    new = [
+        dict(rng.choice(tasks), id=-(k + 1),
+             date=SCHOOL_YEAR_START + timedelta(days=rng.randrange(SCHOOL_YEAR_DAYS)))
+        for k in range(PLAN_ADDS)
+    ]
+    return tasks, new
+
+
+@benchmark
+def study_plan_build(ctx):
+    """Study Plan from scratch (greedy pass) over a year of tasks."""
+    tasks, _ = _plan_tasks(ctx)
+
+    def run():
+        WorkloadPlan(tasks, PLAN_BUDGET, SCHOOL_YEAR_START)
+        return 1
+    return run
+
+
+@benchmark
+def study_plan_add(ctx):
+    """Adding tasks one at a time to that plan (incremental, re-solves only when overloaded)."""
+    tasks, new = _plan_tasks(ctx)
+
+    def run():
+        plan = WorkloadPlan(tasks, PLAN_BUDGET, SCHOOL_YEAR_START)
+        start = time.perf_counter()
+        for task in new:
+            plan.add(task)
+        # Only the adds count, not building the plan to add to
+        return len(new), time.perf_counter() - start
+    return run
+
+
+# Reminders: every student has this many tasks in the next few days
+REMINDER_TASKS_PER_STUDENT = 3
+
+
+@benchmark
+def reminder_lookup(ctx):
+    """Today's Focus reminders for the sampled students, with every student's tasks tracked."""
+    users = ctx["sample_users"]
+    n_users = ctx["n_users"]
+
+    def load(start, end):
+        span = (end - start).days
+        return [
+            (username(i), {"id": i * REMINDER_TASKS_PER_STUDENT + k, "title": f"Task {k}",
+                           "date": start + timedelta(days=(i + k) % span)})
+            for i in range(n_users) for k in range(REMINDER_TASKS_PER_STUDENT)
+        ]
+
+    engine = ReminderEngine(load)
+
+    def run():
+        for user in users:
+            engine.due_for(user)
+        return len(users)
+    return run
+
+
+def build_context(pool):
+    with pool.read() as db:
+        all_users = [row[0] for row in db.execute("SELECT username FROM gpa_totals")]
+        sample_users = sorted(random.Random(0).sample(all_users, min(SAMPLE_STUDENTS, len(all_users))))
+        sample_rows = [
+            db.execute(ROSTER_SELECT + " WHERE username = ?", (user,)).fetchall()
+            for user in sample_users
+        ]
+        semesters = []
+        for roster_rows in sample_rows:
+            result = student_gpa(*course_grades(roster_rows))
+            semesters.extend((row["grade"], w) for row, w in zip(result["rows"], result["weights"]))
+    # Repeat the sampled semesters up to district size for the pure-math benchmarks
+    semesters = np.array(semesters, dtype=float)
+    reps = max(1, len(all_users) // max(1, len(sample_users)))
+    return {
+        "pool": pool,
+        "n_users": len(all_users),
+        "sample_users": sample_users,
+        "sample_rows": sample_rows,
+        "semester_grades": np.tile(semesters[:, 0], reps),
+        "semester_weights": np.tile(semesters[:, 1], reps),
+    }
+
+
+def time_benchmark(run, repeat):
+    times = []
+    ops = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ops = run()
+        elapsed = time.perf_counter() - start
+        if isinstance(ops, tuple):
+            # (ops, seconds): the benchmark timed just the part that counts
+            ops, elapsed = ops
+        times.append(elapsed)
+    best = min(times)
+    return {
+        "ops": ops,
+        "repeat": repeat,
+        "best_s": round(best, 6),
+        "median_s": round(statistics.median(times), 6),
+        "best_us_per_op": round(best / ops * 1e6, 3) if ops else None,
+    }
+
+
+def run_benchmarks(users, n_courses, repeat, seed=0, only=None, log=print):
+    rng = np.random.default_rng(seed)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        pool = build_database(os.path.join(tmp, "bench.db"), users, n_courses, rng)
+        log(f"built {users:,} students x {n_courses} courses in {time.perf_counter() - start:.1f}s")
+        try:
+            ctx = build_context(pool)
+            for name, setup in BENCHMARKS.items():
+                if only and name not in only:
+                    continue
+                results[name] = time_benchmark(setup(ctx), repeat)
+                log(f"{name:20s} best {results[name]['best_s'] * 1000:10.2f} ms"
+                    f"   ({results[name]['best_us_per_op']} us/op)")
+        finally:
+            pool.close()
+
+    return {
+        "format": RESULTS_FORMAT,
+        "ran_at": datetime.now().isoformat(timespec="seconds"),
+        "scale": {"users": users, "courses": n_courses, "seed": seed,
+                  "quiz_attempts_per_student": QUIZ_ATTEMPTS_PER_STUDENT,
+                  "planner_tasks": PLANNER_TASKS},
+        "machine": {"python": platform.python_version(), "numpy": np.__version__,
+                    "platform": platform.platform(), "cpus": os.cpu_count()},
+        "results": results,
+    }
+
+
+def compare(old, new, threshold):
+    """Prints old vs new best times; returns the names that got slower than threshold x."""
+    if old.get("scale") != new.get("scale"):
+        print("warning: the two runs used different --users / --courses / --seed")
+    slower = []
+    print(f"{'benchmark':20s} {'old ms':>10s} {'new ms':>10s} {'ratio':>7s}")
+    for name, result in new["results"].items():
+        before = old["results"].get(name)
+        if before is None:
+            print(f"{name:20s} {'-':>10s} {result['best_s'] * 1000:10.2f}     new")
+            continue
+        ratio = result["best_s"] / before["best_s"] if before["best_s"] else float("inf")
+        flag = "  SLOWER" if ratio > threshold else ""
+        print(f"{name:20s} {before['best_s'] * 1000:10.2f} {result['best_s'] * 1000:10.2f} {ratio:7.2f}{flag}")
+        if ratio > threshold:
+            slower.append(name)
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--courses", type=int, default=20, help="courses per student")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), metavar="NAME",
+                        help=f"run just these ({', '.join(BENCHMARKS)})")
+    parser.add_argument("--compare", metavar="OLD_JSON", help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="with --compare: fail if new best > threshold x old best")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.users, args.courses, args.repeat, args.seed, args.only)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"results written to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        slower = compare(old, report, args.threshold)
+        if slower:
+            print(f"slower than {args.threshold}x: {', '.join(slower)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Goal-seek for the What-If calculator: "what grades do I need to hit X?"
+
+A class is worth max(weight - (100 - grade) * 0.1, 0) points, so above its
+cutoff (100 - 10 * weight) every grade point is worth exactly 0.1 GPA points
+in any class. That makes the problem piecewise linear and it is solved
+exactly -- no slider trial-and-error and no iterative search:
+
+* uniform grade: the lowest single grade that works if you get it in every
+  class (= the plan where your hardest-needed grade is as low as possible)
+* floors: the lowest grade each class can have if every other class is
+  at max_grade -- below a floor the target is out of reach no matter what
+"""
+import math
+
+import numpy as np
+
+from gpa_engine import weighted_gpa_batch
+
+# What-If assumes nobody plans on more than 100% in a class
+DEFAULT_MAX_GRADE = 100.0
+
+
+def _round_up(grade):
+    # Report grades to 0.1 and always round up, so the answer really reaches the target
+    return math.ceil(round(grade * 10, 6)) / 10
+
+
+def required_points(current_total_points, completed_semesters, n_classes, target_gpa):
+    """GPA points the new classes must add for the cumulative GPA to reach target."""
+    return target_gpa * (completed_semesters + n_classes) - current_total_points
+
+
+def uniform_grade_needed(weights, points_needed, max_grade=DEFAULT_MAX_GRADE):
+    """
+    Lowest grade g so that getting g in every class adds points_needed.
+    Returns None if even max_grade everywhere isn't enough.
+    """
+    weights = np.asarray(weights, dtype=float)
+    if points_needed <= 0:
+        return 0.0
+    if weighted_gpa_batch(max_grade, weights).sum() < points_needed:
+        return None
+
+    # Grade where each class starts earning points, lowest first
+    cutoffs = np.sort(100 - 10 * weights)
+    intercepts = np.sort(weights)[::-1] - 10          # same order as cutoffs
+    bounds = np.append(cutoffs[1:], np.inf)
+
+    # With the first k classes above their cutoff: points = sum(w - 10) + 0.1 * k * g
+    for k in range(1, len(weights) + 1):
+        grade = (points_needed - intercepts[:k].sum()) / (0.1 * k)
+        if grade <= bounds[k - 1]:
+            return max(float(grade), float(cutoffs[k - 1]), 0.0)
+
+    return None
+
+
+def class_floors(weights, points_needed, max_grade=DEFAULT_MAX_GRADE):
+    """
+    For each class, the lowest grade that still allows the target if every
+    other class is at max_grade. None for a class means the target isn't
+    reachable at all.
+    """
+    weights = np.asarray(weights, dtype=float)
+    best = weighted_gpa_batch(max_grade, weights)
+    # Points this class must make up on its own
+    own_share = points_needed - (best.sum() - best)
+
+    floors = []
+    for weight, need, top in zip(weights, own_share, best):
+        if need > top + 1e-9:
+            floors.append(None)
+        elif need <= 0:
+            floors.append(0.0)
+        else:
+            floors.append(_round_up(100 - 10 * (weight - need)))
+    return floors
+
+
+def solve_target(current_total_points, completed_semesters, weights, target_gpa,
+                 max_grade=DEFAULT_MAX_GRADE):
+    """
+    Everything the What-If goal mode shows:
+        points_needed  -> GPA points the new classes must add
+        reachable      -> False if max_grade in every class still falls short
+        best_gpa       -> cumulative GPA with max_grade everywhere
+        uniform_grade  -> one grade for every class that reaches the target (or None)
+        floors         -> per-class lowest grade with the rest at max_grade
+    """
+    weights = np.asarray(weights, dtype=float)
+    total_classes = completed_semesters + len(weights)
+    points_needed = required_points(current_total_points, completed_semesters, len(weights), target_gpa)
+
+    best_points = float(weighted_gpa_batch(max_grade, weights).sum())
+    best_gpa = (current_total_points + best_points) / total_classes if total_classes else 0.0
+
+    uniform = uniform_grade_needed(weights, points_needed, max_grade)
+    return {
+        "points_needed": float(points_needed),
+        "reachable": uniform is not None,
+        "best_gpa": best_gpa,
+        "uniform_grade": None if uniform is None else _round_up(uniform),
+        "floors": class_floors(weights, points_needed, max_grade),
+    }
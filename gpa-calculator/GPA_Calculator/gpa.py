@@ -0,0 +1,123 @@
+"""
+Command-line GPA calculator -- same rules as the Results tab, no Streamlit.
+
+    python gpa.py user alice [--db gpa_users_v2.db]
+        one student's semester breakdown and final GPAs
+
+    python gpa.py all [--out gpas.csv] [--workers 4] [--db gpa_users_v2.db]
+        username, semesters, weighted, unweighted for every student
+
+For `all` the students are split into username ranges (gpa_engine.shard_bounds)
+and each range is computed by its own process with its own read-only
+connection, so big rosters use every core.
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from gpa_db import connect
+from gpa_engine import iter_roster, load_student, shard_bounds
+
+OUTPUT_COLUMNS = ("username", "semesters", "weighted", "unweighted")
+
+
+def shard_gpas(db_path, first_user, end_user):
+    """Worker: (username, semesters, weighted, unweighted) for one username range."""
+    conn = connect(db_path, readonly=True)
+    try:
+        out = []
+        for roster in iter_roster(conn, first_user=first_user, end_user=end_user):
+            for name, sems, w, uw in zip(roster["username"], roster["semesters"],
+                                         roster["weighted"], roster["unweighted"]):
+                if sems:
+                    out.append((name, int(sems), float(w), float(uw)))
+        return out
+    finally:
+        conn.close()
+
+
+def all_gpas(db_path, workers=None):
+    """
+    Every student's GPA, computed in parallel. Yields result rows in
+    username order, one shard at a time.
+    """
+    workers = workers or os.cpu_count() or 1
+    conn = connect(db_path, readonly=True)
+    try:
+        # A few shards per worker so one slow range doesn't hold everything up
+        bounds = shard_bounds(conn, workers * 4)
+    finally:
+        conn.close()
+
+    if workers == 1:
+        for first_user, end_user in bounds:
+            yield from shard_gpas(db_path, first_user, end_user)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(shard_gpas, db_path, first, end) for first, end in bounds]
+        for future in futures:
+            yield from future.result()
+
+
+def cmd_user(args):
+    conn = connect(args.db, readonly=True)
+    try:
+        result = load_student(conn, args.username)
+    finally:
+        conn.close()
+
+    if result["final_weighted"] is None:
+        print(f"No saved grades for {args.username}", file=sys.stderr)
+        return 1
+    for line in result["breakdown"]:
+        print(line)
+    print(f"Final Weighted GPA: {result['final_weighted']}")
+    print(f"Final Unweighted GPA: {result['final_unweighted']}")
+    return 0
+
+
+def cmd_all(args):
+    start = time.perf_counter()
+    out = open(args.out, "w", newline="", encoding="utf-8") if args.out else sys.stdout
+    try:
+        writer = csv.writer(out)
+        writer.writerow(OUTPUT_COLUMNS)
+        count = 0
+        for row in all_gpas(args.db, args.workers):
+            writer.writerow(row)
+            count += 1
+    finally:
+        if args.out:
+            out.close()
+
+    print(f"{count:,} students in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--db", default="gpa_users_v2.db", help="SQLite database (default: gpa_users_v2.db)")
+
+    parser = argparse.ArgumentParser(description="EduSphere GPA calculator (reads the grades table).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    user = commands.add_parser("user", parents=[common], help="one student's breakdown")
+    user.add_argument("username")
+    user.set_defaults(run=cmd_user)
+
+    every = commands.add_parser("all", parents=[common], help="every student's GPA as CSV")
+    every.add_argument("--out", help="CSV file to write (default: stdout)")
+    every.add_argument("--workers", type=int, default=None,
+                       help="processes to use (default: one per CPU)")
+    every.set_defaults(run=cmd_all)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
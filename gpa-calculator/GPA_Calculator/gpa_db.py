@@ -0,0 +1,390 @@
+"""
+SQLite schema and connections for EduSphere (gpa_users_v2.db).
+
+grades is keyed on (username, section, course) so the MS / HS tabs'
+INSERT OR REPLACE actually replaces a course instead of adding another copy.
+
+ConnectionPool lends out pooled connections for the length of a with-block
+instead of every session sharing one module-level connection + cursor. The
+database runs in WAL mode, so the read-only connections used for loads keep
+working while someone else is writing.
+"""
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from gpa_engine import iter_roster
+from profiler import connection_factory
+
+# How long (ms) a connection waits on a locked database before giving up
+BUSY_TIMEOUT_MS = 5000
+
+GRADES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS grades (
+    username  TEXT NOT NULL,
+    section   TEXT NOT NULL,
+    course    TEXT NOT NULL,
+    semester1 REAL,
+    semester2 REAL,
+    q1 REAL,
+    q2 REAL,
+    q3 REAL,
+    q4 REAL,
+    gt_year   TEXT,
+    -- Key order matches the per-user loads:
+    --   WHERE username = ? AND section = 'MS' / 'HS'
+    -- so the table itself is the index for them (WITHOUT ROWID = clustered).
+    PRIMARY KEY (username, section, course)
+) WITHOUT ROWID
+"""
+
+USERS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    pin TEXT
+)
+"""
+
+GRADE_COLUMNS = "username, section, course, semester1, semester2, q1, q2, q3, q4, gt_year"
+
+
+def grades_has_primary_key(conn):
+    """True if the grades table already has the (username, section, course) key."""
+    cols = conn.execute("PRAGMA table_info(grades)").fetchall()
+    # table_info rows: (cid, name, type, notnull, default, pk)
+    return any(col[5] for col in cols)
+
+
+def rebuild_gpa_totals(conn):
+    """
+    Recomputes gpa_totals for every student with the batch engine, a batch
+    of students at a time. For bulk changes (imports); normal saves update
+    just their own students.
+    """
+    conn.execute("DELETE FROM gpa_totals")
+    for roster in iter_roster(conn):
+        has_grades = roster["semesters"] > 0
+        conn.executemany(
+            "INSERT INTO gpa_totals VALUES (?, ?, ?, ?)",
+            zip(
+                [name for name, keep in zip(roster["username"], has_grades) if keep],
+                roster["semesters"][has_grades].tolist(),
+                roster["weighted_points"][has_grades].tolist(),
+                roster["unweighted_points"][has_grades].tolist(),
+            ),
+        )
+
+
+# =============================
+# MIGRATIONS
+# =============================
+# Each migration runs once, in order, inside its own transaction. The number of
+# migrations already applied is stored in the file itself (PRAGMA user_version),
+# so after the first start a database is just "already at version N".
+# To change the schema, append a new function -- never edit or reorder old ones.
+
+def _create_base_tables(conn):
+    conn.execute(GRADES_SCHEMA)
+    conn.execute(USERS_SCHEMA)
+
+
+def _dedupe_grades(conn):
+    """
+    Fix for databases created before grades had a primary key.
+
+    Copies the old table into the keyed layout, keeping the newest row
+    (highest rowid) for each (username, section, course), then swaps it in.
+    """
+    if grades_has_primary_key(conn):
+        return
+
+    conn.execute("ALTER TABLE grades RENAME TO grades_old")
+    conn.execute(GRADES_SCHEMA)
+    # Rows go in oldest -> newest, so INSERT OR REPLACE leaves the latest copy
+    conn.execute(
+        f"""
+        INSERT OR REPLACE INTO grades ({GRADE_COLUMNS})
+        SELECT {GRADE_COLUMNS}
+        FROM grades_old
+        WHERE username IS NOT NULL AND section IS NOT NULL AND course IS NOT NULL
+        ORDER BY rowid
+        """
+    )
+    conn.execute("DROP TABLE grades_old")
+
+
+def _create_quiz_attempts(conn):
+    conn.execute(
+        """
+        CREATE TABLE quiz_attempts (
+            id         INTEGER PRIMARY KEY,
+            username   TEXT NOT NULL,
+            subject    TEXT NOT NULL,
+            unit       TEXT,
+            difficulty TEXT,
+            score      INTEGER NOT NULL,
+            total      INTEGER NOT NULL,
+            taken_at   TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    # score / total ride along in the index so weak-unit lookups never touch the table
+    conn.execute(
+        """
+        CREATE INDEX quiz_attempts_by_unit
+        ON quiz_attempts (username, subject, unit, score, total)
+        """
+    )
+
+
+def _create_gpa_totals(conn):
+    # Running totals per student, kept up to date by grade_store on every save,
+    # so the What-If tab can read "GPA so far" with one primary-key lookup
+    conn.execute(
+        """
+        CREATE TABLE gpa_totals (
+            username          TEXT PRIMARY KEY,
+            semesters         INTEGER NOT NULL,
+            weighted_points   REAL NOT NULL,
+            unweighted_points REAL NOT NULL
+        )
+        """
+    )
+
+    # Backfill everyone who already has grades
+    rebuild_gpa_totals(conn)
+
+
+def _create_planner_tasks(conn):
+    # Organization Helper tasks (used to live in session state only)
+    conn.execute(
+        """
+        CREATE TABLE planner_tasks (
+            id       INTEGER PRIMARY KEY,
+            username TEXT NOT NULL,
+            date     TEXT NOT NULL,     -- YYYY-MM-DD, so text order = date order
+            course   TEXT NOT NULL,
+            title    TEXT NOT NULL,
+            type     TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            est      INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    # Day / week / month views are range scans on this (rowid breaks date ties)
+    conn.execute("CREATE INDEX planner_tasks_by_day ON planner_tasks (username, date)")
+
+
+def _create_ideas(conn):
+    # Idea Vault (used to live in session state only)
+    conn.execute(
+        """
+        CREATE TABLE ideas (
+            id         INTEGER PRIMARY KEY,
+            username   TEXT NOT NULL,
+            title      TEXT NOT NULL,
+            details    TEXT NOT NULL DEFAULT '',
+            tag        TEXT NOT NULL,
+            importance INTEGER NOT NULL,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    # Newest-first pages, with or without a tag filter (rowid = id rides along)
+    conn.execute("CREATE INDEX ideas_by_tag ON ideas (username, tag)")
+
+
+def _index_planner_tasks_by_date(conn):
+    # The reminder engine reads the next few days for every student at once
+    conn.execute("CREATE INDEX planner_tasks_by_date ON planner_tasks (date)")
+
+
+def _create_planner_rules(conn):
+    # Repeating planner tasks: one row per rule, dates are worked out on the fly
+    conn.execute(
+        """
+        CREATE TABLE planner_rules (
+            id       INTEGER PRIMARY KEY,
+            username TEXT NOT NULL,
+            start    TEXT NOT NULL,     -- YYYY-MM-DD, first date
+            until    TEXT,              -- YYYY-MM-DD, last possible date (NULL = no end)
+            repeat   TEXT NOT NULL,     -- daily / weekdays / weekly / every_n
+            every    INTEGER NOT NULL DEFAULT 1,  -- days between dates for every_n
+            course   TEXT NOT NULL,
+            title    TEXT NOT NULL,
+            type     TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            est      INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute("CREATE INDEX planner_rules_by_user ON planner_rules (username, start)")
+
+
+MIGRATIONS = [
+    _create_base_tables,    # 1
+    _dedupe_grades,         # 2
+    _create_quiz_attempts,  # 3
+    _create_gpa_totals,     # 4
+    _create_planner_tasks,  # 5
+    _create_ideas,          # 6
+    _index_planner_tasks_by_date,  # 7
+    _create_planner_rules,  # 8
+]
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """
+    Brings the database up to len(MIGRATIONS). Returns the versions applied.
+    Safe if two processes start at once: the version is re-checked after
+    taking the write lock, so each migration still only runs once.
+    """
+    applied = []
+    for version, step in enumerate(MIGRATIONS, start=1):
+        if schema_version(conn) >= version:
+            continue
+        with conn:
+            # pool.write() has already taken the write lock for the first one
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            if schema_version(conn) >= version:
+                continue
+            step(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+        applied.append(version)
+
+    # A migration that rewrote a table (like the dedupe) leaves lots of free
+    # pages behind -- give that space back to the disk
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    total_pages = conn.execute("PRAGMA page_count").fetchone()[0]
+    if applied and free_pages > total_pages // 4:
+        conn.execute("VACUUM")
+
+    return applied
+
+
+# =============================
+# CONNECTIONS
+# =============================
+def connect(path, readonly=False):
+    """
+    Opens a connection with the settings every EduSphere connection uses.
+    Read-only connections can't take the write lock, so they never block writers.
+    """
+    if readonly:
+        conn = sqlite3.connect(
+            f"file:{path}?mode=ro", uri=True,
+            timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False,
+            factory=connection_factory(),
+        )
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        conn = sqlite3.connect(
+            path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False,
+            factory=connection_factory(),
+        )
+        # WAL is stored in the file, so this only really changes anything the first time
+        conn.execute("PRAGMA journal_mode = WAL")
+        # Safe with WAL: a power cut can lose the last commit but never corrupts the file
+        conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    return conn
+
+
+class ConnectionPool:
+    """
+    A few reusable connections to one database file.
+
+        with pool.read() as db:    # read-only, for SELECTs
+            rows = db.execute(...).fetchall()
+
+        with pool.write() as db:   # commits on success, rolls back on error
+            db.execute(...)
+
+    write() takes the database's write lock up front (BEGIN IMMEDIATE), so a
+    busy database makes it wait at the start -- up to BUSY_TIMEOUT_MS -- instead
+    of failing halfway through a read-then-write. How long those waits took
+    is kept in lock_stats() (the load test reports it).
+
+    A connection is only used by one thread at a time; it goes back to the
+    pool when the with-block ends. If the pool is empty a new connection is
+    opened, and extras beyond `size` are closed instead of kept.
+    """
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self.size = size
+        self._readers = queue.LifoQueue()
+        self._writers = queue.LifoQueue()
+        # Open one writer right away: it creates the file and turns on WAL,
+        # which read-only connections can't do themselves
+        self._writers.put(connect(path))
+        self._stats_lock = threading.Lock()
+        self.reset_lock_stats()
+
+    def _borrow(self, idle, readonly):
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            return connect(self.path, readonly=readonly)
+
+    def _give_back(self, idle, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        if idle.qsize() < self.size:
+            idle.put(conn)
+        else:
+            conn.close()
+
+    @contextmanager
+    def read(self):
+        conn = self._borrow(self._readers, readonly=True)
+        try:
+            yield conn
+        finally:
+            self._give_back(self._readers, conn)
+
+    @contextmanager
+    def write(self):
+        conn = self._borrow(self._writers, readonly=False)
+        try:
+            with conn:
+                start = time.perf_counter()
+                conn.execute("BEGIN IMMEDIATE")
+                self._count_lock_wait(time.perf_counter() - start)
+                yield conn
+        finally:
+            self._give_back(self._writers, conn)
+
+    # ---------- write-lock accounting ----------
+    def _count_lock_wait(self, seconds):
+        with self._stats_lock:
+            self._writes += 1
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+
+    def reset_lock_stats(self):
+        with self._stats_lock:
+            self._writes = 0
+            self._wait_total = 0.0
+            self._wait_max = 0.0
+
+    def lock_stats(self):
+        """{writes, wait_total_s, wait_max_s} for write() blocks since the last reset."""
+        with self._stats_lock:
+            return {
+                "writes": self._writes,
+                "wait_total_s": self._wait_total,
+                "wait_max_s": self._wait_max,
+            }
+
+    def close(self):
+        for idle in (self._readers, self._writers):
+            while not idle.empty():
+                idle.get_nowait().close()
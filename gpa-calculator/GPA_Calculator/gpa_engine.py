@@ -0,0 +1,396 @@
+"""
+GPA math for EduSphere.
+
+Plain Python + NumPy, no Streamlit: the app, gpa_export.py and the gpa.py
+command line all compute GPAs through the functions here.
+
+The scalar helpers (weighted_gpa / unweighted_gpa) are what the What-If tab
+uses for one grade at a time. The *_batch versions do the exact same math on
+NumPy arrays so the Results tab (and anything that works on a whole grade
+level at once) gets every semester converted in one pass.
+"""
+import numpy as np
+
+# =============================
+# COURSES
+# =============================
+courses = {
+    "Spanish 1": 5.0,
+    "Spanish 2": 5.0,
+    "Spanish 3": 5.5,
+    "Spanish 4 AP": 6.0,
+    "Algebra 1": 5.5,
+    "Geometry": 5.5,
+    "Algebra 2": 5.5,
+    "AP Precalculus": 6.0,
+    "GT / AP World History": {1: 5.5, 2: 6.0},
+    "Biology": 5.5,
+    "Chemistry": 5.5,
+    "AP Chemistry": 6.0,
+    "AP Human Geography": 6.0,
+    "Sports": 5.0,
+    "Health": 5.0,
+    "Computer Science": 5.5,
+    "AP Computer Science": 6.0,
+    "Instruments": 5.0,
+    "English 1": 5.5,
+    "Surv Bus Mark Fin": 5.0,
+    "Engineering": 5.0
+}
+
+# Lowest grade for 1, 2, 3 and 4 unweighted points
+UNWEIGHTED_CUTOFFS = np.array([60, 70, 80, 90], dtype=float)
+
+
+def course_weight(course, gt_year=None):
+    """
+    Weight for a course on the 6.0 scale.
+    AP World has a different weight per year (defaults to Year 1),
+    and unknown courses count as 5.0 like the Results tab always did.
+    """
+    weight = courses.get(course, 5.0)
+    if isinstance(weight, dict):
+        return weight[int(gt_year) if gt_year else 1]
+    return weight
+
+
+# =============================
+# SCALAR HELPERS
+# =============================
+def weighted_gpa(avg, weight):
+    return max(weight - ((100 - avg) * 0.1), 0)
+
+def unweighted_gpa(avg):
+    if avg >= 90: return 4
+    if avg >= 80: return 3
+    if avg >= 70: return 2
+    if avg >= 60: return 1
+    return 0
+
+
+# =============================
+# BATCH (VECTORIZED) HELPERS
+# =============================
+def weighted_gpa_batch(grades, weights):
+    grades = np.asarray(grades, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    return np.maximum(weights - (100 - grades) * 0.1, 0)
+
+
+def unweighted_gpa_batch(grades):
+    # Number of cutoffs each grade clears = its unweighted points (0-4)
+    grades = np.asarray(grades, dtype=float)
+    return np.searchsorted(UNWEIGHTED_CUTOFFS, grades, side="right").astype(float)
+
+
+def _average_by_student(values, user_index, n_users):
+    """Returns (semester_count, total, rounded average) per student."""
+    counts = np.bincount(user_index, minlength=n_users)
+    totals = np.bincount(user_index, weights=values, minlength=n_users)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        exact = np.where(counts > 0, totals / counts, np.nan)
+    averages = np.round(exact, 3)
+    # np.round scales by 1000 first, so right at a halfway value it can land on
+    # the other side from Python's round() (which the Results tab always used).
+    # Only those few are re-rounded in Python.
+    halfway = np.flatnonzero(np.isclose((exact * 1000) % 1, 0.5, rtol=0, atol=1e-6))
+    for i in halfway.tolist():
+        averages[i] = round(float(exact[i]), 3)
+    return counts, totals, averages
+
+
+def semester_table(ms_course_grades, hs_course_grades, gt_years=None):
+    """
+    Turns the MS / HS tab inputs into one row per semester.
+
+    ms_course_grades: {course: (sem1, sem2)}   (Health has just one)
+    hs_course_grades: {course: [q1, q2, q3, q4]}  (only the quarters entered;
+                      None keeps a blank quarter's slot)
+    gt_years:         {course: year} for AP World
+
+    Returns (grades, weights, rows) where grades / weights are arrays and
+    rows is a list of dicts describing each semester for the breakdown.
+    """
+    gt_years = gt_years or {}
+    grades = []
+    weights = []
+    rows = []
+
+    # Middle school: every semester grade is one entry
+    for course, sem_grades in ms_course_grades.items():
+        weight = course_weight(course, gt_years.get(course))
+        for sem_index, grade in enumerate(sem_grades, start=1):
+            grades.append(grade)
+            weights.append(weight)
+            rows.append({"section": "MS", "course": course, "semester": sem_index, "grade": grade})
+
+    # High school: Q1+Q2 = semester 1, Q3+Q4 = semester 2, rounded to a whole number
+    for course, q_grades in hs_course_grades.items():
+        weight = course_weight(course, gt_years.get(course))
+        for sem_index in range(0, len(q_grades), 2):
+            sem_quarters = [q for q in q_grades[sem_index: sem_index + 2] if q is not None]
+            if not sem_quarters:
+                continue
+
+            raw_avg = sum(sem_quarters) / len(sem_quarters)
+            sem_avg = round(raw_avg)
+
+            grades.append(sem_avg)
+            weights.append(weight)
+            rows.append({
+                "section": "HS",
+                "course": course,
+                "semester": (sem_index // 2) + 1,
+                "quarters": sem_quarters,
+                "raw_avg": raw_avg,
+                "grade": sem_avg,
+            })
+
+    return np.asarray(grades, dtype=float), np.asarray(weights, dtype=float), rows
+
+
+def gpa_summary(grades, weights):
+    """
+    Converts every semester at once and averages them.
+    Returns (weighted_per_sem, unweighted_per_sem, final_weighted, final_unweighted);
+    the finals are None when there are no semesters.
+    """
+    w = weighted_gpa_batch(grades, weights)
+    uw = unweighted_gpa_batch(grades)
+
+    if w.size == 0:
+        return w, uw, None, None
+
+    # One "student" -> same averaging as the roster so both paths round identically
+    one_student = np.zeros(w.size, dtype=np.intp)
+    _, _, final_w = _average_by_student(w, one_student, 1)
+    _, _, final_uw = _average_by_student(uw, one_student, 1)
+    return w, uw, float(final_w[0]), float(final_uw[0])
+
+
+def breakdown_line(row, w_gpa, uw_gpa):
+    """One line of the Results tab's "full GPA calculation breakdown"."""
+    if row["section"] == "MS":
+        return (
+            f"Middle School | {row['course']} | Semester {row['semester']}: "
+            f"Grade {row['grade']} → Weighted GPA {w_gpa:.2f}, Unweighted GPA {uw_gpa:.2f}"
+        )
+    return (
+        f"High School | {row['course']} | Semester {row['semester']}: "
+        f"Quarter Grades {row['quarters']} → "
+        f"Avg {row['raw_avg']:.2f} → Rounded {row['grade']} → "
+        f"Weighted GPA {w_gpa:.2f}, Unweighted GPA {uw_gpa:.2f}"
+    )
+
+
+def student_gpa(ms_course_grades, hs_course_grades, gt_years=None):
+    """
+    Everything the Results tab shows for one student:
+        rows, weighted, unweighted -> per semester (see semester_table)
+        final_weighted, final_unweighted -> None when there are no semesters
+        breakdown -> one breakdown_line per semester
+    """
+    grades, weights, rows = semester_table(ms_course_grades, hs_course_grades, gt_years)
+    weighted, unweighted, final_weighted, final_unweighted = gpa_summary(grades, weights)
+    return {
+        "rows": rows,
+        "weights": weights,
+        "weighted": weighted,
+        "unweighted": unweighted,
+        "final_weighted": final_weighted,
+        "final_unweighted": final_unweighted,
+        "breakdown": [
+            breakdown_line(row, w_gpa, uw_gpa)
+            for row, w_gpa, uw_gpa in zip(rows, weighted, unweighted)
+        ],
+    }
+
+
+def course_grades(rows):
+    """
+    One student's grades-table rows (ROSTER_SELECT columns) ->
+    (ms_course_grades, hs_course_grades, gt_years), the shapes the MS / HS
+    tabs hand to semester_table.
+    """
+    ms, hs, gt_years = {}, {}, {}
+    for _, course, section, s1, s2, q1, q2, q3, q4, gt_year in rows:
+        if section == "MS":
+            ms[course] = tuple(g for g in (s1, s2) if g is not None)
+        else:
+            # Keep each quarter in its slot (Q1/Q2 -> S1, Q3/Q4 -> S2), the
+            # same pairing roster_semesters uses; blanks are dropped per semester
+            quarters = [q1, q2, q3, q4]
+            while quarters and quarters[-1] is None:
+                quarters.pop()
+            hs[course] = quarters
+        if gt_year is not None:
+            gt_years[course] = int(gt_year)
+    return ms, hs, gt_years
+
+
+# =============================
+# WHOLE ROSTER (grades table)
+# =============================
+def roster_semesters(rows):
+    """
+    Flattens rows from the grades table into one entry per semester.
+
+    rows: iterable of (username, course, section, semester1, semester2,
+                       q1, q2, q3, q4, gt_year)
+
+    Returns (usernames, user_index, grades, weights): usernames is the sorted
+    list of students and user_index[i] says which student semester i belongs to.
+    """
+    rows = list(rows)
+    if not rows:
+        empty = np.array([], dtype=float)
+        return [], np.array([], dtype=np.intp), empty, empty
+
+    names = np.array([r[0] for r in rows], dtype=object)
+    sections = np.array([r[2] for r in rows], dtype=object)
+    weights = np.array([course_weight(r[1], r[9]) for r in rows], dtype=float)
+    # None -> NaN so missing semesters / quarters can be masked out
+    nums = np.array([r[3:9] for r in rows], dtype=float)
+
+    usernames, row_user = np.unique(names, return_inverse=True)
+
+    # --- Middle school: semester1 / semester2 straight through ---
+    ms = sections == "MS"
+    ms_grades = nums[ms, 0:2]
+
+    # --- High school: average each quarter pair, then round ---
+    hs = sections == "HS"
+    quarters = nums[hs, 2:6].reshape(-1, 2, 2)          # (rows, semester, quarter)
+    have = ~np.isnan(quarters)
+    counts = have.sum(axis=2)
+    totals = np.where(have, quarters, 0.0).sum(axis=2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hs_grades = np.where(counts > 0, np.round(totals / counts), np.nan)
+
+    grades = np.concatenate([ms_grades, hs_grades])
+    sem_weights = np.repeat(np.concatenate([weights[ms], weights[hs]]), 2)
+    sem_users = np.repeat(np.concatenate([row_user[ms], row_user[hs]]), 2)
+
+    grades = grades.ravel()
+    keep = ~np.isnan(grades)
+    return list(usernames), sem_users[keep], grades[keep], sem_weights[keep]
+
+
+def roster_gpas(rows):
+    """
+    Weighted / unweighted GPA for every student in one vectorized pass.
+
+    Returns a dict of parallel arrays:
+        username, semesters, weighted_points, unweighted_points, weighted, unweighted
+    """
+    usernames, user_index, grades, weights = roster_semesters(rows)
+    n_users = len(usernames)
+
+    w = weighted_gpa_batch(grades, weights)
+    uw = unweighted_gpa_batch(grades)
+
+    semesters, w_points, weighted = _average_by_student(w, user_index, n_users)
+    _, uw_points, unweighted = _average_by_student(uw, user_index, n_users)
+
+    return {
+        "username": usernames,
+        "semesters": semesters,
+        "weighted_points": w_points,
+        "unweighted_points": uw_points,
+        "weighted": weighted,
+        "unweighted": unweighted,
+    }
+
+
+# Column order roster_semesters / roster_gpas expect
+ROSTER_SELECT = """
+SELECT username, course, section, semester1, semester2, q1, q2, q3, q4, gt_year
+FROM grades
+"""
+
+
+def load_roster(conn):
+    """Pulls every row of the grades table and runs roster_gpas on it."""
+    return roster_gpas(conn.execute(ROSTER_SELECT))
+
+
+def _username_range(first_user=None, end_user=None):
+    """WHERE clause + params for first_user <= username < end_user (None = open)."""
+    where, params = [], []
+    if first_user is not None:
+        where.append("username >= ?")
+        params.append(first_user)
+    if end_user is not None:
+        where.append("username < ?")
+        params.append(end_user)
+    return (" WHERE " + " AND ".join(where) if where else ""), params
+
+
+def iter_grade_batches(conn, batch_rows=100_000, first_user=None, end_user=None):
+    """
+    Streams the grades table as lists of about batch_rows rows (ROSTER_SELECT
+    columns). Rows come in primary-key order and a student is never split
+    across two batches, so memory stays flat for any number of students.
+    first_user / end_user limit it to one slice of usernames (end excluded).
+    """
+    where, params = _username_range(first_user, end_user)
+    cursor = conn.execute(ROSTER_SELECT + where + " ORDER BY username, section, course", params)
+    batch = []
+    while True:
+        rows = cursor.fetchmany(batch_rows)
+        if not rows:
+            break
+        batch.extend(rows)
+
+        # Hold back the last student -- their other rows may be in the next fetch
+        last_user = batch[-1][0]
+        cut = len(batch)
+        while cut > 0 and batch[cut - 1][0] == last_user:
+            cut -= 1
+        if cut == 0:
+            continue
+
+        yield batch[:cut]
+        batch = batch[cut:]
+
+    if batch:
+        yield batch
+
+
+def iter_roster(conn, batch_rows=100_000, first_user=None, end_user=None):
+    """Like load_roster, but yields one roster_gpas dict per batch of students."""
+    for batch in iter_grade_batches(conn, batch_rows, first_user, end_user):
+        yield roster_gpas(batch)
+
+
+def shard_bounds(conn, shards):
+    """
+    Splits the students into about equal username ranges for parallel jobs.
+    Returns [(first_user, end_user), ...] for iter_roster / iter_grade_batches;
+    the first start and last end are None (open).
+    """
+    n_users = conn.execute("SELECT COUNT(DISTINCT username) FROM grades").fetchone()[0]
+    shards = max(1, min(shards, n_users))
+    starts = []
+    for i in range(1, shards):
+        row = conn.execute(
+            "SELECT DISTINCT username FROM grades ORDER BY username LIMIT 1 OFFSET ?",
+            (i * n_users // shards,),
+        ).fetchone()
+        if row and (not starts or row[0] > starts[-1]):
+            starts.append(row[0])
+    edges = [None] + starts + [None]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def load_user(conn, username):
+    """roster_gpas for one student (uses the grades primary key)."""
+    return roster_gpas(conn.execute(ROSTER_SELECT + " WHERE username = ?", (username,)))
+
+
+def load_student(conn, username):
+    """student_gpa for one student's saved grades."""
+    rows = conn.execute(
+        ROSTER_SELECT + " WHERE username = ? ORDER BY section, course", (username,)
+    ).fetchall()
+    return student_gpa(*course_grades(rows))
@@ -0,0 +1,165 @@
+"""
+End-of-term GPA / transcript export (CSV or Parquet).
+
+One row per semester per student: the same numbers and breakdown text the
+Results & Analytics tab shows, plus the student's final weighted / unweighted
+GPA on every row. Everything is a generator pipeline:
+
+    grades table (fetchmany, PK order) -> one student at a time
+        -> student_gpa -> transcript rows -> file
+
+so only one batch of grade rows and one Parquet row group are ever in memory,
+whatever the size of gpa_users_v2.db.
+
+Command line:
+
+    python gpa_export.py transcripts.csv [--format csv|parquet] [--db gpa_users_v2.db]
+"""
+import argparse
+import csv
+import itertools
+import sys
+import time
+
+from gpa_db import ConnectionPool
+from gpa_engine import course_grades, iter_grade_batches, student_gpa
+
+BATCH_ROWS = 50_000
+
+# Rows per Parquet row group (also how many transcript rows are buffered)
+ROW_GROUP_ROWS = 20_000
+
+EXPORT_COLUMNS = (
+    "username", "section", "course", "semester",
+    "q_first", "q_second", "raw_avg", "grade", "weight",
+    "weighted_gpa", "unweighted_gpa", "final_weighted", "final_unweighted",
+    "breakdown",
+)
+
+
+def iter_user_grades(conn, batch_rows=BATCH_ROWS):
+    """
+    Yields (username, ms_course_grades, hs_course_grades, gt_years) per student,
+    in the shapes semester_table takes from the MS / HS tabs.
+    """
+    for batch in iter_grade_batches(conn, batch_rows):
+        for username, rows in itertools.groupby(batch, key=lambda r: r[0]):
+            yield (username,) + course_grades(rows)
+
+
+def iter_transcript_rows(conn, batch_rows=BATCH_ROWS):
+    """Yields one dict (EXPORT_COLUMNS) per semester per student."""
+    for username, ms, hs, gt_years in iter_user_grades(conn, batch_rows):
+        result = student_gpa(ms, hs, gt_years)
+
+        for row, weight, w_gpa, uw_gpa, line in zip(
+            result["rows"], result["weights"], result["weighted"], result["unweighted"], result["breakdown"]
+        ):
+            quarters = row.get("quarters", [])
+            yield {
+                "username": username,
+                "section": row["section"],
+                "course": row["course"],
+                "semester": row["semester"],
+                "q_first": quarters[0] if quarters else None,
+                "q_second": quarters[1] if len(quarters) > 1 else None,
+                "raw_avg": row.get("raw_avg"),
+                "grade": float(row["grade"]),
+                "weight": float(weight),
+                "weighted_gpa": round(float(w_gpa), 3),
+                "unweighted_gpa": round(float(uw_gpa), 3),
+                "final_weighted": result["final_weighted"],
+                "final_unweighted": result["final_unweighted"],
+                "breakdown": line,
+            }
+
+
+def write_csv(rows, text_file):
+    """Streams transcript rows to an open text file. Returns the row count."""
+    writer = csv.DictWriter(text_file, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_parquet(rows, path, row_group_rows=ROW_GROUP_ROWS):
+    """Streams transcript rows to a Parquet file, one row group at a time."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow), or use --format csv")
+
+    schema = pa.schema([
+        ("username", pa.string()),
+        ("section", pa.string()),
+        ("course", pa.string()),
+        ("semester", pa.int8()),
+        ("q_first", pa.float64()),
+        ("q_second", pa.float64()),
+        ("raw_avg", pa.float64()),
+        ("grade", pa.float64()),
+        ("weight", pa.float64()),
+        ("weighted_gpa", pa.float64()),
+        ("unweighted_gpa", pa.float64()),
+        ("final_weighted", pa.float64()),
+        ("final_unweighted", pa.float64()),
+        ("breakdown", pa.string()),
+    ])
+
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        while True:
+            chunk = list(itertools.islice(rows, row_group_rows))
+            if not chunk:
+                break
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            count += len(chunk)
+    return count
+
+
+def export(read, path, fmt="csv", batch_rows=BATCH_ROWS):
+    """
+    Writes the whole transcript export to path.
+    read: ConnectionPool.read (or anything that lends a connection).
+    Returns (rows written, seconds).
+    """
+    start = time.perf_counter()
+    with read() as conn:
+        rows = iter_transcript_rows(conn, batch_rows)
+        if fmt == "parquet":
+            count = write_parquet(rows, path)
+        else:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                count = write_csv(rows, f)
+    return count, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every student's GPA breakdown for the district report.")
+    parser.add_argument("out_path", help="file to write")
+    parser.add_argument("--format", choices=("csv", "parquet"), default=None,
+                        help="default: from the file extension (.parquet -> parquet, else csv)")
+    parser.add_argument("--db", default="gpa_users_v2.db", help="SQLite database (default: gpa_users_v2.db)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("parquet" if args.out_path.endswith(".parquet") else "csv")
+
+    pool = ConnectionPool(args.db)
+    try:
+        count, seconds = export(pool.read, args.out_path, fmt)
+    except RuntimeError as err:
+        print(err, file=sys.stderr)
+        return 1
+    finally:
+        pool.close()
+
+    print(f"Wrote {count:,} semester rows to {args.out_path} in {seconds:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+School-wide GPA rank / percentile.
+
+GpaRankIndex keeps a count of students per GPA value (rounded to 0.001, the
+same precision the app shows) in a Fenwick tree. Adding, moving or removing a
+student and asking "how many students are above / below this GPA" are all
+O(log 6001) -- no student's GPA is recomputed to answer a query.
+
+It is built once from gpa_totals and then kept current by GradeWriter (every
+save calls update()). Saves made by *other* server processes are picked up by
+rebuilding from gpa_totals when the snapshot is older than max_age seconds --
+on a background thread, so no rerun waits for the table scan.
+"""
+import logging
+import threading
+import time
+
+# GPA is stored as an integer number of thousandths: 0 .. 6000
+SCALE = 1000
+MAX_GPA = 6.0
+N_BUCKETS = int(MAX_GPA * SCALE) + 1
+# After a failed background rebuild, wait this long before trying again
+RETRY_SECONDS = 60
+
+log = logging.getLogger(__name__)
+
+
+def _bucket(gpa):
+    return min(max(int(round(gpa * SCALE)), 0), N_BUCKETS - 1)
+
+
+class _Fenwick:
+    """Counts per bucket with O(log n) point updates and prefix sums."""
+
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    @classmethod
+    def from_counts(cls, counts):
+        """Builds the tree from per-bucket counts in O(n)."""
+        fenwick = cls(len(counts))
+        tree = fenwick.tree
+        for i, count in enumerate(counts, start=1):
+            tree[i] += count
+            parent = i + (i & -i)
+            if parent <= fenwick.size:
+                tree[parent] += tree[i]
+        return fenwick
+
+    def add(self, index, delta):
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def count_upto(self, index):
+        """Number of items in buckets 0..index."""
+        total = 0
+        i = min(index, self.size - 1) + 1
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+
+class GpaRankIndex:
+    def __init__(self, load, max_age=600):
+        # load() -> iterable of (username, weighted_gpa) for every student
+        self.load = load
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        # {username: gpa} of updates made while a rebuild is reading, else None
+        self._replay = None
+        self._rebuilding = False
+        self._failing = False
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        Reload every student from load() (after bulk changes like an import).
+        update()s that land while load() runs are replayed onto the new
+        snapshot before it's swapped in, so none get lost.
+        """
+        with self._lock:
+            self._replay = {}
+        try:
+            buckets = {username: _bucket(gpa) for username, gpa in self.load()}
+            counts = [0] * N_BUCKETS
+            for b in buckets.values():
+                counts[b] += 1
+            tree = _Fenwick.from_counts(counts)
+            with self._lock:
+                for username, gpa in self._replay.items():
+                    self._move(buckets, tree, username, gpa)
+                self._tree = tree
+                self._buckets = buckets
+                self._built_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._replay = None
+
+    def _background_rebuild(self):
+        try:
+            self.rebuild()
+        except Exception:
+            # Keep the old snapshot and back off, so a broken database doesn't
+            # start a thread per query; only the first failure in a row is logged
+            if not self._failing:
+                log.exception("GPA rank rebuild failed; retrying every %ss", RETRY_SECONDS)
+            self._failing = True
+            with self._lock:
+                self._built_at = time.monotonic() - self.max_age + RETRY_SECONDS
+        else:
+            self._failing = False
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def rebuild_in_background(self):
+        """Starts a rebuild on its own thread (unless one is already running)."""
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        threading.Thread(target=self._background_rebuild, name="gpa-rank-rebuild", daemon=True).start()
+
+    def _fresh(self):
+        # Queries keep using the current snapshot while a stale one is rebuilt
+        if time.monotonic() - self._built_at > self.max_age:
+            self.rebuild_in_background()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    # ---------- updates ----------
+    @staticmethod
+    def _move(buckets, tree, username, gpa):
+        old = buckets.pop(username, None)
+        if old is not None:
+            tree.add(old, -1)
+        if gpa is not None:
+            new = _bucket(gpa)
+            buckets[username] = new
+            tree.add(new, 1)
+
+    def update(self, username, gpa):
+        """Move a student to a new GPA (None removes them)."""
+        with self._lock:
+            self._move(self._buckets, self._tree, username, gpa)
+            if self._replay is not None:
+                self._replay[username] = gpa
+
+    def update_many(self, changes):
+        for username, gpa in changes.items():
+            self.update(username, gpa)
+
+    # ---------- queries ----------
+    def rank(self, gpa):
+        """1 + number of students with a strictly higher GPA."""
+        self._fresh()
+        with self._lock:
+            return len(self._buckets) - self._tree.count_upto(_bucket(gpa)) + 1
+
+    def percentile(self, gpa):
+        """
+        Percentile rank (0-100): % of students below this GPA, counting
+        students tied with it as half below / half above.
+        """
+        self._fresh()
+        b = _bucket(gpa)
+        with self._lock:
+            n = len(self._buckets)
+            if n == 0:
+                return None
+            below = self._tree.count_upto(b - 1) if b > 0 else 0
+            tied = self._tree.count_upto(b) - below
+        return 100.0 * (below + 0.5 * tied) / n
+
+    def student(self, username):
+        """(rank, percentile, students) for a saved student, or None."""
+        self._fresh()
+        with self._lock:
+            b = self._buckets.get(username)
+        if b is None:
+            return None
+        gpa = b / SCALE
+        return self.rank(gpa), self.percentile(gpa), len(self)
+
+
+def load_gpas(db):
+    """(username, weighted GPA) for every student with saved grades."""
+    return db.execute(
+        """
+        SELECT username, weighted_points / semesters
+        FROM gpa_totals
+        WHERE semesters > 0
+        """
+    ).fetchall()
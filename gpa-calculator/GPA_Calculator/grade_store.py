@@ -0,0 +1,227 @@
+"""
+Write-behind saving for the MS / HS grade tabs.
+
+Streamlit reruns the whole script on every click, and the tabs used to
+INSERT OR REPLACE every selected course + commit each time. GradeWriter
+remembers what is already in the grades table, only queues rows whose
+values actually changed, and writes them together in one transaction once
+the student stops typing for DEBOUNCE_SECONDS.
+"""
+import logging
+import threading
+
+from gpa_db import GRADE_COLUMNS
+from gpa_engine import ROSTER_SELECT, roster_gpas
+
+log = logging.getLogger(__name__)
+
+# Quiet time (seconds) after the last edit before queued rows are written
+DEBOUNCE_SECONDS = 1.5
+# A timer flush that failed is tried again after this long
+RETRY_SECONDS = 10
+
+# Students per grades query in refresh_gpa_totals
+REFRESH_BATCH = 500
+
+UPSERT_GRADE = f"""
+INSERT OR REPLACE INTO grades ({GRADE_COLUMNS})
+VALUES (?,?,?,?,?,?,?,?,?,?)
+"""
+
+
+def _num(value):
+    return None if value is None else float(value)
+
+
+def ms_row(username, course, s1, s2=None, gt_year=None):
+    """Grades-table row for a middle school course (no quarters)."""
+    return (
+        username, "MS", course,
+        _num(s1), _num(s2),
+        None, None, None, None,
+        None if gt_year is None else str(gt_year),
+    )
+
+
+def hs_row(username, course, q_grades, gt_year=None):
+    """Grades-table row for a high school course (pads to 4 quarters)."""
+    padded = list(q_grades) + [None] * (4 - len(q_grades))
+    return (
+        username, "HS", course,
+        None, None,
+        *(_num(q) for q in padded[:4]),
+        None if gt_year is None else str(gt_year),
+    )
+
+
+def refresh_gpa_totals(db, usernames):
+    """
+    Recomputes gpa_totals for these students from their grade rows.
+    Runs inside the same transaction as the grade write, so the totals
+    can never disagree with the grades table. Students are read
+    REFRESH_BATCH at a time and run through the batch engine together, so
+    an import chunk's worth of students costs a few queries, not one each.
+
+    Returns {username: new weighted GPA} (None if they have no semesters).
+    """
+    changes = {}
+    usernames = sorted(set(usernames))
+    for i in range(0, len(usernames), REFRESH_BATCH):
+        batch = usernames[i: i + REFRESH_BATCH]
+        marks = ",".join("?" * len(batch))
+        # Same row order as load_user / iter_roster, so the sums come out bit-for-bit equal
+        totals = roster_gpas(db.execute(
+            ROSTER_SELECT + f" WHERE username IN ({marks}) ORDER BY username, section, course",
+            batch,
+        ))
+        rows = []
+        for username, semesters, w_points, uw_points in zip(
+            totals["username"], totals["semesters"].tolist(),
+            totals["weighted_points"].tolist(), totals["unweighted_points"].tolist(),
+        ):
+            if semesters:
+                rows.append((username, semesters, w_points, uw_points))
+                changes[username] = w_points / semesters
+        db.executemany("INSERT OR REPLACE INTO gpa_totals VALUES (?, ?, ?, ?)", rows)
+
+        gone = [username for username in batch if username not in changes]
+        db.executemany("DELETE FROM gpa_totals WHERE username = ?", [(u,) for u in gone])
+        changes.update(dict.fromkeys(gone))
+    return changes
+
+
+def read_gpa_totals(db, username):
+    """(semesters, weighted_points, unweighted_points) or None if nothing is saved."""
+    return db.execute(
+        "SELECT semesters, weighted_points, unweighted_points FROM gpa_totals WHERE username = ?",
+        (username,),
+    ).fetchone()
+
+
+# Bumped after every bulk import in this process (note_import). A GradeWriter
+# that sees it change forgets what it thought was saved: the import may have
+# replaced those rows, and an edit back to the old value must still be written.
+_import_generation = 0
+_import_lock = threading.Lock()
+
+
+def note_import():
+    global _import_generation
+    with _import_lock:
+        _import_generation += 1
+
+
+def _key(row):
+    # (username, section, course) -- same as the table's primary key
+    return row[0], row[1], row[2]
+
+
+class GradeWriter:
+    """
+    One per Streamlit session.
+
+    saved    -> rows we know are in the database
+    inflight -> rows a flush is writing right now
+    pending  -> changed rows waiting to be written
+
+    A row is compared with the newest of those three, so an edit back to the
+    old value while a flush is writing the new one is still queued.
+    """
+
+    def __init__(self, write, delay=DEBOUNCE_SECONDS, on_saved=None):
+        # write() is a ConnectionPool.write-style context manager: it lends a
+        # connection and commits when the block ends (flushes can run on a timer thread)
+        self.write = write
+        # on_saved({username: new weighted GPA}) runs after each successful flush
+        self.on_saved = on_saved
+        self.delay = delay
+        self.saved = {}
+        self.inflight = {}
+        self.pending = {}
+        self._lock = threading.Lock()
+        # One flush at a time, so an older batch can never commit over a newer one
+        self._flush_lock = threading.Lock()
+        self._timer = None
+        self._import_generation = _import_generation
+
+    def _forget_if_imported(self):
+        # (caller holds self._lock)
+        if self._import_generation != _import_generation:
+            self._import_generation = _import_generation
+            self.saved.clear()
+
+    def remember(self, rows):
+        """Record rows just loaded from the DB (unless we have newer unsaved ones)."""
+        with self._lock:
+            self._forget_if_imported()
+            for row in rows:
+                key = _key(row)
+                if key not in self.pending and key not in self.inflight:
+                    self.saved[key] = row
+
+    def stage(self, row):
+        """Queue a row if it differs from what's saved. Returns True if it was queued."""
+        key = _key(row)
+        with self._lock:
+            self._forget_if_imported()
+            newest = self.pending.get(key) or self.inflight.get(key) or self.saved.get(key)
+            if newest == row:
+                return False
+            self.pending[key] = row
+            self._restart_timer()
+        return True
+
+    def _restart_timer(self, delay=None):
+        # Each new edit pushes the write back, so a burst of typing = one transaction
+        # (caller holds self._lock)
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.delay if delay is None else delay, self._timed_flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _timed_flush(self):
+        # Nobody is waiting on a timer thread, so a failure is logged and retried here
+        try:
+            self.flush()
+        except Exception:
+            log.exception("Saving grades failed; retrying in %ss", RETRY_SECONDS)
+            with self._lock:
+                if self.pending and self._timer is None:
+                    self._restart_timer(RETRY_SECONDS)
+
+    def flush(self):
+        """Write every pending row in one transaction. Returns how many were written."""
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                rows = list(self.pending.values())
+                self.pending.clear()
+                self.inflight = {_key(row): row for row in rows}
+
+            if not rows:
+                return 0
+
+            try:
+                with self.write() as db:
+                    db.executemany(UPSERT_GRADE, rows)
+                    changes = refresh_gpa_totals(db, {row[0] for row in rows})
+            except Exception:
+                # Put them back (unless newer edits came in) so the next flush retries
+                with self._lock:
+                    for row in rows:
+                        self.pending.setdefault(_key(row), row)
+                    self.inflight = {}
+                raise
+
+            with self._lock:
+                for row in rows:
+                    self.saved[_key(row)] = row
+                self.inflight = {}
+
+            # Still under the flush lock, so the rank index sees saves in commit order
+            if self.on_saved is not None:
+                self.on_saved(changes)
+        return len(rows)
@@ -0,0 +1,55 @@
+"""
+Idea Vault ideas, saved in the ideas table.
+
+The Recent Ideas list asks for one filtered, sorted page at a time, so
+only the cards on screen are ever loaded or drawn.
+"""
+
+IDEA_COLUMNS = "id, title, details, tag, importance"
+
+IDEA_TAGS = ["School", "Project", "Life", "Random"]
+
+# Sort choice -> ORDER BY (fixed strings, never user text)
+IDEA_SORTS = {
+    "Newest": "id DESC",
+    "Oldest": "id",
+    "Most important": "importance DESC, id DESC",
+}
+
+
+def add_idea(db, username, title, details, tag, importance):
+    cur = db.execute(
+        "INSERT INTO ideas (username, title, details, tag, importance) VALUES (?, ?, ?, ?, ?)",
+        (username, title, details, tag, int(importance)),
+    )
+    return cur.lastrowid
+
+
+def _idea_filter(username, tag=None):
+    if tag is None:
+        return "username = ?", [username]
+    return "username = ? AND tag = ?", [username, tag]
+
+
+def count_ideas(db, username, tag=None):
+    where, params = _idea_filter(username, tag)
+    return db.execute(f"SELECT COUNT(*) FROM ideas WHERE {where}", params).fetchone()[0]
+
+
+def idea_page(db, username, tag=None, sort="Newest", limit=5, offset=0):
+    """One page of ideas as dicts: id, title, desc, tag, importance."""
+    where, params = _idea_filter(username, tag)
+    rows = db.execute(
+        f"""
+        SELECT {IDEA_COLUMNS}
+        FROM ideas
+        WHERE {where}
+        ORDER BY {IDEA_SORTS[sort]}
+        LIMIT ? OFFSET ?
+        """,
+        params + [limit, offset],
+    )
+    return [
+        {"id": idea_id, "title": title, "desc": details, "tag": tag, "importance": importance}
+        for idea_id, title, details, tag, importance in rows
+    ]
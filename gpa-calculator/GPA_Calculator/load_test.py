@@ -0,0 +1,310 @@
+"""
+Load test: N simulated students using the app at once.
+
+    python load_test.py [--sessions 1 2 4 8 16] [--journeys 1] [--think-ms 0]
+                        [--p95-budget-ms 1000] [--all-cores]
+                        [--workdir DIR] [--out load.json]
+
+Each simulated session drives gpa_streamlit.py through Streamlit's AppTest
+and walks the same journey:
+
+    create a profile (users table) -> School Tools -> enter MS + HS grades
+    -> Calculate GPA -> take a quiz and submit it -> Daily & Planning
+    -> add a few planner tasks
+
+For every concurrency level it reports rerun latency (p50 / p95 / p99 over
+every at.run() call), reruns per second, and how long write() blocks waited
+for the SQLite write lock (ConnectionPool.lock_stats). The last level whose
+p95 stays under --p95-budget-ms (with no errors), with every lower level
+passing too, is the ceiling.
+
+AppTest swaps process-wide Streamlit state (the Runtime singleton, config)
+around every run, so two AppTests can't run at the same time in one process.
+Each session therefore gets its own process; they all use one database
+file, so the SQLite locking is the real thing. A `streamlit run` server
+runs Python on about one core (the GIL), so by default every session
+process is pinned to the same core (Linux) and the numbers approximate what
+one server process can take. --all-cores lifts that.
+
+--think-ms adds a random 0..think-ms pause between clicks, closer to real
+students than everyone clicking flat out. The database is a fresh file in
+--workdir (default: a temp dir), never your real gpa_users_v2.db.
+"""
+import argparse
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from datetime import datetime
+
+import numpy as np
+
+from app_shared import DB_PATH
+from gpa_db import ConnectionPool, migrate
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gpa_streamlit.py")
+
+MS_COURSES = ["Algebra 1", "Spanish 1", "Biology", "Health"]
+HS_COURSES = ["Geometry", "Chemistry", "AP Human Geography"]
+PLANNER_TASKS = 3
+# AppTest's own timeout for one rerun (a stuck session fails instead of hanging)
+RERUN_TIMEOUT_S = 120
+# How long session processes get to start up and import the app
+BARRIER_TIMEOUT_S = 300
+
+
+class Session:
+    """One simulated student: an AppTest plus the latency of every rerun it did."""
+
+    def __init__(self, name, think_ms, rng):
+        from streamlit.testing.v1 import AppTest
+
+        self.name = name
+        self.think_ms = think_ms
+        self.rng = rng
+        self.latencies = []
+        self.at = AppTest.from_file(APP_PATH, default_timeout=RERUN_TIMEOUT_S)
+
+    def run(self):
+        if self.think_ms:
+            time.sleep(self.rng.uniform(0, self.think_ms) / 1000)
+        start = time.perf_counter()
+        self.at.run()
+        self.latencies.append(time.perf_counter() - start)
+        if self.at.exception:
+            raise RuntimeError(f"{self.name}: {self.at.exception[0].message}")
+
+    def button(self, label):
+        for b in self.at.button:
+            if b.label == label:
+                return b
+        raise LookupError(f"{self.name}: no button {label!r}")
+
+    # ---------- the journey ----------
+    def journey(self, round_no):
+        at = self.at
+        self.run()
+
+        at.radio(key="login_mode").set_value("Create new profile")
+        at.text_input(key="login_username").set_value(f"{self.name}_{round_no}")
+        at.text_input(key="login_pin").set_value("1234")
+        at.button(key="login_continue").click()
+        self.run()
+
+        at.selectbox(key="section_choice").set_value("📚 School Tools")
+        self.run()
+        at.multiselect(key="ms_courses").set_value(MS_COURSES)
+        self.run()
+        at.multiselect(key="hs_courses").set_value(HS_COURSES)
+        self.run()
+        for course in MS_COURSES:
+            at.number_input(key=f"ms_s1_{course}").set_value(self.rng.randint(70, 100))
+            self.run()
+        for course in HS_COURSES:
+            at.number_input(key=f"hs_q1_{course}").set_value(self.rng.randint(70, 100))
+            self.run()
+        self.button("🎯 Calculate GPA").click()
+        self.run()
+
+        math_course = [s for s in at.selectbox if s.label == "Select your Math course:"][0]
+        math_course.set_value("AP Precalculus")
+        self.run()
+        at.button(key="show_questions_button").click()
+        self.run()
+        self.button("Submit Answers").click()
+        self.run()
+
+        at.selectbox(key="section_choice").set_value("🧠 Daily & Planning")
+        self.run()
+        for k in range(PLANNER_TASKS):
+            at.text_input(key="org_task_title").set_value(f"Homework {k}")
+            at.button(key="org_add_button").click()
+            self.run()
+
+
+def session_worker(i, n_sessions, journeys, think_ms, seed, run_id, workdir, cpu,
+                   barrier, results):
+    """One session process: warm up, wait for the others, run the journeys, report."""
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    # The app opens gpa_users_v2.db relative to the working directory
+    os.chdir(workdir)
+    from app_shared import get_db_pool
+    from grade_store import DEBOUNCE_SECONDS
+    from sections import SECTION_MODULES
+
+    rng = random.Random(seed * 1000 + i)
+    name = f"load{run_id}_{n_sessions}x_{i}"
+    latencies, errors = [], []
+    # Warm-up runs outside any script run; Streamlit warns about that on every call
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+    pool = get_db_pool()
+    elapsed_s = 0.0
+    try:
+        # Import every section first, like a server that's already been running
+        # a while, so the timed reruns aren't paying one-time import costs
+        for module in SECTION_MODULES.values():
+            importlib.import_module(module)
+        barrier.wait(timeout=BARRIER_TIMEOUT_S)
+        start = time.perf_counter()
+        for round_no in range(journeys):
+            session = Session(name, think_ms, rng)
+            try:
+                session.journey(round_no)
+            finally:
+                latencies.extend(session.latencies)
+                elapsed_s = time.perf_counter() - start
+    except Exception as err:
+        errors.append("".join(traceback.format_exception_only(type(err), err)).strip())
+        barrier.abort()
+    # Let the debounced grade writes land so their lock waits count too
+    time.sleep(DEBOUNCE_SECONDS + 0.5)
+    results.put({
+        "latencies": latencies, "errors": errors,
+        "elapsed_s": elapsed_s, "lock_stats": pool.lock_stats(),
+    })
+
+
+def run_level(n_sessions, journeys, think_ms, seed, run_id, workdir, cpu):
+    """Runs n_sessions session processes at once; returns their combined results."""
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(n_sessions + 1)
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(
+            target=session_worker,
+            args=(i, n_sessions, journeys, think_ms, seed, run_id, workdir, cpu, barrier, results),
+            daemon=True,
+        )
+        for i in range(n_sessions)
+    ]
+    for p in procs:
+        p.start()
+    # Everyone's warmed up -> go (a session that failed to start breaks the barrier)
+    try:
+        barrier.wait(timeout=BARRIER_TIMEOUT_S)
+    except threading.BrokenBarrierError:
+        pass
+    reports = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+
+    latencies = [t for r in reports for t in r["latencies"]]
+    errors = [e for r in reports for e in r["errors"]]
+    # From "go" until the slowest session finished its last rerun
+    wall_s = max(r["elapsed_s"] for r in reports)
+    lock_stats = {
+        "writes": sum(r["lock_stats"]["writes"] for r in reports),
+        "wait_total_s": sum(r["lock_stats"]["wait_total_s"] for r in reports),
+        "wait_max_s": max(r["lock_stats"]["wait_max_s"] for r in reports),
+    }
+    return latencies, errors, wall_s, lock_stats
+
+
+def summarize(n_sessions, latencies, errors, wall_s, lock_stats):
+    ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99]) if ms.size else (np.nan,) * 3
+    return {
+        "sessions": n_sessions,
+        "reruns": int(ms.size),
+        "errors": len(errors),
+        "error_samples": errors[:3],
+        "wall_s": round(wall_s, 3),
+        "reruns_per_s": round(ms.size / wall_s, 2) if wall_s else None,
+        "p50_ms": round(float(p50), 1),
+        "p95_ms": round(float(p95), 1),
+        "p99_ms": round(float(p99), 1),
+        "max_ms": round(float(ms.max()), 1) if ms.size else None,
+        "writes": lock_stats["writes"],
+        "lock_wait_total_ms": round(lock_stats["wait_total_s"] * 1000, 2),
+        "lock_wait_max_ms": round(lock_stats["wait_max_s"] * 1000, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="concurrency levels to try, in order")
+    parser.add_argument("--journeys", type=int, default=1, help="journeys per session")
+    parser.add_argument("--think-ms", type=float, default=0, help="max random pause between clicks")
+    parser.add_argument("--p95-budget-ms", type=float, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--all-cores", action="store_true",
+                        help="don't pin every session process to one core")
+    parser.add_argument("--workdir", help="where the test database goes (default: a temp dir)")
+    parser.add_argument("--out", help="also write the results as JSON here")
+    args = parser.parse_args(argv)
+
+    out_path = os.path.abspath(args.out) if args.out else None
+    workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix="edusphere_load_"))
+    os.makedirs(workdir, exist_ok=True)
+    db_path = os.path.join(workdir, DB_PATH)
+    # Create + migrate the database once, before any session starts
+    pool = ConnectionPool(db_path)
+    with pool.write() as db:
+        migrate(db)
+    pool.close()
+
+    cpu = None
+    if not args.all_cores and hasattr(os, "sched_getaffinity"):
+        cpu = min(os.sched_getaffinity(0))
+
+    run_id = datetime.now().strftime("%H%M%S")
+    print(f"database: {db_path}")
+    print(f"sessions pinned to: {'all cores' if cpu is None else f'cpu {cpu}'}")
+    print(f"{'sessions':>8s} {'reruns':>7s} {'rerun/s':>8s} {'p50 ms':>8s} {'p95 ms':>8s} "
+          f"{'p99 ms':>8s} {'writes':>7s} {'lock wait ms (total/max)':>25s} {'errors':>6s}")
+
+    levels = []
+    for n in args.sessions:
+        latencies, errors, wall_s, lock_stats = run_level(
+            n, args.journeys, args.think_ms, args.seed, run_id, workdir, cpu
+        )
+        level = summarize(n, latencies, errors, wall_s, lock_stats)
+        levels.append(level)
+        print(f"{n:8d} {level['reruns']:7d} {level['reruns_per_s']:8.1f} {level['p50_ms']:8.1f} "
+              f"{level['p95_ms']:8.1f} {level['p99_ms']:8.1f} {level['writes']:7d} "
+              f"{level['lock_wait_total_ms']:13.1f} / {level['lock_wait_max_ms']:9.1f} "
+              f"{level['errors']:6d}")
+        for message in level["error_samples"]:
+            print(f"         ! {message}")
+
+    # The ceiling is the last level before the first one that failed: a
+    # level that happens to pass above a failing one isn't sustainable
+    ceiling = None
+    for lv in sorted(levels, key=lambda lv: lv["sessions"]):
+        if lv["errors"] or lv["p95_ms"] > args.p95_budget_ms:
+            break
+        ceiling = lv["sessions"]
+    if ceiling is None:
+        print(f"the lowest level didn't keep p95 under {args.p95_budget_ms:.0f} ms with no errors")
+    else:
+        print(f"per-process ceiling: {ceiling} concurrent sessions "
+              f"(every level up to it kept p95 <= {args.p95_budget_ms:.0f} ms with no errors)")
+
+    if out_path:
+        report = {
+            "ran_at": datetime.now().isoformat(timespec="seconds"),
+            "journeys": args.journeys,
+            "think_ms": args.think_ms,
+            "p95_budget_ms": args.p95_budget_ms,
+            "pinned_cpu": cpu,
+            "cpus": os.cpu_count(),
+            "levels": levels,
+            "ceiling_sessions": ceiling,
+        }
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"results written to {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
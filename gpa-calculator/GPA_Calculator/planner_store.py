@@ -0,0 +1,307 @@
+"""
+Organization Helper tasks, saved in the planner_tasks table.
+
+Tasks are indexed on (username, date), so a day, week or month view is one
+range scan over just that student's rows in that range -- a student with a
+year of assignments gets their Tuesday as fast as one with five tasks.
+
+A task comes back as a dict: id, date (datetime.date), course, title, type,
+priority, est (minutes).
+
+Repeating tasks ("Spanish homework every school day") are one row in
+planner_rules, never a row per day. occurrences() walks a rule's dates
+lazily for just the range a view asks for, starting at the first date in
+range without stepping through the ones before it.
+"""
+import heapq
+from datetime import date, timedelta
+
+TASK_COLUMNS = "id, date, course, title, type, priority, est"
+
+TASK_TYPES = ["Homework", "Test", "Quiz", "Project", "Reminder"]
+PRIORITIES = ["Low", "Medium", "High"]
+
+
+def _task(row):
+    task_id, day, course, title, task_type, priority, est = row
+    return {
+        "id": task_id,
+        "date": date.fromisoformat(day),
+        "course": course,
+        "title": title,
+        "type": task_type,
+        "priority": priority,
+        "est": est,
+    }
+
+
+def add_task(db, username, day, course, title, task_type, priority, est):
+    """Saves one task; returns its id."""
+    cur = db.execute(
+        """
+        INSERT INTO planner_tasks (username, date, course, title, type, priority, est)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (username, day.isoformat(), course, title, task_type, priority, int(est)),
+    )
+    return cur.lastrowid
+
+
+def tasks_between(db, username, start, end):
+    """Tasks with start <= date < end, by date, then in the order they were added."""
+    rows = db.execute(
+        f"""
+        SELECT {TASK_COLUMNS}
+        FROM planner_tasks
+        WHERE username = ? AND date >= ? AND date < ?
+        ORDER BY date, id
+        """,
+        (username, start.isoformat(), end.isoformat()),
+    )
+    return [_task(row) for row in rows]
+
+
+def upcoming_tasks(db, username, start):
+    """Every task dated start or later."""
+    return tasks_between(db, username, start, date.max)
+
+
+def tasks_for_everyone(db, start, end):
+    """(username, task) for every student's tasks with start <= date < end."""
+    rows = db.execute(
+        f"""
+        SELECT username, {TASK_COLUMNS}
+        FROM planner_tasks
+        WHERE date >= ? AND date < ?
+        """,
+        (start.isoformat(), end.isoformat()),
+    )
+    return [(row[0], _task(row[1:])) for row in rows]
+
+
+def tasks_on(db, username, day):
+    return tasks_between(db, username, day, day + timedelta(days=1))
+
+
+def all_tasks(db, username):
+    rows = db.execute(
+        f"SELECT {TASK_COLUMNS} FROM planner_tasks WHERE username = ? ORDER BY date, id",
+        (username,),
+    )
+    return [_task(row) for row in rows]
+
+
+# =============================
+# VIEW RANGES
+# =============================
+def week_range(day):
+    """(Monday, next Monday) around day."""
+    start = day - timedelta(days=day.weekday())
+    return start, start + timedelta(days=7)
+
+
+def month_range(day):
+    """(1st of the month, 1st of next month) around day."""
+    start = day.replace(day=1)
+    return start, (start + timedelta(days=32)).replace(day=1)
+
+
+VIEW_RANGES = {
+    "Day": lambda day: (day, day + timedelta(days=1)),
+    "Week": week_range,
+    "Month": month_range,
+}
+
+
+# =============================
+# "ALL PLANNED TASKS" (filtered, sorted, one page at a time)
+# =============================
+PRIORITY_ORDER = "CASE priority WHEN 'High' THEN 0 WHEN 'Medium' THEN 1 ELSE 2 END"
+
+# Sort choice -> ORDER BY (fixed strings, never user text)
+TASK_SORTS = {
+    "Date": "date, id",
+    "Priority": f"{PRIORITY_ORDER}, date, id",
+    "Course": "course, date, id",
+    "Type": "type, date, id",
+}
+
+
+def _task_filters(username, course=None, task_type=None, priority=None, start=None, end=None):
+    """WHERE clause + params for the filters that are set (None = any)."""
+    where = ["username = ?"]
+    params = [username]
+    for column, value in (("course", course), ("type", task_type), ("priority", priority)):
+        if value is not None:
+            where.append(f"{column} = ?")
+            params.append(value)
+    if start is not None:
+        where.append("date >= ?")
+        params.append(start.isoformat())
+    if end is not None:
+        where.append("date < ?")
+        params.append(end.isoformat())
+    return " AND ".join(where), params
+
+
+def count_tasks(db, username, **filters):
+    where, params = _task_filters(username, **filters)
+    return db.execute(f"SELECT COUNT(*) FROM planner_tasks WHERE {where}", params).fetchone()[0]
+
+
+def task_page(db, username, sort="Date", limit=25, offset=0, **filters):
+    """
+    One page of a student's tasks. filters: course, task_type, priority,
+    start / end (dates, like tasks_between). Only the rows on the page are
+    read and turned into dicts.
+    """
+    where, params = _task_filters(username, **filters)
+    rows = db.execute(
+        f"""
+        SELECT {TASK_COLUMNS}
+        FROM planner_tasks
+        WHERE {where}
+        ORDER BY {TASK_SORTS[sort]}
+        LIMIT ? OFFSET ?
+        """,
+        params + [limit, offset],
+    )
+    return [_task(row) for row in rows]
+
+
+# =============================
+# REPEATING TASKS
+# =============================
+RULE_COLUMNS = "id, start, until, repeat, every, course, title, type, priority, est"
+
+# What the "Repeats" choice stores in planner_rules.repeat
+REPEATS = {
+    "Every day": "daily",
+    "Every school day (Mon-Fri)": "weekdays",
+    "Every week": "weekly",
+    "Every N days": "every_n",
+}
+REPEAT_STEP_DAYS = {"daily": 1, "weekly": 7}
+
+
+def _rule(row):
+    rule_id, start, until, repeat, every, course, title, task_type, priority, est = row
+    return {
+        "id": rule_id,
+        "start": date.fromisoformat(start),
+        "until": date.fromisoformat(until) if until else None,
+        "repeat": repeat,
+        "every": every,
+        "course": course,
+        "title": title,
+        "type": task_type,
+        "priority": priority,
+        "est": est,
+    }
+
+
+def add_rule(db, username, start, repeat, course, title, task_type, priority, est,
+             every=1, until=None):
+    """Saves one repeating task (repeat: a REPEATS value; until is inclusive). Returns its id."""
+    cur = db.execute(
+        """
+        INSERT INTO planner_rules
+            (username, start, until, repeat, every, course, title, type, priority, est)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            username, start.isoformat(), until.isoformat() if until else None,
+            repeat, int(every), course, title, task_type, priority, int(est),
+        ),
+    )
+    return cur.lastrowid
+
+
+def rules_between(db, username, start, end):
+    """A student's rules that can have a date in start <= date < end."""
+    rows = db.execute(
+        f"""
+        SELECT {RULE_COLUMNS}
+        FROM planner_rules
+        WHERE username = ? AND start < ? AND (until IS NULL OR until >= ?)
+        ORDER BY id
+        """,
+        (username, end.isoformat(), start.isoformat()),
+    )
+    return [_rule(row) for row in rows]
+
+
+def all_rules(db, username):
+    rows = db.execute(
+        f"SELECT {RULE_COLUMNS} FROM planner_rules WHERE username = ? ORDER BY start, id",
+        (username,),
+    )
+    return [_rule(row) for row in rows]
+
+
+def occurrences(rule, start, end):
+    """Yields the rule's dates with start <= date < end, one at a time."""
+    day = max(start, rule["start"])
+    if rule["until"] is not None:
+        end = min(end, rule["until"] + timedelta(days=1))
+
+    if rule["repeat"] == "weekdays":
+        while day < end:
+            if day.weekday() < 5:
+                yield day
+                day += timedelta(days=1)
+            else:
+                day += timedelta(days=7 - day.weekday())  # -> Monday
+        return
+
+    step = REPEAT_STEP_DAYS.get(rule["repeat"], rule["every"])
+    # Jump straight to the first date on the rule's step at or after day
+    behind = (day - rule["start"]).days % step
+    if behind:
+        day += timedelta(days=step - behind)
+    while day < end:
+        yield day
+        day += timedelta(days=step)
+
+
+def occurrence_id(rule_id, day):
+    """Task id for one date of a rule: negative, so it never clashes with a planner_tasks id."""
+    return -(rule_id << 20 | day.toordinal())
+
+
+def rule_tasks(rule, start, end):
+    """The rule's dates in range as task dicts (rule_id says where they came from)."""
+    for day in occurrences(rule, start, end):
+        yield {
+            "id": occurrence_id(rule["id"], day),
+            "date": day,
+            "course": rule["course"],
+            "title": rule["title"],
+            "type": rule["type"],
+            "priority": rule["priority"],
+            "est": rule["est"],
+            "rule_id": rule["id"],
+        }
+
+
+def describe_rule(rule):
+    """"Every school day (Mon-Fri) from Mar 02 until Jun 05" and the like."""
+    if rule["repeat"] == "every_n":
+        how = f"Every {rule['every']} days"
+    elif rule["repeat"] == "weekly":
+        how = f"Every {rule['start']:%A}"
+    else:
+        how = next(label for label, code in REPEATS.items() if code == rule["repeat"])
+    until = f" until {rule['until']:%b %d, %Y}" if rule["until"] else ""
+    return f"{how} from {rule['start']:%b %d, %Y}{until}"
+
+
+def planned_between(db, username, start, end):
+    """
+    tasks_between plus the dates of repeating tasks in the range, in date
+    order. Only rules that overlap the range are read, and each one is
+    expanded over the range alone.
+    """
+    one_off = tasks_between(db, username, start, end)
+    repeating = [rule_tasks(rule, start, end) for rule in rules_between(db, username, start, end)]
+    return list(heapq.merge(one_off, *repeating, key=lambda t: t["date"]))
@@ -0,0 +1,399 @@
+"""
+Opt-in rerun profiling: where does a slow rerun spend its time?
+
+Off unless the server is started with EDUSPHERE_PROFILE=1, e.g.
+
+    EDUSPHERE_PROFILE=1 streamlit run GPA_Calculator/gpa_streamlit.py
+
+When it's on, every script run (full page or a single fragment) records:
+  - total time, and time per section / per fragment (the sub-tabs)
+  - every execute / executemany on a pooled connection: count + time
+    (including fetching the rows), grouped by statement
+  - every commit (conn.commit() or the end of a `with pool.write()`)
+  - how many widgets were rendered
+
+Each finished run is appended as one JSON line to EDUSPHERE_PROFILE_LOG
+(default edusphere_profile.jsonl) and shown in the "Rerun profile" panel at
+the bottom of the page; fragments also show a one-line timing caption.
+
+Set EDUSPHERE_PROFILE_SLOW_MS=300 as well to run each rerun under cProfile
+and dump the ones slower than 300 ms to EDUSPHERE_PROFILE_DIR (default
+profiles/) as .prof files -- open them with `python -m pstats`, snakeviz, or
+turn them into a flamegraph with flameprof.
+
+When it's off, connections are plain sqlite3 ones and span() / timed() do
+nothing, so normal runs pay nothing for this.
+
+Runs that end early (st.stop() on the login page, st.rerun()) aren't logged.
+Writes from the background grade writer thread aren't part of any rerun, so
+they aren't counted either.
+"""
+import cProfile
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+
+ENABLED = os.environ.get("EDUSPHERE_PROFILE", "") not in ("", "0")
+LOG_PATH = os.environ.get("EDUSPHERE_PROFILE_LOG", "edusphere_profile.jsonl")
+SLOW_MS = float(os.environ.get("EDUSPHERE_PROFILE_SLOW_MS", 0) or 0)
+PROFILE_DIR = os.environ.get("EDUSPHERE_PROFILE_DIR", "profiles")
+
+# How many recent runs the dev panel keeps per session
+HISTORY_RUNS = 20
+# Statements listed per run (slowest first)
+TOP_STATEMENTS = 10
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+# =============================
+# ONE RUN
+# =============================
+class _Span:
+    def __init__(self, name, depth, widgets):
+        self.name = name
+        self.depth = depth
+        self.start = time.perf_counter()
+        self.widgets_at_start = widgets
+        self.ms = 0.0
+        self.sql = 0
+        self.sql_ms = 0.0
+        self.commits = 0
+        self.widgets = 0
+
+    def as_dict(self):
+        return {
+            "name": self.name, "depth": self.depth, "ms": round(self.ms, 2),
+            "sql": self.sql, "sql_ms": round(self.sql_ms, 2),
+            "commits": self.commits, "widgets": self.widgets,
+        }
+
+
+class RunProfile:
+    """Everything recorded for one script run. The run itself is spans[0]."""
+
+    def __init__(self, kind, name):
+        self.kind = kind            # "page" or "fragment"
+        self.started_at = datetime.now().isoformat(timespec="milliseconds")
+        self.spans = [_Span(name, 0, _widget_count())]
+        self.open = [self.spans[0]]
+        self.commit_ms = 0.0
+        self.statements = {}        # sql text -> [count, ms]
+        self.cprofile = None
+        if SLOW_MS:
+            self.cprofile = cProfile.Profile()
+            try:
+                self.cprofile.enable()
+            except ValueError:
+                # another profiler already owns this interpreter (3.12+)
+                self.cprofile = None
+
+    def add_sql(self, sql, ms, count=1):
+        for span in self.open:
+            span.sql += count
+            span.sql_ms += ms
+        if sql is not None:
+            stats = self.statements.setdefault(_statement_key(sql), [0, 0.0])
+            stats[0] += count
+            stats[1] += ms
+
+    def add_commit(self, ms):
+        self.commit_ms += ms
+        for span in self.open:
+            span.commits += 1
+
+    def push(self, name):
+        span = _Span(name, len(self.open), _widget_count())
+        self.spans.append(span)
+        self.open.append(span)
+        return span
+
+    def pop(self, span):
+        span.ms = (time.perf_counter() - span.start) * 1000
+        span.widgets = _widget_count() - span.widgets_at_start
+        self.open.remove(span)
+
+    def finish(self):
+        root = self.spans[0]
+        self.pop(root)
+        record = {
+            "ts": self.started_at,
+            "kind": self.kind,
+            "name": root.name,
+            "section": next((span.name for span in self.spans if span.depth == 1), None),
+            "user": _current_user(),
+            "ms": round(root.ms, 2),
+            "sql": root.sql,
+            "sql_ms": round(root.sql_ms, 2),
+            "commits": root.commits,
+            "commit_ms": round(self.commit_ms, 2),
+            "widgets": root.widgets,
+            "spans": [span.as_dict() for span in self.spans[1:]],
+            "statements": [
+                {"sql": sql, "count": count, "ms": round(ms, 2)}
+                for sql, (count, ms) in sorted(
+                    self.statements.items(), key=lambda kv: kv[1][1], reverse=True
+                )[:TOP_STATEMENTS]
+            ],
+        }
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            if root.ms >= SLOW_MS:
+                record["cprofile"] = _dump_cprofile(self.cprofile, root.name, root.ms)
+        return record
+
+
+def _statement_key(sql):
+    return re.sub(r"\s+", " ", sql).strip()[:160]
+
+
+def _dump_cprofile(prof, name, ms):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_") or "run"
+    path = os.path.join(
+        PROFILE_DIR, f"{datetime.now():%Y%m%d-%H%M%S-%f}_{slug}_{ms:.0f}ms.prof"
+    )
+    prof.dump_stats(path)
+    return path
+
+
+def current_run():
+    return getattr(_local, "run", None)
+
+
+def begin_run(kind="page", name="page"):
+    """Starts recording this thread's script run (drops one that never finished)."""
+    if not ENABLED:
+        return None
+    _local.run = RunProfile(kind, name)
+    return _local.run
+
+
+def end_run():
+    """Finishes the current run: logs it, keeps it in the session history, returns it."""
+    run = current_run()
+    if run is None:
+        return None
+    _local.run = None
+    record = run.finish()
+    _write_log(record)
+    _session_history().append(record)
+    del _session_history()[:-HISTORY_RUNS]
+    return record
+
+
+def _write_log(record):
+    line = json.dumps(record, ensure_ascii=False)
+    with _log_lock:
+        with open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+# =============================
+# SECTIONS + FRAGMENTS
+# =============================
+@contextmanager
+def _span(name):
+    run = current_run()
+    if run is None:
+        yield None
+        return
+    span = run.push(name)
+    try:
+        yield span
+    finally:
+        run.pop(span)
+
+
+def span(name):
+    """with profiler.span("📚 School Tools"): ... -- times that block within the run."""
+    return _span(name) if ENABLED else nullcontext()
+
+
+def timed(func):
+    """
+    Decorator for the fragment functions (put it under @st.fragment).
+    During a full page run it's a span of that run; when the fragment reruns
+    on its own it becomes the run, and gets logged like a page run.
+    """
+    if not ENABLED:
+        return func
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        own_run = current_run() is None
+        if own_run:
+            begin_run("fragment", name)
+        try:
+            with _span(name) as frag:
+                result = func(*args, **kwargs)
+        except BaseException:
+            # st.rerun() / st.stop() from inside the fragment: nothing to report
+            if own_run:
+                _local.run = None
+            raise
+        _timing_caption(end_run() if own_run else frag.as_dict())
+        return result
+
+    return wrapper
+
+
+# =============================
+# SQL ACCOUNTING
+# =============================
+class ProfiledCursor(sqlite3.Cursor):
+    def _timed(self, sql, call, *args):
+        run = current_run()
+        if run is None:
+            return call(*args)
+        start = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            run.add_sql(sql, (time.perf_counter() - start) * 1000)
+
+    def execute(self, sql, parameters=()):
+        self._sql = sql
+        return self._timed(sql, super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._sql = sql
+        return self._timed(sql, super().executemany, sql, seq_of_parameters)
+
+    # Fetch time is added to the statement's time but isn't another statement
+    def _fetch(self, call, *args):
+        run = current_run()
+        if run is None:
+            return call(*args)
+        start = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            run.add_sql(getattr(self, "_sql", None), (time.perf_counter() - start) * 1000, count=0)
+
+    def fetchone(self):
+        return self._fetch(super().fetchone)
+
+    def fetchmany(self, size=None):
+        return self._fetch(super().fetchmany, self.arraysize if size is None else size)
+
+    def fetchall(self):
+        return self._fetch(super().fetchall)
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """sqlite3 connection that reports statements and commits to the current run."""
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    # Same as sqlite3's own shortcuts, but through a ProfiledCursor
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        run = current_run()
+        start = time.perf_counter()
+        super().commit()
+        if run is not None:
+            run.add_commit((time.perf_counter() - start) * 1000)
+
+    def __exit__(self, exc_type, exc, tb):
+        # `with conn:` commits (or rolls back) without going through commit()
+        run = current_run()
+        start = time.perf_counter()
+        result = super().__exit__(exc_type, exc, tb)
+        if run is not None and exc_type is None:
+            run.add_commit((time.perf_counter() - start) * 1000)
+        return result
+
+
+def connection_factory():
+    """factory= for sqlite3.connect: profiled only when profiling is on."""
+    return ProfiledConnection if ENABLED else sqlite3.Connection
+
+
+# =============================
+# STREAMLIT BITS
+# =============================
+# Imported lazily so the CLIs (gpa.py, gpa_export.py, ...) never load Streamlit
+def _widget_count():
+    """Widgets registered so far in this script run (0 outside Streamlit)."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        return 0
+    ids = getattr(getattr(ctx, "shared", ctx), "widget_ids_this_run", ())
+    return len(ids.snapshot() if hasattr(ids, "snapshot") else ids)
+
+
+def _current_user():
+    import streamlit as st
+
+    return st.session_state.get("current_user")
+
+
+def _session_history():
+    import streamlit as st
+
+    if "profile_history" not in st.session_state:
+        st.session_state.profile_history = []
+    return st.session_state.profile_history
+
+
+def _timing_caption(stats):
+    import streamlit as st
+
+    st.caption(
+        f"⏱ {stats['ms']:.0f} ms · {stats['sql']} SQL ({stats['sql_ms']:.1f} ms) · "
+        f"{stats['commits']} commits · {stats['widgets']} widgets"
+    )
+
+
+def dev_panel():
+    """Ends the page run and shows it (plus this session's recent runs) at the bottom."""
+    if not ENABLED:
+        return
+    import pandas as pd
+    import streamlit as st
+
+    record = end_run()
+    with st.expander("🛠 Rerun profile (dev)"):
+        if record is not None:
+            cols = st.columns(4)
+            cols[0].metric("Page run", f"{record['ms']:.0f} ms")
+            cols[1].metric("SQL", f"{record['sql']}", f"{record['sql_ms']:.1f} ms", delta_color="off")
+            cols[2].metric("Commits", f"{record['commits']}", f"{record['commit_ms']:.1f} ms", delta_color="off")
+            cols[3].metric("Widgets", f"{record['widgets']}")
+            if record["spans"]:
+                st.markdown("**Sections / tabs**")
+                spans = pd.DataFrame(record["spans"])
+                spans["name"] = ["    " * d + n for d, n in zip(spans.pop("depth"), spans["name"])]
+                st.dataframe(spans, hide_index=True)
+            if record["statements"]:
+                st.markdown("**Slowest statements**")
+                st.dataframe(pd.DataFrame(record["statements"]), hide_index=True)
+            if record.get("cprofile"):
+                st.caption(f"cProfile saved to `{record['cprofile']}`")
+
+        history = pd.DataFrame(_session_history())
+        if history.empty:
+            return
+        st.markdown("**Recent runs (this session)**")
+        st.dataframe(
+            history[["ts", "kind", "name", "ms", "sql", "sql_ms", "commits", "widgets"]][::-1],
+            hide_index=True,
+        )
+        st.caption(f"Every run is also appended to `{LOG_PATH}`.")
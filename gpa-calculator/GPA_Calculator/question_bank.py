@@ -0,0 +1,80 @@
+"""
+Quiz question bank.
+
+Questions live in data/question_bank.json (one record per question) instead of
+a dict literal inside the quiz tab. load_bank() reads the file once and indexes
+it by (course, unit, difficulty, type), so looking up or sampling questions
+costs the same whether the bank has 150 items or 50,000.
+
+Record fields: id, course, unit, difficulty, type ("mcq" / "text"),
+question, options (mcq only), answer. unit / difficulty may be null
+(the Spanish questions don't have them).
+"""
+import itertools
+import json
+import os
+import random
+from collections import defaultdict
+
+BANK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "question_bank.json")
+
+# Pass ANY for a field you don't want to filter on
+ANY = "*"
+
+_FIELDS = ("unit", "difficulty", "type")
+
+
+def _sort_key(value):
+    # "Unit 2" < "Unit 10", and None (no unit) sorts first
+    if value is None:
+        return (0, "")
+    head, _, tail = str(value).rpartition(" ")
+    return (1, head, int(tail)) if tail.isdigit() else (1, str(value), 0)
+
+
+class QuestionBank:
+    def __init__(self, questions):
+        self.by_id = {q["id"]: q for q in questions}
+
+        # Every question is filed under each mix of "this exact value" / ANY
+        # for unit, difficulty and type -> any lookup is one dict hit.
+        self._index = defaultdict(list)
+        for q in questions:
+            values = [q.get(field) for field in _FIELDS]
+            for mask in itertools.product((False, True), repeat=len(_FIELDS)):
+                key = tuple(ANY if wild else v for v, wild in zip(values, mask))
+                self._index[(q["course"],) + key].append(q["id"])
+
+        self._units = defaultdict(set)
+        self._difficulties = defaultdict(set)
+        for q in questions:
+            self._units[q["course"]].add(q.get("unit"))
+            self._difficulties[(q["course"], q.get("unit"))].add(q.get("difficulty"))
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def ids(self, course, unit=ANY, difficulty=ANY, qtype=ANY):
+        return self._index.get((course, unit, difficulty, qtype), [])
+
+    def find(self, course, unit=ANY, difficulty=ANY, qtype=ANY):
+        """All questions matching the filters, in bank order."""
+        return [self.by_id[i] for i in self.ids(course, unit, difficulty, qtype)]
+
+    def sample(self, n, course, unit=ANY, difficulty=ANY, qtype=ANY, rng=random):
+        """Up to n random question ids for one quiz attempt."""
+        ids = self.ids(course, unit, difficulty, qtype)
+        return rng.sample(ids, min(n, len(ids)))
+
+    def units(self, course):
+        return sorted(self._units.get(course, ()), key=_sort_key)
+
+    def difficulties(self, course, unit):
+        order = {"Easy": 0, "Medium": 1, "Hard": 2}
+        found = self._difficulties.get((course, unit), ())
+        return sorted(found, key=lambda d: (order.get(d, len(order)), str(d)))
+
+
+def load_bank(path=BANK_PATH):
+    with open(path, encoding="utf-8") as f:
+        return QuestionBank(json.load(f)["questions"])
@@ -0,0 +1,41 @@
+"""
+Saved quiz attempts (quiz_attempts table) and the weak-unit check built on them.
+"""
+
+# Below this fraction correct, a unit counts as weak
+WEAK_CUTOFF = 0.7
+
+
+def record_attempt(db, username, subject, unit, difficulty, score, total):
+    db.execute(
+        """
+        INSERT INTO quiz_attempts (username, subject, unit, difficulty, score, total)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (username, subject, unit, difficulty, score, total),
+    )
+
+
+def weak_units(db, username):
+    """
+    {subject: [unit, ...]} for every unit with at least one attempt under 70%,
+    in the order the units first went weak.
+
+    One grouped query over the (username, subject, unit, score, total) index,
+    so it stays fast however many attempts a student has.
+    """
+    rows = db.execute(
+        """
+        SELECT subject, unit
+        FROM quiz_attempts
+        WHERE username = ? AND score < ? * total
+        GROUP BY subject, unit
+        ORDER BY MIN(id)
+        """,
+        (username, WEAK_CUTOFF),
+    )
+
+    weak = {}
+    for subject, unit in rows:
+        weak.setdefault(subject, []).append(unit)
+    return weak
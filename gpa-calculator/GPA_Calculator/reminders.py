@@ -0,0 +1,150 @@
+"""
+Reminders for planner tasks, shown in the Today's Focus box.
+
+A task is "due" from the start of the day before its date and stays in the
+box (as overdue) for OVERDUE_DAYS after its date has passed.
+
+One ReminderEngine per server process holds every student's tasks in that
+window. A single background thread sleeps until the next time something
+changes -- the earliest entry of a min-heap of (when, remind / expire) events
+-- and moves tasks in and out of a per-student "due now" dict. A rerun just
+reads its student's dict: the cost is the number of due items, no matter
+how many tasks or students there are.
+
+Only tasks dated in the next few days are loaded; the thread reloads that
+window (one indexed range query for all students) every midnight and every
+RELOAD_SECONDS, which also picks up tasks added by other server processes.
+Tasks added in this process are tracked straight away (track()).
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+# Reminders start this many days before a task's date
+REMIND_DAYS_BEFORE = 1
+# ...and overdue tasks drop out this many days after it
+OVERDUE_DAYS = 3
+# Reload the window this often to see other processes' tasks
+RELOAD_SECONDS = 300
+# Retry a failed reload after this long
+RETRY_SECONDS = 30
+
+log = logging.getLogger(__name__)
+
+
+def _midnight(day):
+    return datetime.combine(day, datetime.min.time()).timestamp()
+
+
+class ReminderEngine:
+    def __init__(self, load, reload_seconds=RELOAD_SECONDS):
+        # load(start, end) -> [(username, task dict), ...] for tasks dated start <= date < end
+        self.load = load
+        self.reload_seconds = reload_seconds
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._closed = False
+        self._heap = []   # (when, seq, kind, username, task)
+        self._due = {}    # username -> {task id: task}
+        self._window_end = date.min
+        # [(username, task)] tracked while a reload is reading, else None
+        self._tracked = None
+        self._reload()
+        self._thread = threading.Thread(target=self._run, name="reminders", daemon=True)
+        self._thread.start()
+
+    # ---------- the schedule ----------
+    def _place(self, heap, due, username, task, now):
+        """Puts task in due (if it's due now) and heap (for its next event)."""
+        remind_at = _midnight(task["date"] - timedelta(days=REMIND_DAYS_BEFORE))
+        expire_at = _midnight(task["date"] + timedelta(days=OVERDUE_DAYS + 1))
+        if now >= expire_at:
+            return False
+        if now >= remind_at:
+            due.setdefault(username, {})[task["id"]] = task
+            heapq.heappush(heap, (expire_at, next(self._seq), "expire", username, task))
+            return True
+        heapq.heappush(heap, (remind_at, next(self._seq), "remind", username, task))
+        return False
+
+    def _reload(self):
+        """Re-reads the window around today from the database."""
+        now = time.time()
+        today = date.fromtimestamp(now)
+        # A day of margin past what the next midnight reload will need
+        window_end = today + timedelta(days=REMIND_DAYS_BEFORE + 2)
+        next_reload = min(_midnight(today + timedelta(days=1)), now + self.reload_seconds)
+        next_reload = max(next_reload, now + 1)
+        with self._cond:
+            self._tracked = []
+        try:
+            rows = self.load(today - timedelta(days=OVERDUE_DAYS), window_end)
+            heap, due = [], {}
+            for username, task in rows:
+                self._place(heap, due, username, task, now)
+            heapq.heappush(heap, (next_reload, next(self._seq), "reload", None, None))
+            with self._cond:
+                # Tasks tracked after load() read the table may not be in rows;
+                # placing one twice is harmless (same due-dict entry)
+                now = time.time()
+                for username, task in self._tracked:
+                    if task["date"] < window_end:
+                        self._place(heap, due, username, task, now)
+                self._heap, self._due, self._window_end = heap, due, window_end
+                self._cond.notify()
+        except Exception:
+            # A database error or one bad row must not kill the only reminder
+            # thread: keep what we have and try again soon
+            log.exception("Reloading reminders failed; retrying in %ss", RETRY_SECONDS)
+            with self._cond:
+                heapq.heappush(self._heap, (now + RETRY_SECONDS, next(self._seq), "reload", None, None))
+        finally:
+            with self._cond:
+                self._tracked = None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and self._heap[0][0] > time.time():
+                    self._cond.wait(self._heap[0][0] - time.time())
+                if self._closed:
+                    return
+                _, _, kind, username, task = heapq.heappop(self._heap)
+                if kind == "remind":
+                    self._place(self._heap, self._due, username, task, time.time())
+                elif kind == "expire":
+                    tasks = self._due.get(username, {})
+                    tasks.pop(task["id"], None)
+                    if not tasks:
+                        self._due.pop(username, None)
+            if kind == "reload":
+                self._reload()
+
+    # ---------- for the app ----------
+    def track(self, username, task):
+        """Starts tracking a task just added. Returns True if it's due already."""
+        if task["date"] >= self._window_end:
+            return False  # the reload that reaches its date will pick it up
+        with self._cond:
+            first = self._heap[0][0]
+            due_now = self._place(self._heap, self._due, username, task, time.time())
+            if self._tracked is not None:
+                self._tracked.append((username, task))
+            if self._heap[0][0] < first:
+                self._cond.notify()
+        return due_now
+
+    def due_for(self, username):
+        """This student's due and overdue tasks, oldest first."""
+        with self._cond:
+            tasks = list(self._due.get(username, {}).values())
+        return sorted(tasks, key=lambda t: (t["date"], t["id"]))
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
@@ -0,0 +1,185 @@
+"""
+Bulk import of registrar grade exports into the grades table.
+
+The CSV needs a header row with these columns (blank = no grade):
+
+    username,section,course,semester1,semester2,q1,q2,q3,q4,gt_year
+
+section is MS (semester1 / semester2) or HS (q1-q4). course must be one of
+the courses in gpa_engine.courses; gt_year (1 or 2) is only for AP World.
+
+The file is streamed: rows are validated and written CHUNK_ROWS at a time with
+executemany, one transaction per chunk, so memory stays flat however big the
+export is. Rows that fail validation are skipped and reported with their line
+number. A row for a (username, section, course) that already exists replaces it.
+
+Command line:
+
+    python roster_import.py grades.csv [--db gpa_users_v2.db] [--chunk-rows 50000]
+"""
+import argparse
+import csv
+import sys
+import time
+
+from gpa_db import ConnectionPool, migrate
+from gpa_engine import courses
+from grade_store import UPSERT_GRADE, note_import, refresh_gpa_totals
+
+CHUNK_ROWS = 50_000
+
+# Only the first few bad rows are kept, so a broken file can't fill up memory
+MAX_ERRORS_KEPT = 50
+
+REQUIRED_COLUMNS = ("username", "section", "course")
+GRADE_FIELDS = ("semester1", "semester2", "q1", "q2", "q3", "q4")
+
+
+class ImportRowError(ValueError):
+    pass
+
+
+def _grade(record, field):
+    value = (record.get(field) or "").strip()
+    if not value:
+        return None
+    try:
+        grade = float(value)
+    except ValueError:
+        raise ImportRowError(f"{field} is not a number: {value!r}")
+    if not 0 <= grade <= 100:
+        raise ImportRowError(f"{field} must be between 0 and 100 (got {grade:g})")
+    return grade
+
+
+def parse_row(record):
+    """CSV record (dict) -> grades-table row tuple, or raises ImportRowError."""
+    username = (record.get("username") or "").strip()
+    section = (record.get("section") or "").strip().upper()
+    course = (record.get("course") or "").strip()
+
+    if not username:
+        raise ImportRowError("username is blank")
+    if section not in ("MS", "HS"):
+        raise ImportRowError(f"section must be MS or HS (got {section!r})")
+    if course not in courses:
+        raise ImportRowError(f"unknown course {course!r}")
+
+    s1, s2, q1, q2, q3, q4 = (_grade(record, field) for field in GRADE_FIELDS)
+    if section == "MS" and any(q is not None for q in (q1, q2, q3, q4)):
+        raise ImportRowError("MS rows use semester1/semester2, not quarters")
+    if section == "HS" and (s1 is not None or s2 is not None):
+        raise ImportRowError("HS rows use q1-q4, not semester grades")
+    # The app fills grades in order, so a blank before a filled one means a broken export
+    if section == "MS" and s1 is None and s2 is not None:
+        raise ImportRowError("semester2 is filled but semester1 is blank")
+    if section == "HS":
+        quarters = [q1, q2, q3, q4]
+        filled = [i for i, q in enumerate(quarters) if q is not None]
+        if filled and filled[-1] + 1 != len(filled):
+            blank = next(i for i, q in enumerate(quarters) if q is None)
+            raise ImportRowError(f"q{blank + 1} is blank but q{filled[-1] + 1} is filled")
+
+    gt_year = (record.get("gt_year") or "").strip() or None
+    if isinstance(courses[course], dict):
+        if gt_year is not None and gt_year not in ("1", "2"):
+            raise ImportRowError(f"gt_year must be 1 or 2 (got {gt_year!r})")
+    else:
+        gt_year = None
+
+    # Same column order as gpa_db.GRADE_COLUMNS
+    return (username, section, course, s1, s2, q1, q2, q3, q4, gt_year)
+
+
+def _chunks(reader, chunk_rows, stats):
+    """Yields lists of valid rows; counts / records the bad ones in stats."""
+    chunk = []
+    for record in reader:
+        stats["read"] += 1
+        try:
+            chunk.append(parse_row(record))
+        except ImportRowError as err:
+            stats["rejected"] += 1
+            if len(stats["errors"]) < MAX_ERRORS_KEPT:
+                stats["errors"].append((reader.line_num, str(err)))
+            continue
+
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_grades(text_file, write, chunk_rows=CHUNK_ROWS, on_progress=None):
+    """
+    Streams a CSV (an open text file) into the grades table.
+
+    write: ConnectionPool.write (or anything that lends a connection and
+           commits at the end of the with-block)
+    on_progress(stats) is called after every chunk is committed. If the file
+    or the database fails partway (ValueError, csv.Error, sqlite3.Error),
+    the chunks committed before that stay written.
+
+    Returns stats: read, imported, rejected, errors [(line, message)],
+    seconds, rows_per_second.
+    """
+    start = time.perf_counter()
+    stats = {"read": 0, "imported": 0, "rejected": 0, "errors": []}
+
+    reader = csv.DictReader(text_file)
+    missing = [col for col in REQUIRED_COLUMNS if col not in (reader.fieldnames or ())]
+    if missing:
+        raise ValueError(f"CSV is missing column(s): {', '.join(missing)}")
+
+    for chunk in _chunks(reader, chunk_rows, stats):
+        # The chunk's students get their gpa_totals in the same short
+        # transaction, so the write lock is never held for the whole roster
+        with write() as db:
+            db.executemany(UPSERT_GRADE, chunk)
+            refresh_gpa_totals(db, {row[0] for row in chunk})
+        # Open grade tabs must not trust their cached "already saved" values now
+        note_import()
+        stats["imported"] += len(chunk)
+        if on_progress is not None:
+            on_progress(stats)
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["rows_per_second"] = stats["read"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import a registrar grade CSV into EduSphere.")
+    parser.add_argument("csv_path", help="CSV export (see roster_import.py for the columns)")
+    parser.add_argument("--db", default="gpa_users_v2.db", help="SQLite database (default: gpa_users_v2.db)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS,
+                        help=f"rows per transaction (default: {CHUNK_ROWS})")
+    args = parser.parse_args(argv)
+
+    pool = ConnectionPool(args.db)
+    with pool.write() as db:
+        migrate(db)
+
+    def progress(stats):
+        print(f"  {stats['imported']:,} rows written...", file=sys.stderr)
+
+    with open(args.csv_path, newline="", encoding="utf-8-sig") as f:
+        stats = import_grades(f, pool.write, args.chunk_rows, on_progress=progress)
+    pool.close()
+
+    print(
+        f"Imported {stats['imported']:,} of {stats['read']:,} rows "
+        f"({stats['rejected']:,} rejected) in {stats['seconds']:.1f}s "
+        f"= {stats['rows_per_second']:,.0f} rows/s"
+    )
+    for line, message in stats["errors"]:
+        print(f"  line {line}: {message}")
+    if stats["rejected"] > len(stats["errors"]):
+        print(f"  ... and {stats['rejected'] - len(stats['errors']):,} more")
+
+    return 1 if stats["rejected"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+"""
+One module per top-level section of the app, each with a render() function.
+
+A section module (and whatever it imports -- the quiz bank, the What-If
+engines, ...) is only imported the first time someone opens that section.
+After that it stays in sys.modules, so reruns don't parse or build it again.
+"""
+import importlib
+
+import profiler
+
+SECTION_MODULES = {
+    "🏠 Home & Intro": "sections.home",
+    "📚 School Tools": "sections.school_tools",
+    "🧠 Daily & Planning": "sections.daily_planning",
+    "🌱 Personal Growth": "sections.personal_growth",
+    "🎯 Tutoring": "sections.tutoring",
+}
+
+
+def render(section):
+    with profiler.span(section):
+        importlib.import_module(SECTION_MODULES[section]).render()
@@ -0,0 +1,377 @@
+"""
+🧠 Daily & Planning: Daily Dashboard and Organization Helper.
+"""
+from datetime import date, timedelta
+
+import streamlit as st
+
+from app_shared import get_db_pool, get_reminders
+from gpa_engine import courses
+from planner_store import (
+    PRIORITIES,
+    REPEATS,
+    TASK_SORTS,
+    TASK_TYPES,
+    VIEW_RANGES,
+    add_rule,
+    add_task,
+    all_rules,
+    count_tasks,
+    describe_rule,
+    planned_between,
+    rule_tasks,
+    rules_between,
+    task_page,
+    upcoming_tasks,
+)
+import profiler
+import ui
+from workload import DEFAULT_BUDGET, WorkloadPlan
+
+# Rows per page of "All Planned Tasks"
+TASKS_PER_PAGE = 25
+# Days of the study plan shown at once
+PLAN_DAYS_SHOWN = 14
+# Repeating tasks go into the study plan this many days ahead
+PLAN_REPEAT_DAYS = 28
+
+
+@st.fragment
+@profiler.timed
+def daily_dashboard():
+    st.header("🧠 Daily Dashboard")
+
+    col1, col2 = st.columns([3, 2])
+
+    # LEFT: priorities inputs
+    with col1:
+        st.markdown(
+            """
+            <div class="dash-card">
+                <div class="dash-title-pill">Today</div>
+                <div class="dash-subtitle">Top 3 Priorities</div>
+                <p class="dash-intro">
+                    Pick the three things that would make today a win.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+        task1 = st.text_input("① Priority 1", key="dash_task1")
+        task2 = st.text_input("② Priority 2", key="dash_task2")
+        task3 = st.text_input("③ Priority 3", key="dash_task3")
+
+        # Today's Focus is drawn outside this fragment -> rerun the whole page
+        # (only) when the list it shows has changed
+        priorities = [t.strip() for t in (task1, task2, task3) if t.strip()]
+        if priorities != st.session_state.get("focus_items"):
+            st.rerun()
+
+        st.markdown(
+            """
+            <p class="dash-hint">
+            ✅ Tip: If everything is a priority, nothing is. Keep this list short and realistic.
+            </p>
+            """,
+            unsafe_allow_html=True
+        )
+
+    # RIGHT: image
+    with col2:
+        st.image(
+            "https://images.unsplash.com/photo-1517248135467-4c7edcad34c4?auto=format&fit=crop&w=900&q=80",
+            width=500,
+        )
+        st.markdown(
+            "<p class='dash-caption'>Quiet focus mode 🧑‍💻</p>",
+            unsafe_allow_html=True
+        )
+
+
+@st.fragment
+@profiler.timed
+def organization_helper():
+    st.header("📅 Organization Helper")
+
+    # Tasks are saved in the planner_tasks table (see planner_store.py)
+    db_pool = get_db_pool()
+    current_user = st.session_state.current_user
+
+    col_left, col_right = st.columns([2, 3])
+
+    # ---------- LEFT: Add a task ----------
+    with col_left:
+        st.subheader("➕ Add a task to your planner")
+
+        task_date = st.date_input("📆 Date", value=date.today(), key="org_task_date")
+
+        task_course = st.selectbox(
+            "📚 Class / Subject",
+            list(courses.keys()) + ["Other"],
+            key="org_task_course"
+        )
+
+        task_title = st.text_input(
+            "✏️ Task / Assignment name",
+            key="org_task_title"
+        )
+
+        task_type = st.selectbox(
+            "Type",
+            TASK_TYPES,
+            key="org_task_type"
+        )
+
+        task_priority = st.selectbox(
+            "Priority",
+            PRIORITIES,
+            key="org_task_priority"
+        )
+
+        task_est = st.number_input(
+            "Estimated time (minutes)",
+            min_value=0,
+            max_value=300,
+            value=30,
+            step=5,
+            key="org_task_est"
+        )
+
+        task_repeat = st.selectbox(
+            "🔁 Repeats",
+            ["Doesn't repeat"] + list(REPEATS),
+            key="org_task_repeat"
+        )
+        repeat_every, repeat_until = 1, None
+        if task_repeat == "Every N days":
+            repeat_every = st.number_input(
+                "Every how many days?",
+                min_value=2,
+                max_value=60,
+                value=2,
+                key="org_task_every"
+            )
+        if task_repeat != "Doesn't repeat" and st.checkbox("Ends on a date", key="org_task_ends"):
+            repeat_until = st.date_input(
+                "Last day",
+                value=task_date + timedelta(days=30),
+                min_value=task_date,
+                key="org_task_until"
+            )
+
+        if st.button("Add to planner", key="org_add_button"):
+            if task_title.strip() and task_repeat != "Doesn't repeat":
+                # One rule row; its dates are worked out when a view needs them
+                with db_pool.write() as db:
+                    add_rule(
+                        db, current_user, task_date, REPEATS[task_repeat], task_course,
+                        task_title.strip(), task_type, task_priority, task_est,
+                        every=repeat_every, until=repeat_until,
+                    )
+                st.success("✅ Repeating task added to your planner!")
+            elif task_title.strip():
+                with db_pool.write() as db:
+                    task_id = add_task(
+                        db, current_user, task_date, task_course,
+                        task_title.strip(), task_type, task_priority, task_est,
+                    )
+                task = {
+                    "id": task_id, "date": task_date, "course": task_course,
+                    "title": task_title.strip(), "type": task_type,
+                    "priority": task_priority, "est": int(task_est),
+                }
+                # Slot it into the study plan without re-planning everything
+                plan = st.session_state.get("workload_plan")
+                if plan is not None and st.session_state.workload_plan_key[0] == current_user:
+                    plan.add(task)
+                # Today's Focus is drawn outside this fragment -> rerun the whole
+                # page if the new task already belongs in its reminders
+                if get_reminders().track(current_user, task):
+                    st.session_state.org_task_added = True
+                    st.rerun()
+                st.success("✅ Task added to your planner!")
+            else:
+                st.warning("Please enter a task / assignment name before adding.")
+
+        # (the success message for a task that triggered the rerun above)
+        if st.session_state.pop("org_task_added", False):
+            st.success("✅ Task added to your planner!")
+
+    # ---------- RIGHT: View tasks ----------
+    with col_right:
+        st.subheader("📅 Tasks for a specific day")
+
+        view_date = st.date_input(
+            "Show tasks for date:",
+            value=date.today(),
+            key="org_view_date"
+        )
+        view_span = st.radio(
+            "Show", list(VIEW_RANGES), horizontal=True, key="org_view_span"
+        )
+
+        # One indexed range query for the day / week / month around view_date,
+        # plus the dates of repeating tasks in just that range
+        start, end = VIEW_RANGES[view_span](view_date)
+        with db_pool.read() as db:
+            tasks_in_view = planned_between(db, current_user, start, end)
+
+        if tasks_in_view:
+            shown_day = None
+            for t in tasks_in_view:
+                if view_span != "Day" and t["date"] != shown_day:
+                    shown_day = t["date"]
+                    st.markdown(f"**{shown_day:%a %b %d}**")
+                title = f"🔁 {t['title']}" if "rule_id" in t else t["title"]
+                st.markdown(
+                    ui.task_card(title, t["course"], t["type"], t["priority"], t["est"]),
+                    unsafe_allow_html=True,
+                )
+        else:
+            st.info(f"No tasks for this {view_span.lower()} yet. Add one on the left!")
+
+        st.markdown("---")
+        st.subheader("📚 All Planned Tasks")
+
+        # Filtering, sorting and paging all happen in SQL (planner_store.task_page),
+        # and the page goes out as one table instead of one element per task
+        f_course, f_type, f_priority, f_sort = st.columns(4)
+        course_filter = f_course.selectbox(
+            "Class", ["Any"] + list(courses.keys()) + ["Other"], key="org_filter_course"
+        )
+        type_filter = f_type.selectbox("Type", ["Any"] + TASK_TYPES, key="org_filter_type")
+        priority_filter = f_priority.selectbox(
+            "Priority", ["Any"] + PRIORITIES, key="org_filter_priority"
+        )
+        sort_by = f_sort.selectbox("Sort by", list(TASK_SORTS), key="org_sort")
+        date_filter = st.date_input(
+            "Dates (leave empty for all)", value=(), key="org_filter_dates"
+        )
+
+        filters = {
+            "course": None if course_filter == "Any" else course_filter,
+            "task_type": None if type_filter == "Any" else type_filter,
+            "priority": None if priority_filter == "Any" else priority_filter,
+            # A range is (first, last); while picking it's just (first,)
+            "start": date_filter[0] if date_filter else None,
+            "end": date_filter[1] + timedelta(days=1) if len(date_filter) == 2 else None,
+        }
+        with db_pool.read() as db:
+            total = count_tasks(db, current_user, **filters)
+
+        if total:
+            offset = ui.pager(total, TASKS_PER_PAGE, key="org_tasks_page")
+            with db_pool.read() as db:
+                page = task_page(
+                    db, current_user, sort=sort_by,
+                    limit=TASKS_PER_PAGE, offset=offset, **filters,
+                )
+            st.dataframe(
+                [
+                    {
+                        "Date": t["date"],
+                        "Class": t["course"],
+                        "Task": t["title"],
+                        "Type": t["type"],
+                        "Priority": t["priority"],
+                        "Minutes": t["est"],
+                    }
+                    for t in page
+                ],
+                hide_index=True,
+            )
+            st.caption(f"Showing {offset + 1}–{offset + len(page)} of {total} tasks")
+        elif any(filters.values()):
+            st.caption("No tasks match these filters.")
+        else:
+            st.caption("Your planner is empty. Start by adding a task on the left.")
+
+        with db_pool.read() as db:
+            rules = all_rules(db, current_user)
+        if rules:
+            st.markdown("**🔁 Repeating tasks**")
+            st.markdown("\n".join(
+                f"- {r['title']} ({r['course']}, {r['type']}) · {describe_rule(r)}"
+                for r in rules
+            ))
+
+
+@st.fragment
+@profiler.timed
+def study_plan():
+    st.header("🗓 Study Plan")
+    st.caption(
+        "Your upcoming tasks spread over the days before they're due. Tests and "
+        "high-priority work go first, and no day gets more than your budget."
+    )
+
+    db_pool = get_db_pool()
+    current_user = st.session_state.current_user
+    today = date.today()
+
+    budget = st.number_input(
+        "Minutes of work per day",
+        min_value=15,
+        max_value=600,
+        value=DEFAULT_BUDGET,
+        step=15,
+        key="plan_budget"
+    )
+
+    # The plan lives in session state: adding a task in Organization Helper
+    # updates it in place (WorkloadPlan.add). It's only re-solved from the
+    # database when the student, budget, day or repeating tasks change, or the
+    # task count doesn't match (tasks added from another tab).
+    repeat_end = today + timedelta(days=PLAN_REPEAT_DAYS)
+    plan = st.session_state.get("workload_plan")
+    with db_pool.read() as db:
+        n_upcoming = count_tasks(db, current_user, start=today)
+        rules = rules_between(db, current_user, today, repeat_end)
+        plan_key = (current_user, int(budget), today, tuple(r["id"] for r in rules))
+        if (
+            plan is None
+            or st.session_state.get("workload_plan_key") != plan_key
+            or len(plan) - st.session_state.workload_plan_repeating != n_upcoming
+        ):
+            repeating = [t for rule in rules for t in rule_tasks(rule, today, repeat_end)]
+            plan = WorkloadPlan(upcoming_tasks(db, current_user, today) + repeating, budget, today)
+            st.session_state.workload_plan = plan
+            st.session_state.workload_plan_key = plan_key
+            st.session_state.workload_plan_repeating = len(repeating)
+
+    at_risk = plan.at_risk_tasks()
+    if at_risk:
+        st.warning(
+            f"⚠️ {len(at_risk)} task(s) won't fit before they're due at {budget} min/day: "
+            + ", ".join(f"{t['title']} ({t['date']:%b %d})" for t in at_risk[:5])
+            + ("…" if len(at_risk) > 5 else "")
+        )
+
+    shown = 0
+    for day, chunks in plan.plan_days(PLAN_DAYS_SHOWN):
+        shown += 1
+        total = sum(minutes for _, minutes in chunks)
+        st.markdown(f"**{day:%a %b %d}** · {total} / {budget} min")
+        st.markdown("\n".join(
+            f"- {'🔁 ' if 'rule_id' in t else ''}{t['title']} ({t['course']}, {t['type']}, "
+            f"due {t['date']:%b %d}) · {minutes} min"
+            for t, minutes in chunks
+        ))
+    if not shown:
+        st.info("Nothing to plan yet. Tasks with an estimated time show up here.")
+    elif len(plan.days) > shown:
+        st.caption(f"…and {len(plan.days) - shown} more day(s) of work after that.")
+
+
+def render():
+    focus_tabs = st.tabs(["🧠 Daily Dashboard", "📅 Organization Helper", "🗓 Study Plan"])
+
+    with focus_tabs[0]:
+        daily_dashboard()
+
+    with focus_tabs[1]:
+        organization_helper()
+
+    with focus_tabs[2]:
+        study_plan()
@@ -0,0 +1,52 @@
+"""
+🏠 Home & Intro.
+"""
+import streamlit as st
+
+
+def render():
+    # ----- WELCOME LAYOUT (3 columns) -----
+    col_me, col_app, col_image = st.columns([3, 3, 4])
+
+    # LEFT: About Me
+    with col_me:
+        st.subheader("👋 About Me")
+        st.write(
+            "Hi, I'm **Arpeet Shah**.\n"
+            "- 9th grade student at **Emerson High School**\n"
+            "- I care about staying organized, keeping up with school, and keeping some balance.\n"
+            "- I built EduSphere so students (including me) have one place to plan and track school."
+        )
+
+        st.markdown("**📇 Contact**")
+        st.markdown(
+            """
+            <div class="es-contact">
+                <div class="es-pill es-pill-phone">
+                    <span class="es-pill-icon">📱</span>
+                    <span><strong>Phone:</strong> 469-996-1729</span>
+                </div>
+                <div class="es-pill es-pill-email">
+                    <span class="es-pill-icon">✉️</span>
+                    <span><strong>Email:</strong> arpeet.shah.168@k12.friscoisd.org</span>
+                </div>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    # MIDDLE: About the app
+    with col_app:
+        st.subheader("🌀 What is EduSphere?")
+        st.write(
+            "- A calm, all-in-one place for school.\n"
+            "- Track your GPA, practice problems, and organize your day.\n"
+            "- No logins, no personal data stored — just tools for you."
+        )
+
+    # RIGHT: Image
+    with col_image:
+        st.image(
+            "https://images.unsplash.com/photo-1589629828693-5533d7a9d731?auto=format&fit=crop&w=900&q=80",
+            width=500,
+        )
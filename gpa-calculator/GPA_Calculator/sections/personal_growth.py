@@ -0,0 +1,100 @@
+"""
+🌱 Personal Growth: Idea Vault.
+"""
+import streamlit as st
+
+from app_shared import get_db_pool
+from idea_store import IDEA_SORTS, IDEA_TAGS, add_idea, count_ideas, idea_page
+import profiler
+import ui
+
+# Cards per page of Recent Ideas
+IDEAS_PER_PAGE = 5
+
+
+# ------------------ TAB 1: IDEA VAULT ------------------
+@st.fragment
+@profiler.timed
+def idea_vault():
+    st.subheader("💡 Idea Vault")
+
+    # Ideas are saved in the ideas table (see idea_store.py)
+    db_pool = get_db_pool()
+    current_user = st.session_state.current_user
+
+    col_left, col_right = st.columns([3, 2])
+
+    with col_left:
+        idea_title = st.text_input(
+            "Idea title",
+            placeholder="Ex: App for tracking volunteering hours",
+            key="idea_title"
+        )
+
+        idea_desc = st.text_area(
+            "Details (optional)",
+            placeholder="What is it? Why is it cool? Future you will forget unless you write it 😅",
+            key="idea_desc",
+            height=90
+        )
+
+        idea_tag = st.selectbox(
+            "Tag",
+            IDEA_TAGS,
+            key="idea_tag"
+        )
+
+        idea_importance = st.slider(
+            "How exciting / important is this?",
+            min_value=1,
+            max_value=5,
+            value=3,
+            key="idea_importance"
+        )
+
+        if st.button("Save idea", key="save_idea"):
+            if idea_title.strip():
+                with db_pool.write() as db:
+                    add_idea(
+                        db, current_user, idea_title.strip(), idea_desc.strip(),
+                        idea_tag, idea_importance,
+                    )
+                st.success("Idea saved to your vault 🔐")
+            else:
+                st.warning("Give your idea a short title so future-you knows what it was 🙂")
+
+    with col_right:
+        st.markdown("### 🗂 Recent Ideas")
+
+        f_tag, f_sort = st.columns(2)
+        tag_filter = f_tag.selectbox("Tag", ["All tags"] + IDEA_TAGS, key="idea_filter_tag")
+        sort_by = f_sort.selectbox("Sort by", list(IDEA_SORTS), key="idea_sort")
+        tag = None if tag_filter == "All tags" else tag_filter
+
+        # Only the cards on this page are loaded (idea_store.idea_page)
+        with db_pool.read() as db:
+            total = count_ideas(db, current_user, tag)
+
+        if not total:
+            if tag is None:
+                st.caption("No ideas yet. Whenever you get a random thought, drop it here instead of losing it.")
+            else:
+                st.caption(f"No {tag} ideas yet.")
+        else:
+            offset = ui.pager(total, IDEAS_PER_PAGE, key="ideas_page")
+            with db_pool.read() as db:
+                ideas = idea_page(db, current_user, tag, sort_by, IDEAS_PER_PAGE, offset)
+            for idea in ideas:
+                st.markdown(
+                    ui.idea_card(idea["title"], idea["tag"], idea["importance"], idea["desc"]),
+                    unsafe_allow_html=True,
+                )
+            if total > IDEAS_PER_PAGE:
+                st.caption(f"{total} saved ideas in your vault.")
+
+
+def render():
+    tabs = st.tabs(["💡 Idea Vault"])
+
+    with tabs[0]:
+        idea_vault()
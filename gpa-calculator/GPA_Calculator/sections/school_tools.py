@@ -0,0 +1,1063 @@
+"""
+📚 School Tools: GPA calculator, Quiz & Practice, Resource Hub and What-If.
+"""
+import csv
+import io
+import sqlite3
+
+import streamlit as st
+
+from app_shared import get_db_pool, get_grade_writer, get_rank_index, is_registrar
+from gpa_engine import (
+    courses,
+    weighted_gpa,
+    course_weight,
+    student_gpa,
+    roster_semesters,
+    ROSTER_SELECT,
+)
+from goal_seek import solve_target
+from grade_store import ms_row, hs_row, read_gpa_totals
+from question_bank import load_bank
+from quiz_store import record_attempt, weak_units
+from roster_import import import_grades
+from whatif_sim import simulate_gpa
+import profiler
+import ui
+
+db_pool = get_db_pool()
+rank_index = get_rank_index()
+
+
+# =============================
+# QUIZ QUESTION BANK
+# =============================
+@st.cache_resource
+def get_question_bank():
+    # Read data/question_bank.json once per process (not on every rerun)
+    return load_bank()
+
+
+question_bank = get_question_bank()
+
+
+# ---------- Study Tips ----------
+def get_study_tips(unit):
+    tips = {
+        "Unit 1": (
+            "🔴 You are struggling with foundational algebra skills.\n"
+            "• Review linear equations and inequalities\n"
+            "• Practice solving equations step by step\n"
+            "• Focus on understanding slope and intercept form\n"
+            "• Use 10–15 practice problems per day"
+        ),
+
+        "Unit 2": (
+            "🔴 You are having trouble with functions and their graphs.\n"
+            "• Review function notation (f(x))\n"
+            "• Practice identifying domain and range\n"
+            "• Work on graph transformations (shifts, stretches, reflections)\n"
+            "• Re-draw graphs by hand to build intuition"
+        ),
+
+        "Unit 3": (
+            "🔴 You are struggling with polynomial and rational functions.\n"
+            "• Review factoring techniques\n"
+            "• Practice polynomial division\n"
+            "• Focus on zeros, end behavior, and asymptotes\n"
+            "• Rework missed quiz questions carefully"
+        ),
+
+        "Unit 4": (
+            "🔴 You are having difficulty with advanced modeling and applications.\n"
+            "• Slow down on word problems and underline key info\n"
+            "• Practice setting up equations before solving\n"
+            "• Review past homework and quizzes\n"
+            "• Explain problems out loud to check understanding"
+        ),
+    }
+
+    return tips.get(unit, "Review class notes and redo missed problems.")
+
+
+
+# ---------- Analyze Weak Units ----------
+def analyze_weak_units():
+    # Grouped query over this user's saved quiz attempts (see quiz_store.py)
+    with db_pool.read() as db:
+        return weak_units(db, st.session_state.current_user)
+
+
+# ---------- What-If: range of outcomes ----------
+def load_past_semester_grades():
+    """Every semester grade this user has saved (HS quarters already paired up)."""
+    with db_pool.read() as db:
+        rows = db.execute(
+            ROSTER_SELECT + " WHERE username = ?",
+            (st.session_state.current_user,),
+        ).fetchall()
+    _, _, past_grades, _ = roster_semesters(rows)
+    return past_grades
+
+
+def show_gpa_range(result, current_gpa, target_gpa):
+    p = result["percentiles"]
+    chance = result["chance"][target_gpa]
+
+    st.markdown("#### 🎲 Range of outcomes")
+    st.info(
+        f"Most likely result: about **{p[50]:.3f}** (from **{current_gpa:.3f}** now).  \n"
+        f"Half of the simulations land between **{p[25]:.3f}** and **{p[75]:.3f}**, "
+        f"and 90% between **{p[5]:.3f}** and **{p[95]:.3f}**."
+    )
+    st.success(f"Chance of ending at **{target_gpa:.2f}** or higher: **{chance:.0%}**")
+
+
+# =============================
+# TAB 0: GPA CALCULATOR
+# =============================
+@st.fragment
+@profiler.timed
+def gpa_calculator():
+    st.header("📊 GPA Calculator")
+
+    # Who is this data for? (change this to your real login name if you have one)
+    current_user = st.session_state.get("current_user", "guest")
+    grade_writer = get_grade_writer()
+
+    # Top summary card
+    st.markdown(
+        """
+        <div class="es-card">
+            <div class="es-card-title">How this GPA calculator works</div>
+            <p class="es-card-sub">
+                • Middle school: each <b>semester grade</b> becomes one GPA entry.<br>
+                • High school: we average <b>2 quarters = 1 semester</b>, then convert that semester grade to GPA.<br>
+                • Weighted GPA uses your course weight (5.0 / 5.5 / 6.0).<br>
+                • Final GPA is the average of all semester GPAs you entered.
+            </p>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # Registrar / counselor bulk upload (same importer as `python roster_import.py`).
+    # It can overwrite anyone's grades, so only usernames in EDUSPHERE_REGISTRARS see it
+    if is_registrar(current_user):
+        with st.expander("📤 Bulk import grades from a CSV"):
+            st.caption(
+                "Columns: username, section (MS/HS), course, semester1, semester2, q1–q4, gt_year. "
+                "Rows for a course that's already saved replace it."
+            )
+            grades_csv = st.file_uploader("Registrar export (.csv)", type=["csv"], key="bulk_grades_csv")
+
+            if grades_csv is not None and st.button("Import grades", key="bulk_grades_import"):
+                progress = st.empty()
+                # Each chunk commits on its own, so a failure partway keeps the earlier ones
+                written = {"rows": 0}
+
+                def show_progress(s):
+                    written["rows"] = s["imported"]
+                    progress.caption(f"{s['imported']:,} rows written...")
+
+                try:
+                    stats = import_grades(
+                        io.TextIOWrapper(grades_csv, encoding="utf-8-sig", newline=""),
+                        db_pool.write,
+                        on_progress=show_progress,
+                    )
+                except (ValueError, csv.Error, sqlite3.Error) as err:
+                    progress.empty()
+                    st.error(f"Couldn't import that file: {err}")
+                    if written["rows"]:
+                        st.warning(f"{written['rows']:,} rows were already saved before it stopped.")
+                else:
+                    progress.empty()
+                    st.success(
+                        f"Imported {stats['imported']:,} of {stats['read']:,} rows "
+                        f"in {stats['seconds']:.1f}s."
+                    )
+                    if stats["rejected"]:
+                        st.warning(f"{stats['rejected']:,} rows were skipped:")
+                        for line, message in stats["errors"]:
+                            st.text(f"line {line}: {message}")
+                finally:
+                    # Whatever was written (even before a failure) has to reach the ranks
+                    if written["rows"]:
+                        rank_index.rebuild_in_background()
+
+    gpa_tabs = st.tabs(["🏫 Middle School", "🎓 High School", "📈 Results & Analytics"])
+
+    # We’ll fill these from the MS / HS tabs so Results can use them
+    ms_course_grades = {}
+    hs_course_grades = {}
+
+    # =============================
+    # MIDDLE SCHOOL TAB
+    # =============================
+    with gpa_tabs[0]:
+        st.subheader("🏫 Middle School Grades")
+
+        st.markdown(
+            """
+            <div class="es-card">
+                <div class="es-card-title">Enter your middle school semester grades</div>
+                <p class="es-card-sub">
+                    • Most classes have 2 semesters.<br>
+                    • <b>Health</b> only has 1 semester.<br>
+                    • AP World lets you pick Year 1 or Year 2 weight.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+        # --- 1) Load any saved MS grades for this user from the DB ---
+        saved_ms = {}
+        with db_pool.read() as db:
+            saved_rows = db.execute(
+                """
+                SELECT course, semester1, semester2, gt_year
+                FROM grades
+                WHERE username = ? AND section = 'MS'
+                """,
+                (current_user,),
+            ).fetchall()
+
+        for course, s1, s2, gt_year in saved_rows:
+            vals = []
+            if s1 is not None:
+                vals.append(s1)
+            if s2 is not None:
+                vals.append(s2)
+            saved_ms[course] = vals  # list of 1 or 2 sem grades
+            grade_writer.remember([ms_row(current_user, course, s1, s2, gt_year)])
+
+        # --- 2) Multiselect with saved courses pre-selected ---
+        ms_selected = st.multiselect(
+            "Select the courses you took (MS)",
+            options=list(courses.keys()),
+            default=list(saved_ms.keys()),
+            key="ms_courses",
+        )
+
+        # --- 3) Inputs + saving to DB (only rows that changed get queued) ---
+        for course in ms_selected:
+            # Determine number of semesters (Health = 1, others = 2)
+            semesters = 1 if course == "Health" else 2
+            previous = saved_ms.get(course, [])
+
+            grades = []
+            for i in range(semesters):
+                default_val = previous[i] if i < len(previous) else 0.0
+                grades.append(
+                    st.number_input(
+                        f"{course} – Semester {i + 1}",
+                        min_value=0.0,
+                        max_value=100.0,
+                        value=float(default_val),
+                        key=f"ms_s{i + 1}_{course}",
+                    )
+                )
+
+            ms_course_grades[course] = tuple(grades)
+
+            # Handle AP World year
+            gt_year = None
+            if course == "GT / AP World History":
+                gt_year = st.selectbox(
+                    f"Select year for {course}:",
+                    [1, 2],
+                    key=f"{course}_year",
+                )
+
+            # Save to DB (semester1, semester2; quarters are None for MS)
+            s1 = grades[0]
+            s2 = grades[1] if semesters == 2 else None
+
+            grade_writer.stage(ms_row(current_user, course, s1, s2, gt_year))
+
+    # =============================
+    # HIGH SCHOOL TAB
+    # =============================
+    with gpa_tabs[1]:
+        st.subheader("🎓 High School Grades")
+
+        st.markdown(
+            """
+            <div class="es-card">
+                <div class="es-card-title">Enter your high school quarter grades</div>
+                <p class="es-card-sub">
+                    • There are 4 quarters in a full year.<br>
+                    • We convert them as: Q1 + Q2 = Semester 1, Q3 + Q4 = Semester 2.<br>
+                    • If you only have 1–2 quarters so far, we use what's available.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+        # Ask once for total quarters completed this year
+        hs_quarters = st.number_input(
+            "How many quarters have been completed this year?",
+            min_value=1,
+            max_value=4,
+            value=4,
+            step=1,
+            key="hs_quarters_overall",
+        )
+
+        # --- 1) Load saved HS grades for this user ---
+        saved_hs = {}
+        with db_pool.read() as db:
+            saved_rows = db.execute(
+                """
+                SELECT course, q1, q2, q3, q4, gt_year
+                FROM grades
+                WHERE username = ? AND section = 'HS'
+                """,
+                (current_user,),
+            ).fetchall()
+
+        for course, q1, q2, q3, q4, gt_year in saved_rows:
+            vals = [g for g in (q1, q2, q3, q4) if g is not None]
+            saved_hs[course] = vals
+            grade_writer.remember([hs_row(current_user, course, [q1, q2, q3, q4], gt_year)])
+
+        # --- 2) Multiselect with saved HS courses pre-selected ---
+        hs_selected = st.multiselect(
+            "Select the courses you took (HS)",
+            options=list(courses.keys()),
+            default=list(saved_hs.keys()),
+            key="hs_courses",
+        )
+
+        # --- 3) Inputs + saving to DB (only rows that changed get queued) ---
+        for course in hs_selected:
+            previous = saved_hs.get(course, [])
+
+            # How many quarters you want to enter for this course
+            quarters = st.slider(
+                f"Quarters Completed – {course}",
+                min_value=1,
+                max_value=hs_quarters,
+                value=len(previous) if previous else hs_quarters,
+                key=f"hs_quarters_{course}",
+            )
+
+            q_grades = []
+            for i in range(quarters):
+                default_val = previous[i] if i < len(previous) else 0.0
+                q_grades.append(
+                    st.number_input(
+                        f"{course} – Quarter {i + 1}",
+                        min_value=0.0,
+                        max_value=100.0,
+                        value=float(default_val),
+                        key=f"hs_q{i + 1}_{course}",
+                    )
+                )
+
+            hs_course_grades[course] = q_grades
+
+            # Handle AP World year
+            gt_year = None
+            if course == "GT / AP World History":
+                gt_year = st.selectbox(
+                    f"Select year for {course}:",
+                    [1, 2],
+                    key=f"{course}_year",
+                )
+
+            # Save to DB (hs_row pads to 4 quarters)
+            grade_writer.stage(hs_row(current_user, course, q_grades, gt_year))
+
+    # =============================
+    # RESULTS & ANALYTICS TAB
+    # =============================
+    with gpa_tabs[2]:
+        st.subheader("📈 GPA Results & Analytics")
+
+        st.markdown(
+            """
+            <div class="es-card">
+                <div class="es-card-title">Calculate your current GPA</div>
+                <p class="es-card-sub">
+                    This combines every middle school semester and every high school semester
+                    (built from your quarter grades) into one overall GPA.
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+        if st.button("🎯 Calculate GPA"):
+            # AP World weight depends on which year was picked in the MS / HS tabs
+            gt_years = {
+                course: st.session_state.get(f"{course}_year", 1)
+                for course in list(ms_course_grades) + list(hs_course_grades)
+                if course == "GT / AP World History"
+            }
+
+            # Every MS semester + every HS semester (built from quarter pairs)
+            result = student_gpa(ms_course_grades, hs_course_grades, gt_years)
+            final_weighted = result["final_weighted"]
+            final_unweighted = result["final_unweighted"]
+
+            # ===========================
+            # FINAL GPA
+            # ===========================
+            if final_weighted is None:
+                st.warning("No courses selected in the MS / HS tabs above.")
+            else:
+                st.success(f"🎓 Final Weighted GPA: {final_weighted}")
+                st.success(f"📘 Final Unweighted GPA: {final_unweighted}")
+
+                with st.expander("📖 See full GPA calculation breakdown"):
+                    for line in result["breakdown"]:
+                        st.text(line)
+
+        # ===========================
+        # SCHOOL STANDING
+        # ===========================
+        standing = rank_index.student(current_user)
+        if standing:
+            school_rank, school_pct, school_size = standing
+            st.info(
+                f"🏫 With your saved grades you're **#{school_rank} of {school_size}** students "
+                f"(**{school_pct:.0f}th percentile** for weighted GPA)."
+            )
+
+        with st.expander("🔎 Where would a GPA rank in the school?"):
+            lookup_gpa = st.number_input(
+                "Weighted GPA",
+                min_value=0.0,
+                max_value=6.0,
+                value=5.0,
+                step=0.01,
+                key="rank_lookup_gpa",
+            )
+            if len(rank_index):
+                st.write(
+                    f"Rank **#{rank_index.rank(lookup_gpa)} of {len(rank_index)}** — "
+                    f"**{rank_index.percentile(lookup_gpa):.0f}th percentile**"
+                )
+            else:
+                st.caption("No saved GPAs yet.")
+
+
+@st.fragment
+@profiler.timed
+def quiz_practice():
+    unit = None
+    difficulty = None
+
+    st.subheader("Quiz & Practice Problems")
+
+    # Create sub-tabs for each subject
+    quiz_subjects = ["Spanish", "Math"]
+    quiz_tabs = st.tabs(quiz_subjects)
+
+    # =============================
+    # SPANISH QUIZ
+    # =============================
+    with quiz_tabs[0]:
+        st.header("Spanish Quiz")
+        spanish_level = st.selectbox("Select your Spanish level:",
+                                     ["Spanish 1", "Spanish 2", "Spanish 3", "Spanish 4 AP"])
+
+        for q in question_bank.find(spanish_level):
+            st.radio(q["question"], q["options"], key=f"quiz_q{q['id']}")
+        st.success("Spanish quiz section loaded. Answers are not yet auto-graded.")
+
+    # =============================
+    # MATH QUIZ
+    # =============================
+    with quiz_tabs[1]:
+        st.header("AP Precalculus Quiz")
+
+        math_level = st.selectbox(
+            "Select your Math course:",
+            ["Algebra 1", "Geometry", "Algebra 2", "AP Precalculus"]
+        )
+
+        if math_level == "AP Precalculus":
+            unit = st.selectbox(
+                "Select the Unit you want to practice:",
+                question_bank.units("AP Precalculus"),
+                key="unit_select"
+            )
+            difficulty = st.radio(
+                "Select difficulty level:",
+                question_bank.difficulties("AP Precalculus", unit),
+                key="difficulty_radio"
+            )
+
+            available = len(question_bank.ids("AP Precalculus", unit, difficulty))
+            num_questions = st.number_input(
+                "Questions per attempt",
+                min_value=1,
+                max_value=max(available, 1),
+                value=max(available, 1),
+                step=1,
+                key="quiz_num_questions",
+            )
+
+            # Initialize show_questions flag
+            if "show_questions" not in st.session_state:
+                st.session_state.show_questions = False
+
+            # The questions drawn for each unit + difficulty stay put across reruns
+            # until "Show Questions" is clicked again (= a new attempt)
+            if "quiz_attempt_ids" not in st.session_state:
+                st.session_state.quiz_attempt_ids = {}
+
+            # Button to show questions
+            if unit and difficulty:
+                if st.button("Show Questions", key="show_questions_button"):
+                    st.session_state.show_questions = True
+                    st.session_state.quiz_attempt_ids[(unit, difficulty)] = question_bank.sample(
+                        num_questions, "AP Precalculus", unit, difficulty
+                    )
+
+            # Display questions only if flag is True
+            if st.session_state.show_questions:
+                # Initialize user_answers in session_state
+                if "user_answers" not in st.session_state:
+                    st.session_state.user_answers = {}
+
+                attempt_ids = st.session_state.quiz_attempt_ids.get((unit, difficulty))
+                if attempt_ids is None:
+                    attempt_ids = question_bank.sample(num_questions, "AP Precalculus", unit, difficulty)
+                    st.session_state.quiz_attempt_ids[(unit, difficulty)] = attempt_ids
+                attempt = [question_bank.by_id[qid] for qid in attempt_ids]
+
+                for i, q in enumerate(attempt, 1):
+                    if q["type"] == "mcq":
+                        st.session_state.user_answers[q["id"]] = st.radio(
+                            f"Q{i}: {q['question']}",
+                            q["options"],
+                            key=f"quiz_q{q['id']}"
+                        )
+                    else:
+                        st.session_state.user_answers[q["id"]] = st.text_input(
+                            f"Q{i}: {q['question']}",
+                            key=f"quiz_q{q['id']}"
+                        )
+
+                # Submit button to grade answers
+                if st.button("Submit Answers", key=f"submit_answers_{unit}_{difficulty}"):
+                    score = 0
+                    for q in attempt:
+                        ans = str(st.session_state.user_answers.get(q["id"], "")).strip().lower()
+                        correct = str(q["answer"]).strip().lower()
+                        if ans == correct:
+                            score += 1
+
+                    st.session_state.last_score = score
+                    st.session_state.last_unit = unit
+                    st.session_state.last_difficulty = difficulty
+
+                    st.success(f"You scored {score} out of {len(attempt)}!")
+
+                    # SAVE quiz result (kept in the DB so it survives a reload)
+                    with db_pool.write() as db:
+                        record_attempt(
+                            db,
+                            st.session_state.current_user,
+                            "AP Precalculus",
+                            unit,
+                            difficulty,
+                            score,
+                            len(attempt),
+                        )
+
+        # ---------- 3️⃣ Study Recommendations ----------
+        if st.button("Show Study Recommendations", key="study_recs_button"):
+            st.subheader("📌 Personalized Study Recommendations")
+
+            weak_units = analyze_weak_units()
+
+            if not weak_units:
+                st.success("🎉 Great job! No weak units detected.")
+            else:
+                for subject, units in weak_units.items():
+                    st.markdown(f"### {subject}")
+
+                    for unit in units:
+                        st.markdown(f"**🔹 {unit}**")
+                        st.write(get_study_tips(unit))
+
+
+# ============================
+# TOOL TAB 2: RESOURCE HUB
+# ============================
+@st.fragment
+@profiler.timed
+def resource_hub():
+    st.subheader("🔗 Resource Hub")
+
+    # Make sure the list exists
+    if "resources" not in st.session_state:
+        st.session_state.resources = []
+
+    # Slightly smaller left column so it doesn't dominate
+    col_left, col_right = st.columns([1.3, 2.7])
+
+    # ---------- LEFT: Add resource (compact) ----------
+    with col_left:
+        st.markdown("**Add a resource**")
+        st.caption("Save links you use a lot (Canvas, Desmos, Quizlet, docs, etc.).")
+
+        res_title = st.text_input(
+            "Name",
+            placeholder="Ex: Desmos Graphing Calculator",
+            key="res_title",
+        )
+
+        res_url = st.text_input(
+            "Link",
+            placeholder="Ex: fisd.instructure.com",
+            key="res_url",
+        )
+
+        res_category = st.selectbox(
+            "Category",
+            ["Math", "Science", "Spanish", "APs", "Research", "Other"],
+            key="res_category",
+        )
+
+        if st.button("Save resource", key="res_save_button"):
+            title = res_title.strip()
+            url = res_url.strip()
+
+            if title and url:
+                # Force full URL so it opens outside Streamlit
+                if not (url.startswith("http://") or url.startswith("https://")):
+                    url = "https://" + url
+
+                st.session_state.resources.append(
+                    {
+                        "title": title,
+                        "url": url,
+                        "category": res_category,
+                    }
+                )
+                st.success("✅ Resource saved!")
+            else:
+                st.warning("Please enter both a name and a link.")
+
+    # ---------- RIGHT: 3×3 table of tiles ----------
+    with col_right:
+        st.markdown("**Your saved resources**")
+
+        if not st.session_state.resources:
+            st.caption("No resources yet. Add a few on the left!")
+        else:
+            # Optional: filter by category
+            categories = ["All"] + sorted(
+                list({r["category"] for r in st.session_state.resources})
+            )
+            selected_cat = st.selectbox(
+                "Filter by category",
+                categories,
+                index=0,
+                key="res_filter_cat",
+            )
+
+            if selected_cat == "All":
+                filtered = st.session_state.resources
+            else:
+                filtered = [
+                    r for r in st.session_state.resources
+                    if r["category"] == selected_cat
+                ]
+
+            if not filtered:
+                st.caption("No resources in this category yet.")
+            else:
+                # Limit to 9 items → 3 rows × 3 columns
+                max_tiles = 9
+                display_list = filtered[:max_tiles]
+
+                # Row-by-row, 3 columns per row (tile colours cycle, see ui.resource_tile)
+                for row_start in range(0, len(display_list), 3):
+                    cols = st.columns(3)
+                    for i in range(3):
+                        idx = row_start + i
+                        if idx >= len(display_list):
+                            break
+
+                        r = display_list[idx]
+                        with cols[i]:
+                            st.markdown(ui.resource_tile(r["title"], r["url"], idx), unsafe_allow_html=True)
+
+                # If more than 9 in this category, tell the user
+                if len(filtered) > max_tiles:
+                    st.caption(f"+ {len(filtered) - max_tiles} more saved resources in this category.")
+
+
+# =============================
+# TAB 3: WHAT-IF GPA CALCULATOR
+# =============================
+@st.fragment
+@profiler.timed
+def whatif_calculator():
+    st.subheader("❓ What-If GPA Calculator")
+
+    st.markdown(
+        "See how your **overall weighted GPA** changes if you add new classes with certain grades."
+        "<br><br>"
+        "This uses the same 6.0 scale and weight system as your main GPA calculator.",
+        unsafe_allow_html=True,
+    )
+
+    mode = st.radio(
+        "Choose a mode:",
+        ["Single new class", "Full new semester", "Grades I need for a goal"],
+        key="whatif_gpa_mode",
+    )
+
+    st.markdown("---")
+
+    # -------- Shared inputs --------
+    # Start from the running totals saved with your grades (one row lookup)
+    with db_pool.read() as db:
+        saved_totals = read_gpa_totals(db, st.session_state.current_user)
+
+    if saved_totals and saved_totals[0] > 0:
+        saved_semesters, saved_points, _ = saved_totals
+        default_gpa = min(round(saved_points / saved_semesters, 3), 6.0)
+        default_completed = min(saved_semesters, 200)
+        st.caption("📥 Pre-filled from the grades you saved in the GPA tab. You can still change them.")
+    else:
+        saved_points = None
+        default_gpa = 5.0
+        default_completed = 10
+
+    current_gpa = st.number_input(
+        "Current weighted GPA (on 6.0 scale)",
+        min_value=0.0,
+        max_value=6.0,
+        value=default_gpa,
+        step=0.01,
+        key="whatif_current_gpa",
+    )
+
+    completed_semesters = st.number_input(
+        "How many semester classes have you already completed in total?",
+        min_value=0,
+        max_value=200,
+        value=default_completed,
+        step=1,
+        key="whatif_completed_semesters",
+    )
+
+    # If they have 0 completed, treat total points as 0
+    current_total_points = current_gpa * completed_semesters if completed_semesters > 0 else 0.0
+
+    # Untouched pre-filled inputs -> use the exact saved points (no rounding drift)
+    if saved_points is not None and (current_gpa, completed_semesters) == (default_gpa, default_completed):
+        current_total_points = saved_points
+
+    # -------- Optional: range of outcomes (Monte Carlo) --------
+    use_ranges = st.checkbox(
+        "🎲 Not sure about my grades — show a range of outcomes",
+        key="whatif_mc",
+    )
+
+    target_gpa = None
+    past_grades = None
+    if use_ranges:
+        target_gpa = st.number_input(
+            "Target weighted GPA",
+            min_value=0.0,
+            max_value=6.0,
+            value=float(current_gpa),
+            step=0.01,
+            key="whatif_mc_target",
+        )
+
+        spread_source = st.radio(
+            "How much could each grade move?",
+            ["I'll pick a ± range for each class", "Use how much my saved grades vary"],
+            key="whatif_mc_source",
+        )
+
+        if spread_source == "Use how much my saved grades vary":
+            past_grades = load_past_semester_grades()
+            if len(past_grades) < 2:
+                st.warning("Not enough saved grades yet — using a ± range for each class instead.")
+                past_grades = None
+
+    def grade_spread(label, key):
+        # ± points for one class (only asked for when not using saved grades)
+        if not use_ranges or past_grades is not None:
+            return 0.0
+        return st.number_input(label, min_value=0.0, max_value=30.0, value=3.0, step=0.5, key=key)
+
+    def simulate(classes):
+        for cfg in classes:
+            if past_grades is not None:
+                cfg["history"] = past_grades
+        return simulate_gpa(current_total_points, completed_semesters, classes, targets=[target_gpa])
+
+    # ---------- MODE 1: Single new class ----------
+    if mode == "Single new class":
+        st.markdown("### 🎯 Single Class Simulation")
+
+        course_name = st.selectbox(
+            "Pick the class you want to simulate:",
+            list(courses.keys()),
+            key="whatif_single_course",
+        )
+
+        # Handle AP World year (different weights)
+        ap_world_year = None
+        if course_name == "GT / AP World History":
+            ap_world_year = st.selectbox(
+                "Which year of AP World is this?",
+                [1, 2],
+                key="whatif_single_apworld_year",
+            )
+        class_weight = course_weight(course_name, ap_world_year)
+
+        predicted_grade = st.number_input(
+            "Predicted semester grade for this class (%)",
+            min_value=0.0,
+            max_value=150.0,
+            value=95.0,
+            step=0.5,
+            key="whatif_single_predicted",
+        )
+        spread = grade_spread("Could be off by ± (points)", "whatif_single_spread")
+
+        if st.button("Calculate new GPA (single class)", key="whatif_single_calc"):
+            # GPA for this one class on 6.0 scale
+            class_gpa = weighted_gpa(predicted_grade, class_weight)
+            class_gpa = round(class_gpa, 3)
+
+            new_total_points = current_total_points + class_gpa
+            new_total_classes = completed_semesters + 1
+
+            new_cum_gpa = new_total_points / new_total_classes if new_total_classes > 0 else 0.0
+            new_cum_gpa = round(new_cum_gpa, 3)
+
+            st.success(
+                f"That **{predicted_grade:.1f}%** in **{course_name}** "
+                f"counts as about **{class_gpa:.3f}** on the 6.0 scale."
+            )
+            st.info(
+                f"Your overall weighted GPA would change from **{current_gpa:.3f}** "
+                f"to about **{new_cum_gpa:.3f}**."
+            )
+
+            if use_ranges:
+                result = simulate([{"weight": class_weight, "mean": predicted_grade, "spread": spread}])
+                show_gpa_range(result, current_gpa, target_gpa)
+
+    # ---------- MODE 2: Full new semester ----------
+    elif mode == "Full new semester":
+        st.markdown("### 📚 Full New Semester Simulation")
+
+        num_classes = st.slider(
+            "How many classes are you taking this semester?",
+            min_value=1,
+            max_value=8,
+            value=4,
+            step=1,
+            key="whatif_sem_num_classes",
+        )
+
+        st.caption("Fill in each class below with the class name and the semester grade you think you'll get.")
+
+        # Collect class configs
+        class_configs = []
+
+        for i in range(1, num_classes + 1):
+            st.markdown(f"**Class {i}**")
+
+            course_name = st.selectbox(
+                f"Class {i} name",
+                list(courses.keys()),
+                key=f"whatif_sem_course_{i}",
+            )
+
+            ap_world_year = None
+            if course_name == "GT / AP World History":
+                ap_world_year = st.selectbox(
+                    f"AP World year for Class {i}",
+                    [1, 2],
+                    key=f"whatif_sem_apworld_year_{i}",
+                )
+            class_weight = course_weight(course_name, ap_world_year)
+
+            predicted_grade = st.number_input(
+                f"Predicted semester grade for Class {i} (%)",
+                min_value=0.0,
+                max_value=150.0,
+                value=93.0,
+                step=0.5,
+                key=f"whatif_sem_grade_{i}",
+            )
+            spread = grade_spread(f"Class {i} could be off by ± (points)", f"whatif_sem_spread_{i}")
+
+            class_configs.append(
+                {
+                    "name": course_name,
+                    "weight": class_weight,
+                    "grade": predicted_grade,
+                    "ap_year": ap_world_year,
+                    "spread": spread,
+                }
+            )
+
+            st.markdown("---")
+
+        if st.button("Calculate new GPA for this whole semester", key="whatif_sem_calc"):
+            new_points = []
+            breakdown_lines = []
+
+            for cfg in class_configs:
+                class_gpa = weighted_gpa(cfg["grade"], cfg["weight"])
+                class_gpa = round(class_gpa, 3)
+                new_points.append(class_gpa)
+
+                breakdown_lines.append(
+                    f"{cfg['name']}: {cfg['grade']:.1f}% "
+                    f"with weight {cfg['weight']} → {class_gpa:.3f} GPA points"
+                )
+
+            total_new_points = sum(new_points)
+            total_classes_added = len(new_points)
+
+            total_points_all = current_total_points + total_new_points
+            total_classes_all = completed_semesters + total_classes_added
+
+            new_cum_gpa = total_points_all / total_classes_all if total_classes_all > 0 else 0.0
+            new_cum_gpa = round(new_cum_gpa, 3)
+
+            st.success(
+                f"With these predicted grades, this semester would add **{total_new_points:.3f}** "
+                f"GPA points across **{total_classes_added}** classes."
+            )
+            st.info(
+                f"Your overall weighted GPA would go from **{current_gpa:.3f}** "
+                f"to about **{new_cum_gpa:.3f}**."
+            )
+
+            st.markdown("#### Class-by-class breakdown")
+            for line in breakdown_lines:
+                st.text(line)
+
+            if use_ranges:
+                result = simulate([
+                    {"weight": cfg["weight"], "mean": cfg["grade"], "spread": cfg["spread"]}
+                    for cfg in class_configs
+                ])
+                show_gpa_range(result, current_gpa, target_gpa)
+
+    # ---------- MODE 3: Grades needed for a target GPA ----------
+    else:
+        st.markdown("### 🎯 What grades do I need?")
+
+        goal_gpa = st.number_input(
+            "Target overall weighted GPA",
+            min_value=0.0,
+            max_value=6.0,
+            value=min(float(current_gpa) + 0.1, 6.0),
+            step=0.01,
+            key="whatif_goal_target",
+        )
+
+        num_classes = st.slider(
+            "How many classes are you planning to take?",
+            min_value=1,
+            max_value=8,
+            value=4,
+            step=1,
+            key="whatif_goal_num_classes",
+        )
+
+        planned = []
+        for i in range(1, num_classes + 1):
+            course_name = st.selectbox(
+                f"Class {i}",
+                list(courses.keys()),
+                key=f"whatif_goal_course_{i}",
+            )
+
+            ap_world_year = None
+            if course_name == "GT / AP World History":
+                ap_world_year = st.selectbox(
+                    f"AP World year for Class {i}",
+                    [1, 2],
+                    key=f"whatif_goal_apworld_year_{i}",
+                )
+
+            planned.append((course_name, course_weight(course_name, ap_world_year)))
+
+        if st.button("Find the grades I need", key="whatif_goal_calc"):
+            plan = solve_target(
+                current_total_points,
+                completed_semesters,
+                [weight for _, weight in planned],
+                goal_gpa,
+            )
+
+            if not plan["reachable"]:
+                st.warning(
+                    f"Even 100% in every class only gets you to about **{plan['best_gpa']:.3f}**, "
+                    f"so **{goal_gpa:.2f}** isn't reachable this semester."
+                )
+            elif plan["uniform_grade"] == 0:
+                st.success(f"You're already set — any grades keep you at **{goal_gpa:.2f}** or higher. 🎉")
+            else:
+                st.success(
+                    f"Get at least **{plan['uniform_grade']:.1f}%** in every class "
+                    f"to reach **{goal_gpa:.2f}**."
+                )
+
+                st.markdown("#### Lowest grade each class can have")
+                st.caption("If you get 100% in all your other classes — below this, the goal is out of reach.")
+                for (name, weight), floor in zip(planned, plan["floors"]):
+                    st.text(f"{name} (weight {weight}): {floor:.1f}%")
+
+
+def render():
+    # ---------- Session State Defaults ----------
+    if "quiz_results" not in st.session_state:
+        st.session_state.quiz_results = []
+
+    if "quiz_scores" not in st.session_state:
+        st.session_state.quiz_scores = {}
+
+    if "show_questions" not in st.session_state:
+        st.session_state.show_questions = False
+
+    if "submitted" not in st.session_state:
+        st.session_state.submitted = False
+
+    if "resources" not in st.session_state:
+        st.session_state.resources = []   # each: {"title", "url", "category"}
+
+    st.subheader("📚 School Tools")
+
+    tools_tabs = st.tabs([
+        "📊 GPA",
+        "📝 Quiz & Practice",
+        "🔗 Resource Hub",
+        "🔮 What-If GPA"  # 👈 NEW
+    ])
+
+    with tools_tabs[0]:
+        gpa_calculator()
+
+    with tools_tabs[1]:
+        quiz_practice()
+
+    with tools_tabs[2]:
+        resource_hub()
+
+    with tools_tabs[3]:
+        whatif_calculator()
@@ -0,0 +1,30 @@
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+# The app's modules are imported flat (import gpa_engine), like streamlit run does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gpa_db import migrate  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """A migrated in-memory database (shared by threads, like a pooled connection)."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    migrate(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def write(db):
+    """A ConnectionPool.write stand-in on the db fixture: commits, or rolls back on error."""
+    @contextmanager
+    def write():
+        with db:
+            yield db
+    return write
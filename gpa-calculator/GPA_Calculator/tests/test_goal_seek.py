@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+
+from gpa_engine import weighted_gpa_batch
+from goal_seek import solve_target
+
+
+def lowest_uniform_grade(weights, points_needed):
+    """Brute force: the lowest grade (to 0.1) that reaches points_needed in every class."""
+    grades = np.arange(1001) / 10
+    enough = np.flatnonzero(weighted_gpa_batch(grades[:, None], weights).sum(axis=1) >= points_needed - 1e-9)
+    return float(grades[enough[0]]) if len(enough) else None
+
+
+def test_uniform_grade_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(300):
+        weights = [rng.choice([5.0, 5.5, 6.0]) for _ in range(rng.randint(1, 7))]
+        done = rng.randint(0, 12)
+        current = sum(rng.uniform(2.5, 6.0) for _ in range(done))
+        target = rng.uniform(3.0, 6.0)
+        plan = solve_target(current, done, weights, target)
+
+        expected = lowest_uniform_grade(weights, plan["points_needed"])
+        assert plan["uniform_grade"] == expected
+        assert plan["reachable"] == (expected is not None)
+
+
+def test_floors_are_the_lowest_grade_with_the_rest_at_100():
+    weights = [5.0, 5.5, 6.0]
+    plan = solve_target(current_total_points=20.0, completed_semesters=4, weights=weights, target_gpa=5.0)
+    for i, floor in enumerate(plan["floors"]):
+        grades = [100.0] * len(weights)
+        grades[i] = floor
+        assert weighted_gpa_batch(grades, weights).sum() >= plan["points_needed"] - 1e-9
+        grades[i] = floor - 0.1
+        assert weighted_gpa_batch(grades, weights).sum() < plan["points_needed"]
+
+
+def test_target_already_met_needs_nothing():
+    plan = solve_target(current_total_points=60.0, completed_semesters=10, weights=[5.0, 5.0], target_gpa=4.0)
+    assert plan["points_needed"] < 0
+    assert plan["uniform_grade"] == 0
+    assert plan["floors"] == [0.0, 0.0]
+
+
+def test_unreachable_target():
+    plan = solve_target(current_total_points=30.0, completed_semesters=10, weights=[5.0], target_gpa=5.0)
+    assert not plan["reachable"]
+    assert plan["uniform_grade"] is None
+    assert plan["floors"] == [None]
+    assert plan["best_gpa"] == (30.0 + 5.0) / 11
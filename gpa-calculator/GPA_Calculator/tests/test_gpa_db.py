@@ -0,0 +1,85 @@
+import sqlite3
+
+from gpa_db import MIGRATIONS, grades_has_primary_key, migrate, schema_version
+from gpa_engine import course_weight
+
+# grades as the app created it before it had a primary key
+LEGACY_GRADES = """
+CREATE TABLE grades (
+    username TEXT, course TEXT, section TEXT,
+    semester1 REAL, semester2 REAL, q1 REAL, q2 REAL, q3 REAL, q4 REAL, gt_year TEXT
+)
+"""
+
+
+def legacy_db(rows):
+    conn = sqlite3.connect(":memory:")
+    conn.execute(LEGACY_GRADES)
+    conn.executemany(
+        "INSERT INTO grades (username, course, section, semester1, semester2) VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    return conn
+
+
+def test_dedupe_keeps_the_newest_row_per_course():
+    conn = legacy_db([
+        ("ana", "Algebra 1", "MS", 80, None),
+        ("ana", "Algebra 1", "MS", 85, 90),   # newest copy wins
+        ("ana", "Biology", "MS", 70, None),
+        ("ben", "Algebra 1", "MS", 99, None),
+        (None, "Algebra 1", "MS", 50, None),  # no username: dropped
+    ])
+    migrate(conn)
+
+    assert grades_has_primary_key(conn)
+    rows = conn.execute("SELECT username, course, semester1, semester2 FROM grades ORDER BY username, course")
+    assert rows.fetchall() == [
+        ("ana", "Algebra 1", 85, 90),
+        ("ana", "Biology", 70, None),
+        ("ben", "Algebra 1", 99, None),
+    ]
+
+
+def test_dedupe_backfills_gpa_totals_from_the_kept_rows():
+    conn = legacy_db([("ana", "Algebra 1", "MS", 60, None), ("ana", "Algebra 1", "MS", 100, None)])
+    migrate(conn)
+    # 100 in the class = the full course weight
+    totals = conn.execute("SELECT semesters, weighted_points FROM gpa_totals").fetchall()
+    assert totals == [(1, course_weight("Algebra 1"))]
+
+
+def test_dedupe_leaves_a_keyed_table_alone(db):
+    db.execute("INSERT INTO grades (username, section, course, semester1) VALUES ('ana', 'MS', 'Biology', 91)")
+    MIGRATIONS[1](db)  # _dedupe_grades
+    assert grades_has_primary_key(db)
+    assert db.execute("SELECT username, semester1 FROM grades").fetchall() == [("ana", 91)]
+
+
+def test_migrate_applies_every_version_once():
+    conn = sqlite3.connect(":memory:")
+    assert migrate(conn) == list(range(1, len(MIGRATIONS) + 1))
+    assert schema_version(conn) == len(MIGRATIONS)
+    assert migrate(conn) == []
+
+
+def test_migrate_only_runs_the_new_steps(db):
+    # A database one version behind just gets the last migration
+    db.execute("DROP TABLE planner_rules")
+    db.execute(f"PRAGMA user_version = {len(MIGRATIONS) - 1}")
+    assert migrate(db) == [len(MIGRATIONS)]
+    assert db.execute("SELECT COUNT(*) FROM planner_rules").fetchone() == (0,)
+
+
+def test_migrate_rechecks_the_version_inside_its_transaction(db, monkeypatch):
+    # Another process finished the last migration between our check and our lock
+    real_version = schema_version
+
+    def racing_version(conn):
+        return real_version(conn) if conn.in_transaction else len(MIGRATIONS) - 1
+
+    db.execute(f"PRAGMA user_version = {len(MIGRATIONS)}")
+    monkeypatch.setattr("gpa_db.schema_version", racing_version)
+    assert migrate(db) == []
+    assert real_version(db) == len(MIGRATIONS)
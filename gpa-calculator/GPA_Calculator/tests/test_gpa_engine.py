@@ -0,0 +1,82 @@
+import random
+
+from gpa_engine import (
+    course_grades,
+    course_weight,
+    courses,
+    roster_gpas,
+    student_gpa,
+    unweighted_gpa,
+    weighted_gpa,
+)
+
+
+def scalar_final(grades, weights):
+    """The Results tab's original per-semester loop and rounding."""
+    weighted = [weighted_gpa(g, w) for g, w in zip(grades, weights)]
+    unweighted = [unweighted_gpa(g) for g in grades]
+    return round(sum(weighted) / len(weighted), 3), round(sum(unweighted) / len(unweighted), 3)
+
+
+def test_final_gpa_rounds_like_the_scalar_formula():
+    ms = {"Spanish 4 AP": (77, 96), "Instruments": (76, 100), "Algebra 1": (98, 71), "Biology": (83, 98)}
+    result = student_gpa(ms, {})
+    assert result["final_weighted"] == 4.237
+
+
+def roster_row(username, course, section, s=(None, None), q=(None, None, None, None), gt_year=None):
+    return (username, course, section, *s, *q, gt_year)
+
+
+def test_batch_rounds_halfway_averages_like_the_scalar_formula():
+    # The weighted average here is 4.2375 (np.round alone gives 4.238)
+    ms = {"Spanish 4 AP": (77, 96), "Instruments": (76, 100), "Algebra 1": (98, 71), "Biology": (83, 98)}
+    rows = [roster_row("u1", course, "MS", s=sems) for course, sems in ms.items()]
+    result = roster_gpas(rows)
+    assert float(result["weighted"][0]) == 4.237
+    assert float(result["weighted_points"][0]) / int(result["semesters"][0]) == 4.2375
+
+
+def test_random_ms_gradebooks_match_the_scalar_formula():
+    rng = random.Random(0)
+    names = list(courses)
+    for _ in range(2000):
+        ms = {
+            course: (rng.randint(60, 100), rng.randint(60, 100))
+            for course in rng.sample(names, rng.randint(1, 8))
+        }
+        grades = [g for sems in ms.values() for g in sems]
+        weights = [course_weight(c) for c, sems in ms.items() for _ in sems]
+        result = student_gpa(ms, {})
+        assert (result["final_weighted"], result["final_unweighted"]) == scalar_final(grades, weights)
+
+
+def test_student_gpa_matches_roster_gpas_on_the_same_rows():
+    rng = random.Random(1)
+    names = list(courses)
+    for k in range(500):
+        user = f"u{k}"
+        rows = []
+        for course in rng.sample(names, rng.randint(1, 6)):
+            if rng.random() < 0.5:
+                s1 = rng.randint(60, 100)
+                s2 = rng.choice([None, rng.randint(60, 100)])
+                rows.append(roster_row(user, course, "MS", s=(s1, s2)))
+            else:
+                q = [rng.choice([None, rng.randint(60, 100)]) for _ in range(4)]
+                if all(g is None for g in q):
+                    q[0] = 90
+                rows.append(roster_row(user, course, "HS", q=q))
+        one = student_gpa(*course_grades(rows))
+        many = roster_gpas(rows)
+        assert one["final_weighted"] == float(many["weighted"][0])
+        assert one["final_unweighted"] == float(many["unweighted"][0])
+        assert len(one["rows"]) == int(many["semesters"][0])
+
+
+def test_blank_quarter_stays_in_its_semester():
+    rows = [roster_row("u1", "GT / AP World History", "HS", q=(92, None, 85, None))]
+    one = student_gpa(*course_grades(rows))
+    many = roster_gpas(rows)
+    assert len(one["rows"]) == 2
+    assert one["final_weighted"] == float(many["weighted"][0])
@@ -0,0 +1,100 @@
+import random
+import threading
+import time
+
+import gpa_rank
+from gpa_rank import GpaRankIndex
+
+
+def brute_rank(gpas, gpa):
+    return 1 + sum(g > gpa for g in gpas)
+
+
+def brute_percentile(gpas, gpa):
+    below = sum(g < gpa for g in gpas)
+    tied = sum(g == gpa for g in gpas)
+    return 100.0 * (below + 0.5 * tied) / len(gpas)
+
+
+def test_rank_and_percentile_match_counting_every_student():
+    rng = random.Random(0)
+    students = {f"u{i}": round(rng.uniform(0, 6), 3) for i in range(500)}
+    index = GpaRankIndex(lambda: list(students.items()))
+
+    # Move, add and remove a few, the way saves do
+    for name in rng.sample(sorted(students), 50):
+        students[name] = round(rng.uniform(0, 6), 3)
+        index.update(name, students[name])
+    students["new"] = 4.5
+    index.update("new", 4.5)
+    del students["u0"]
+    index.update("u0", None)
+
+    gpas = list(students.values())
+    assert len(index) == len(gpas)
+    for gpa in [0.0, 2.5, 4.5, 6.0] + rng.sample(gpas, 20):
+        assert index.rank(gpa) == brute_rank(gpas, gpa)
+        assert abs(index.percentile(gpa) - brute_percentile(gpas, gpa)) < 1e-9
+    rank, percentile, total = index.student("new")
+    assert (rank, total) == (brute_rank(gpas, 4.5), len(gpas))
+
+
+def test_empty_index_has_no_percentile():
+    index = GpaRankIndex(lambda: [])
+    assert index.percentile(4.0) is None
+    assert index.rank(4.0) == 1
+    assert index.student("ana") is None
+
+
+def test_update_during_a_rebuild_survives_the_swap():
+    loading, release = threading.Event(), threading.Event()
+    rows = [("ana", 3.0), ("ben", 4.0)]
+
+    def load():
+        if loading.is_set():
+            release.wait(5)
+        return list(rows)
+
+    index = GpaRankIndex(load)
+    loading.set()
+    rebuild = threading.Thread(target=index.rebuild)
+    rebuild.start()
+    while index._replay is None:
+        time.sleep(0.001)
+
+    # Saved while load() is reading: the rows it returns are older, so it must be replayed
+    index.update("ana", 5.0)
+    release.set()
+    rebuild.join()
+    assert index.rank(5.0) == 1
+    assert index.student("ana")[0] == 1
+
+
+def test_stale_index_is_rebuilt_in_the_background():
+    rows = [("ana", 3.0)]
+    index = GpaRankIndex(lambda: list(rows), max_age=0)
+    rows.append(("ben", 4.0))
+    index.rank(3.0)  # answers from the old snapshot and starts a rebuild
+    deadline = time.monotonic() + 5
+    while len(index) < 2 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert index.rank(3.0) == 2
+
+
+def test_failing_rebuild_backs_off(monkeypatch):
+    monkeypatch.setattr(gpa_rank, "RETRY_SECONDS", 60)
+    loads = []
+
+    def load():
+        loads.append(1)
+        if len(loads) > 1:
+            raise RuntimeError("database is gone")
+        return [("ana", 3.0)]
+
+    index = GpaRankIndex(load, max_age=0.01)
+    time.sleep(0.02)
+    for _ in range(100):
+        assert index.rank(3.0) == 1  # still the old snapshot
+        time.sleep(0.001)
+    time.sleep(0.05)
+    assert len(loads) == 2
@@ -0,0 +1,111 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+import grade_store
+from grade_store import GradeWriter, hs_row, ms_row
+
+
+def saved_grades(db):
+    return db.execute("SELECT username, course, semester1, semester2 FROM grades ORDER BY course").fetchall()
+
+
+def test_stage_skips_rows_that_are_already_saved(write):
+    writer = GradeWriter(write, delay=60)
+    writer.remember([ms_row("ana", "Biology", 90)])
+    assert not writer.stage(ms_row("ana", "Biology", 90))
+    assert writer.stage(ms_row("ana", "Biology", 91))
+    # Same edit twice = still one queued row
+    assert not writer.stage(ms_row("ana", "Biology", 91))
+    assert len(writer.pending) == 1
+
+
+def test_flush_writes_pending_rows_and_totals_in_one_go(db, write):
+    changes = []
+    writer = GradeWriter(write, delay=60, on_saved=changes.append)
+    writer.stage(ms_row("ana", "Biology", 90, 80))
+    writer.stage(hs_row("ana", "Algebra 1", [95, 85]))
+
+    assert writer.flush() == 2
+    assert writer.pending == {}
+    assert saved_grades(db) == [("ana", "Algebra 1", None, None), ("ana", "Biology", 90, 80)]
+    assert db.execute("SELECT semesters FROM gpa_totals WHERE username = 'ana'").fetchone() == (3,)
+    assert list(changes[0]) == ["ana"]
+    # Nothing left to write
+    assert writer.flush() == 0
+
+
+def test_edits_are_written_once_the_student_stops_typing(db, write):
+    writer = GradeWriter(write, delay=0.05)
+    for grade in (7, 78, 785):
+        writer.stage(ms_row("ana", "Biology", grade))
+    time.sleep(0.3)
+    assert saved_grades(db) == [("ana", "Biology", 785, None)]
+
+
+def test_edit_back_during_a_flush_is_still_written(db, write):
+    old, new = ms_row("ana", "Biology", 90), ms_row("ana", "Biology", 95)
+    release = threading.Event()
+
+    @contextmanager
+    def slow_write():
+        with write() as conn:
+            yield conn
+            release.wait(5)
+
+    writer = GradeWriter(slow_write, delay=60)
+    writer.remember([old])
+    writer.stage(new)
+    flushing = threading.Thread(target=writer.flush)
+    flushing.start()
+    while not writer.inflight:
+        time.sleep(0.001)
+
+    # new is being written; going back to old must queue it, not count as "unchanged"
+    assert writer.stage(old)
+    release.set()
+    flushing.join()
+    writer.flush()
+    assert saved_grades(db) == [("ana", "Biology", 90, None)]
+
+
+def test_failed_flush_keeps_the_rows_for_the_next_one(db, write):
+    fail = [True]
+
+    @contextmanager
+    def flaky_write():
+        if fail[0]:
+            raise OSError("disk full")
+        with write() as conn:
+            yield conn
+
+    writer = GradeWriter(flaky_write, delay=60)
+    writer.stage(ms_row("ana", "Biology", 90))
+    with pytest.raises(OSError):
+        writer.flush()
+    assert writer.inflight == {}
+
+    fail[0] = False
+    assert writer.flush() == 1
+    assert saved_grades(db) == [("ana", "Biology", 90, None)]
+
+
+def test_failed_timer_flush_is_retried(db, write, monkeypatch):
+    monkeypatch.setattr(grade_store, "RETRY_SECONDS", 0.05)
+    attempts = []
+
+    @contextmanager
+    def flaky_write():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("database is locked")
+        with write() as conn:
+            yield conn
+
+    writer = GradeWriter(flaky_write, delay=0.01)
+    writer.stage(ms_row("ana", "Biology", 90))
+    time.sleep(0.4)
+    assert len(attempts) == 2
+    assert saved_grades(db) == [("ana", "Biology", 90, None)]
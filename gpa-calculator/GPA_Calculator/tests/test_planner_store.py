@@ -0,0 +1,77 @@
+import random
+from datetime import date, timedelta
+
+from planner_store import add_rule, add_task, occurrence_id, occurrences, planned_between, rules_between
+
+MONDAY = date(2026, 3, 2)
+
+
+def rule(repeat, start=MONDAY, every=1, until=None):
+    return {"id": 1, "start": start, "until": until, "repeat": repeat, "every": every}
+
+
+def days(start, n):
+    return [start + timedelta(days=i) for i in range(n)]
+
+
+def naive_occurrences(r, start, end):
+    """Walks every day from the rule's start (what occurrences() avoids doing)."""
+    out = []
+    for day in days(r["start"], (end - r["start"]).days):
+        if r["until"] is not None and day > r["until"]:
+            break
+        offset = (day - r["start"]).days
+        hit = {
+            "daily": True,
+            "weekdays": day.weekday() < 5,
+            "weekly": offset % 7 == 0,
+            "every_n": offset % r["every"] == 0,
+        }[r["repeat"]]
+        if hit and day >= start:
+            out.append(day)
+    return out
+
+
+def test_school_days_skip_weekends_from_a_saturday():
+    saturday = MONDAY + timedelta(days=5)
+    got = list(occurrences(rule("weekdays"), saturday, saturday + timedelta(days=9)))
+    assert got == days(MONDAY + timedelta(days=7), 5)
+
+
+def test_every_n_days_jumps_to_the_rules_step():
+    # Rule every 3 days from Mar 2; asking from Mar 10 starts at Mar 11, not Mar 10
+    got = list(occurrences(rule("every_n", every=3), date(2026, 3, 10), date(2026, 3, 20)))
+    assert got == [date(2026, 3, 11), date(2026, 3, 14), date(2026, 3, 17)]
+
+
+def test_until_is_inclusive():
+    got = list(occurrences(rule("weekly", until=MONDAY + timedelta(days=14)), MONDAY, MONDAY + timedelta(days=60)))
+    assert got == [MONDAY, MONDAY + timedelta(days=7), MONDAY + timedelta(days=14)]
+
+
+def test_occurrences_match_walking_every_day():
+    rng = random.Random(0)
+    for _ in range(500):
+        start = MONDAY + timedelta(days=rng.randint(0, 30))
+        until = rng.choice([None, start + timedelta(days=rng.randint(0, 90))])
+        r = rule(rng.choice(["daily", "weekdays", "weekly", "every_n"]), start, rng.randint(1, 10), until)
+        view_start = MONDAY + timedelta(days=rng.randint(0, 120))
+        view_end = view_start + timedelta(days=rng.randint(0, 45))
+        assert list(occurrences(r, view_start, view_end)) == naive_occurrences(r, view_start, view_end)
+
+
+def test_planned_between_merges_rules_with_one_off_tasks(db):
+    add_task(db, "ana", MONDAY + timedelta(days=2), "Biology", "Lab report", "Homework", "High", 45)
+    rule_id = add_rule(db, "ana", MONDAY, "weekly", "Spanish", "Vocab quiz", "Quiz", "Medium", 20)
+    add_rule(db, "ana", MONDAY - timedelta(days=10), "daily", "Art", "Ended rule", "Homework", "Low", 10,
+             until=MONDAY - timedelta(days=1))
+    add_rule(db, "ben", MONDAY, "daily", "Art", "Not ana's", "Homework", "Low", 10)
+
+    assert [r["id"] for r in rules_between(db, "ana", MONDAY, MONDAY + timedelta(days=14))] == [rule_id]
+    tasks = planned_between(db, "ana", MONDAY, MONDAY + timedelta(days=14))
+    assert [(t["date"], t["title"]) for t in tasks] == [
+        (MONDAY, "Vocab quiz"),
+        (MONDAY + timedelta(days=2), "Lab report"),
+        (MONDAY + timedelta(days=7), "Vocab quiz"),
+    ]
+    assert tasks[0]["id"] == occurrence_id(rule_id, MONDAY) < 0
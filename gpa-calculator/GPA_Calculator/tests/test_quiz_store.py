@@ -0,0 +1,15 @@
+from quiz_store import record_attempt, weak_units
+
+
+def test_weak_units_lists_units_with_an_attempt_under_70_percent(db):
+    record_attempt(db, "ana", "Algebra 1", "Unit 2", "Easy", 9, 10)
+    record_attempt(db, "ana", "Algebra 1", "Unit 3", "Hard", 5, 10)
+    record_attempt(db, "ana", "Biology", "Unit 1", "Easy", 2, 5)
+    record_attempt(db, "ana", "Algebra 1", "Unit 2", "Hard", 6, 10)   # goes weak after Unit 3
+    record_attempt(db, "ana", "Algebra 1", "Unit 3", "Easy", 10, 10)  # a good retry doesn't clear it
+    record_attempt(db, "ana", "Algebra 1", "Unit 4", "Easy", 7, 10)   # exactly 70% is fine
+    record_attempt(db, "ben", "Algebra 1", "Unit 1", "Easy", 0, 10)
+
+    assert weak_units(db, "ana") == {"Algebra 1": ["Unit 3", "Unit 2"], "Biology": ["Unit 1"]}
+    assert weak_units(db, "cat") == {}
+
@@ -0,0 +1,113 @@
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+
+import reminders
+from reminders import ReminderEngine
+
+# The engine runs on a fast clock: one "day" here lasts DAY real seconds
+DAY = 0.5
+TODAY = date.today()
+
+
+@pytest.fixture
+def fast_days(monkeypatch):
+    base = time.time()
+
+    class FastDate(date):
+        @staticmethod
+        def fromtimestamp(ts):
+            return TODAY + timedelta(days=int((ts - base) // DAY))
+
+    monkeypatch.setattr(reminders, "_midnight", lambda day: base + (day - TODAY).days * DAY)
+    monkeypatch.setattr(reminders, "date", FastDate)
+    return base
+
+
+@pytest.fixture
+def engines():
+    started = []
+    yield started
+    for engine in started:
+        engine.close()
+
+
+def task(task_id, days_from_today):
+    return {"id": task_id, "date": TODAY + timedelta(days=days_from_today), "title": f"T{task_id}"}
+
+
+def due_ids(engine, username="ana"):
+    return [t["id"] for t in engine.due_for(username)]
+
+
+def wait_for(check, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not check() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return check()
+
+
+def test_tasks_come_due_and_expire_on_time(fast_days, engines):
+    rows = [("ana", task(1, -3)), ("ana", task(2, 1)), ("ana", task(3, 2)), ("ben", task(4, 0))]
+    engine = ReminderEngine(lambda start, end: [r for r in rows if start <= r[1]["date"] < end])
+    engines.append(engine)
+
+    # Overdue by 3 days and due tomorrow show now; the day after tomorrow doesn't yet
+    assert due_ids(engine) == [1, 2]
+    assert due_ids(engine, "ben") == [4]
+    assert due_ids(engine, "cat") == []
+
+    # A day later the overdue one has dropped out and the next one is due
+    assert wait_for(lambda: due_ids(engine) == [2, 3])
+
+
+def test_track_shows_a_new_task_straight_away(fast_days, engines):
+    engine = ReminderEngine(lambda start, end: [])
+    engines.append(engine)
+
+    assert engine.track("ana", task(1, 0))
+    assert not engine.track("ana", task(2, 30))  # past the loaded window: a later reload gets it
+    assert due_ids(engine) == [1]
+
+
+def test_task_tracked_during_a_reload_survives_it(fast_days, engines):
+    reading, release = threading.Event(), threading.Event()
+
+    def load(start, end):
+        if reading.is_set():
+            release.wait(5)
+        return []  # read before the new task was saved
+
+    engine = ReminderEngine(load, reload_seconds=3600)
+    engines.append(engine)
+    reading.set()
+    reload = threading.Thread(target=engine._reload)
+    reload.start()
+    assert wait_for(lambda: engine._tracked is not None)
+
+    engine.track("ana", task(1, 0))
+    release.set()
+    reload.join()
+    assert due_ids(engine) == [1]
+    assert engine._tracked is None
+
+
+def test_failed_reload_is_retried_and_the_thread_keeps_going(engines, monkeypatch):
+    monkeypatch.setattr(reminders, "RETRY_SECONDS", 0.05)
+    loads = []
+
+    def load(start, end):
+        loads.append(start)
+        if len(loads) == 2:
+            raise ValueError("Invalid isoformat string: '2026-13-01'")
+        return [("ana", task(1, 0))]
+
+    engine = ReminderEngine(load, reload_seconds=0.05)
+    engines.append(engine)
+    # Load 2 fails; load 3 is the retry
+    assert wait_for(lambda: len(loads) >= 3)
+    assert engine._thread.is_alive()
+    assert engine._tracked is None
+    assert due_ids(engine) == [1]
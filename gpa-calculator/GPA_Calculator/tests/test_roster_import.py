@@ -0,0 +1,87 @@
+import io
+
+import pytest
+
+from gpa_db import rebuild_gpa_totals
+from grade_store import GradeWriter, ms_row
+from roster_import import ImportRowError, import_grades, parse_row
+
+HEADER = "username,section,course,semester1,semester2,q1,q2,q3,q4,gt_year\n"
+
+
+def record(**fields):
+    base = {"username": "ana", "section": "MS", "course": "Biology"}
+    return {**base, **fields}
+
+
+def test_parse_row_builds_a_grades_row():
+    assert parse_row(record(semester1="91", semester2="")) == \
+        ("ana", "MS", "Biology", 91.0, None, None, None, None, None, None)
+    assert parse_row(record(section="hs", course="GT / AP World History", q1="90", q2="88", gt_year="2")) == \
+        ("ana", "HS", "GT / AP World History", None, None, 90.0, 88.0, None, None, "2")
+    # gt_year only means something for AP World
+    assert parse_row(record(semester1="80", gt_year="2"))[-1] is None
+
+
+@pytest.mark.parametrize("fields, message", [
+    ({"username": " "}, "username is blank"),
+    ({"section": "ES"}, "section must be MS or HS"),
+    ({"course": "Basket Weaving"}, "unknown course"),
+    ({"semester1": "abc"}, "semester1 is not a number"),
+    ({"semester1": "101"}, "between 0 and 100"),
+    ({"q1": "90"}, "MS rows use semester1/semester2"),
+    ({"section": "HS", "semester1": "90"}, "HS rows use q1-q4"),
+    ({"course": "GT / AP World History", "semester1": "90", "gt_year": "3"}, "gt_year must be 1 or 2"),
+])
+def test_parse_row_rejects_bad_rows(fields, message):
+    with pytest.raises(ImportRowError, match=message):
+        parse_row(record(**fields))
+
+
+@pytest.mark.parametrize("fields, message", [
+    ({"semester2": "90"}, "semester2 is filled but semester1 is blank"),
+    ({"section": "HS", "q2": "90"}, "q1 is blank but q2 is filled"),
+    ({"section": "HS", "q1": "90", "q3": "85"}, "q2 is blank but q3 is filled"),
+    ({"section": "HS", "q1": "90", "q2": "80", "q4": "85"}, "q3 is blank but q4 is filled"),
+])
+def test_parse_row_rejects_gaps(fields, message):
+    with pytest.raises(ImportRowError, match=message):
+        parse_row(record(**fields))
+
+
+def test_import_writes_chunks_and_reports_bad_lines(db, write):
+    csv_text = HEADER + (
+        "ana,MS,Biology,90,80,,,,,\n"
+        "ana,MS,Biology,95,85,,,,,\n"        # same course again: replaces it
+        "ben,HS,Algebra 1,,,90,,85,,\n"     # gap -> line 4 rejected
+        "ben,HS,Algebra 1,,,90,80,,,\n"
+        "cat,MS,Nope,90,,,,,,\n"             # line 6 rejected
+    )
+    progress = []
+    stats = import_grades(io.StringIO(csv_text), write, chunk_rows=2,
+                          on_progress=lambda s: progress.append(s["imported"]))
+
+    assert (stats["read"], stats["imported"], stats["rejected"]) == (5, 3, 2)
+    assert [line for line, _ in stats["errors"]] == [4, 6]
+    assert progress == [2, 3]
+    assert db.execute("SELECT username, semester1 FROM grades ORDER BY username").fetchall() == \
+        [("ana", 95.0), ("ben", None)]
+
+    # Per-chunk totals come out the same as rebuilding them from scratch
+    totals = db.execute("SELECT * FROM gpa_totals ORDER BY username").fetchall()
+    rebuild_gpa_totals(db)
+    assert db.execute("SELECT * FROM gpa_totals ORDER BY username").fetchall() == totals
+
+
+def test_import_needs_the_key_columns(write):
+    with pytest.raises(ValueError, match="missing column"):
+        import_grades(io.StringIO("username,course\nana,Biology\n"), write)
+
+
+def test_import_makes_grade_writers_forget_saved_rows(write):
+    writer = GradeWriter(write, delay=60)
+    writer.remember([ms_row("ana", "Biology", 90)])
+    import_grades(io.StringIO(HEADER + "ana,MS,Biology,70,,,,,,\n"), write)
+
+    # The import replaced the 90, so going back to 90 has to be saved again
+    assert writer.stage(ms_row("ana", "Biology", 90))
@@ -0,0 +1,86 @@
+import random
+from datetime import date, timedelta
+
+from workload import WorkloadPlan, task_weight
+
+START = date(2026, 3, 2)
+
+
+def random_task(task_id, rng, days=60):
+    return {
+        "id": task_id,
+        "date": START + timedelta(days=rng.randint(-2, days)),
+        "course": "Biology",
+        "title": f"Task {task_id}",
+        "type": rng.choice(["Homework", "Test", "Quiz", "Project", "Reminder"]),
+        "priority": rng.choice(["Low", "Medium", "High"]),
+        "est": rng.choice([0, 15, 30, 45, 60, 90, 120]),
+    }
+
+
+def check_plan(plan):
+    """Every day within budget, every kept task fully done by its deadline. Returns kept weight."""
+    done = {}
+    for i, day in enumerate(plan.days):
+        assert sum(minutes for _, minutes in day) <= plan.budget
+        for task_id, minutes in day:
+            assert i <= plan._deadline(plan.tasks[task_id])
+            done[task_id] = done.get(task_id, 0) + minutes
+    kept = {key[2] for key in plan.order}
+    at_risk = {key[2] for key in plan.at_risk}
+    assert done == {task_id: plan.tasks[task_id]["est"] for task_id in kept}
+    assert not kept & at_risk
+    assert kept | at_risk == {i for i, task in plan.tasks.items() if plan._schedulable(task)}
+    return sum(task_weight(plan.tasks[i]) for i in kept)
+
+
+def layout(plan):
+    return plan.days, plan.order, plan.slack
+
+
+def test_add_matches_a_full_rebuild_when_everything_fits():
+    for seed in range(200):
+        rng = random.Random(seed)
+        tasks = [random_task(i, rng) for i in range(rng.randint(0, 40))]
+        half = len(tasks) // 2
+        plan = WorkloadPlan(tasks[:half], budget=240, start=START, exact_max=0)
+        for task in tasks[half:]:
+            plan.add(task)
+            check_plan(plan)
+
+        full = WorkloadPlan(tasks, budget=240, start=START, exact_max=0)
+        if not full.at_risk:
+            assert not plan.at_risk
+            assert layout(plan) == layout(full), seed
+
+
+def test_add_keeps_an_overloaded_plan_valid():
+    for seed in range(200):
+        rng = random.Random(seed)
+        tasks = [random_task(i, rng, days=20) for i in range(rng.randint(10, 60))]
+        plan = WorkloadPlan(tasks[:5], budget=rng.choice([30, 60, 120]), start=START)
+        for task in tasks[5:]:
+            plan.add(task)
+            check_plan(plan)
+
+
+def test_new_test_pushes_out_a_less_valuable_task():
+    low = {"id": 1, "date": START + timedelta(days=1), "course": "Art", "title": "Sketch",
+           "type": "Homework", "priority": "Low", "est": 120}
+    test = {"id": 2, "date": START + timedelta(days=1), "course": "Biology", "title": "Unit test",
+            "type": "Test", "priority": "High", "est": 90}
+    plan = WorkloadPlan([low], budget=120, start=START, exact_max=0)
+    plan.add(test)
+    assert [task["id"] for task in plan.at_risk_tasks()] == [1]
+    assert [(day, [(t["id"], m) for t, m in chunks]) for day, chunks in plan.plan_days()] == \
+        [(START, [(2, 90)])]
+
+
+def test_exact_plan_keeps_at_least_as_much_as_greedy():
+    for seed in range(100):
+        rng = random.Random(seed)
+        tasks = [random_task(i, rng, days=5) for i in range(10)]
+        budget = rng.choice([30, 60, 120])
+        exact = WorkloadPlan(tasks, budget, START)
+        greedy = WorkloadPlan(tasks, budget, START, exact_max=0)
+        assert check_plan(exact) >= check_plan(greedy), seed
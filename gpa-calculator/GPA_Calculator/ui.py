@@ -0,0 +1,150 @@
+"""
+Stylesheet + small HTML templates for the app.
+
+All the CSS lives in static/edusphere.css. With server.enableStaticServing
+on (see .streamlit/config.toml) each page run only sends a ~80 byte <link>
+and the browser fetches/caches the sheet itself; without it we fall back to
+one minified <style> block per page run. Fragment reruns send neither. The templates
+only carry class names, so a task card or resource tile is ~150 bytes instead
+of ~1 KB of inline styles, and each one is built once per distinct content
+(lru_cache) instead of re-formatting the same f-string on every rerun.
+
+User text is HTML-escaped here, so a title like "<b>" shows up as typed.
+"""
+import hashlib
+import os
+import re
+from functools import lru_cache
+from html import escape
+
+import streamlit as st
+
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "edusphere.css")
+
+# Resource Hub tile colours (.es-tile-0 .. .es-tile-4 in the stylesheet), cycled
+TILE_COLORS = 5
+
+
+@st.cache_resource
+def load_stylesheet():
+    """static/edusphere.css minified into one <style> tag (read once per process)."""
+    with open(STYLESHEET_PATH, encoding="utf-8") as f:
+        css = f.read()
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return f"<style>{css.strip()}</style>"
+
+
+@st.cache_resource
+def stylesheet_link():
+    """<link> to the statically served sheet; ?v= changes when the file does."""
+    with open(STYLESHEET_PATH, "rb") as f:
+        version = hashlib.sha1(f.read()).hexdigest()[:10]
+    return f'<link rel="stylesheet" href="app/static/edusphere.css?v={version}">'
+
+
+def inject_stylesheet():
+    if st.get_option("server.enableStaticServing"):
+        st.markdown(stylesheet_link(), unsafe_allow_html=True)
+    else:
+        st.markdown(load_stylesheet(), unsafe_allow_html=True)
+
+
+# =============================
+# PAGE CHROME
+# =============================
+BRAND = (
+    '<div class="es-brand">'
+    '<div class="es-brand-name">🎓 EduSphere</div>'
+    '<div class="es-brand-tagline">Organize today. Own tomorrow.</div>'
+    "</div>"
+)
+
+TUTOR_BAR = (
+    '<a class="es-tutor-link" href="?section=tutoring">'
+    '<div class="es-tutor-bar">'
+    '<div class="es-tutor-bar-icon">📚</div>'
+    '<div class="es-tutor-bar-text">'
+    '<div class="es-tutor-bar-title">Now Offering 1-on-1 Tutoring</div>'
+    '<div class="es-tutor-bar-sub">Tap here to see subjects, grades, and how to get started.</div>'
+    "</div></div></a>"
+)
+
+
+@lru_cache(maxsize=256)
+def focus_box(items, reminders=()):
+    """
+    Today's Focus box; items is a tuple of the user's top priorities,
+    reminders a tuple of (title, when, overdue) for due planner tasks.
+    """
+    if items:
+        rows = "".join(f"<li>{escape(t)}</li>" for t in items)
+    else:
+        rows = '<li class="es-focus-empty">Set your top 3 in the Daily Dashboard tab.</li>'
+    if reminders:
+        rows += "".join(
+            f'<li class="es-focus-due{" es-focus-overdue" if overdue else ""}">'
+            f"⏰ {escape(title)} <span>· {escape(when)}</span></li>"
+            for title, when, overdue in reminders
+        )
+    return (
+        '<div class="es-focus">'
+        '<div class="es-focus-head"><span class="es-focus-pill">Today&apos;s Focus</span></div>'
+        f"<ul>{rows}</ul>"
+        "</div>"
+    )
+
+
+def pager(total, per_page, key):
+    """
+    "Page N of M" picker for a list that's loaded one page at a time.
+    Returns the offset of the page to show (0 when it all fits on one page).
+    """
+    pages = max(1, -(-total // per_page))
+    # Filters can shrink the list under a page that no longer exists
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    if pages == 1:
+        return 0
+    page = st.number_input(
+        f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=key
+    )
+    return (page - 1) * per_page
+
+
+# =============================
+# PER-ITEM TEMPLATES
+# =============================
+@lru_cache(maxsize=1024)
+def resource_tile(title, url, color):
+    return (
+        f'<a class="es-tile-link" href="{escape(url)}" target="_blank">'
+        f'<div class="es-tile es-tile-{color % TILE_COLORS}">'
+        f'<div class="es-tile-title">{escape(title)}</div>'
+        "</div></a>"
+    )
+
+
+@lru_cache(maxsize=4096)
+def task_card(title, course, task_type, priority, est):
+    return (
+        '<div class="es-task">'
+        f"<strong>{escape(title)}</strong><br>"
+        f'<span class="es-task-meta">{escape(course)} • {escape(task_type)} • '
+        f"Priority: {escape(priority)} • ~{est} min</span>"
+        "</div>"
+    )
+
+
+@lru_cache(maxsize=1024)
+def idea_card(title, tag, importance, desc):
+    details = escape(desc) if desc else "<i>No extra details yet.</i>"
+    return (
+        '<div class="es-idea">'
+        f'<div class="es-idea-title">{escape(title)}</div>'
+        f'<div class="es-idea-meta">Tag: <strong>{escape(tag)}</strong> &nbsp;&nbsp; '
+        f'Priority: <span>{"•" * importance}</span></div>'
+        f'<div class="es-idea-desc">{details}</div>'
+        "</div>"
+    )
@@ -0,0 +1,71 @@
+"""
+Monte Carlo mode for the What-If GPA Calculator.
+
+Instead of one predicted grade per class, each class gets a distribution:
+    {"weight": 6.0, "mean": 93, "spread": 3}           -> normal(mean, spread)
+    {"weight": 6.0, "mean": 93, "history": [88, 95]}   -> mean + a past "miss"
+The engine draws every class for every simulation at once (one NumPy array of
+shape sims x classes) and pushes it through the same 6.0-scale formula as the
+point estimate, so 100k simulations take a few milliseconds.
+"""
+import numpy as np
+
+from gpa_engine import weighted_gpa_batch
+
+DEFAULT_SIMS = 100_000
+
+# The What-If grade inputs allow 0-150%
+MIN_GRADE = 0.0
+MAX_GRADE = 150.0
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def sample_grades(classes, n_sims, rng):
+    """(n_sims, len(classes)) array of simulated semester grades."""
+    grades = np.empty((n_sims, len(classes)))
+
+    for col, cfg in enumerate(classes):
+        mean = float(cfg["mean"])
+        history = cfg.get("history")
+
+        if history is not None and len(history) > 1:
+            # Bootstrap: how far off past grades were from their own average
+            history = np.asarray(history, dtype=float)
+            misses = history - history.mean()
+            grades[:, col] = mean + rng.choice(misses, size=n_sims)
+        else:
+            grades[:, col] = rng.normal(mean, float(cfg.get("spread", 0.0)), size=n_sims)
+
+    return np.clip(grades, MIN_GRADE, MAX_GRADE, out=grades)
+
+
+def simulate_gpa(current_total_points, completed_semesters, classes,
+                 targets=(), n_sims=DEFAULT_SIMS, seed=None):
+    """
+    Runs n_sims possible semesters and returns:
+        mean         -> average new cumulative GPA
+        percentiles  -> {5: ..., 25: ..., 50: ..., 75: ..., 95: ...}
+        chance       -> {target: probability new GPA >= target}
+        class_means  -> average GPA points per class
+    Uses the same rounding as the point estimate (class GPA rounded to 3 places).
+    """
+    rng = np.random.default_rng(seed)
+
+    if not classes:
+        return None
+
+    weights = np.array([cfg["weight"] for cfg in classes], dtype=float)
+    grades = sample_grades(classes, n_sims, rng)
+
+    points = np.round(weighted_gpa_batch(grades, weights), 3)
+    total_classes = completed_semesters + len(classes)
+    cum_gpa = (current_total_points + points.sum(axis=1)) / total_classes
+
+    band = np.percentile(cum_gpa, PERCENTILES)
+    return {
+        "mean": float(cum_gpa.mean()),
+        "percentiles": {p: float(v) for p, v in zip(PERCENTILES, band)},
+        "chance": {t: float((cum_gpa >= t).mean()) for t in targets},
+        "class_means": points.mean(axis=0).tolist(),
+    }
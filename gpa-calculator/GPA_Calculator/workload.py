@@ -0,0 +1,243 @@
+"""
+Study plan: spreads planner tasks over the days before they're due, with at
+most budget minutes of work per day.
+
+Each task has to be done by the day before its date (a task due today can
+still be worked on today) and may be split across days. Tests and
+high-priority tasks are worth more (task_weight). When everything fits,
+every task gets done on time. When it doesn't, the plan keeps the most
+valuable tasks and lists the rest as at risk, so a day is never overloaded.
+
+* Choosing what fits: tasks go in deadline order, and whenever the minutes due
+  by a deadline exceed budget x days, the least valuable task so far is popped
+  off a min-heap and marked at risk (Moore-Hodgson). O(n log n). For small
+  plans (<= EXACT_MAX_TASKS) a branch-and-bound search finds the set with the
+  highest total weight instead.
+* Laying it out: with every task available from day one, earliest-deadline-
+  first is just the kept tasks sorted by (deadline, -weight, id), cut into
+  budget-sized days.
+* add(): if the new task fits next to everything already kept (a min over the
+  per-deadline slack), it is inserted into the sorted order and only the days
+  from its spot onward are re-cut. If it doesn't, less valuable tasks due no
+  later than it are dropped to make room; if even that can't free enough, the
+  new task is the one at risk. Small plans are simply re-solved exactly.
+"""
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from datetime import timedelta
+
+DEFAULT_BUDGET = 120
+# Plans this small get the exact optimizer (2^n worst case, pruned)
+EXACT_MAX_TASKS = 12
+
+TYPE_WEIGHT = {"Test": 3, "Quiz": 2, "Project": 1, "Homework": 1, "Reminder": 0}
+PRIORITY_WEIGHT = {"High": 3, "Medium": 2, "Low": 1}
+
+
+def task_weight(task):
+    return TYPE_WEIGHT.get(task["type"], 1) + PRIORITY_WEIGHT.get(task["priority"], 1)
+
+
+class WorkloadPlan:
+    def __init__(self, tasks, budget=DEFAULT_BUDGET, start=None, exact_max=EXACT_MAX_TASKS):
+        # tasks: planner_store task dicts (id, date, type, priority, est, ...)
+        self.budget = int(budget)
+        self.start = start
+        self.exact_max = exact_max
+        self.tasks = {}
+        for task in tasks:
+            self.tasks[task["id"]] = task
+        self.rebuild()
+
+    def __len__(self):
+        return len(self.tasks)
+
+    # ---------- helpers ----------
+    def _deadline(self, task):
+        """Index (days after start) of the last day task can be worked on."""
+        return max((task["date"] - self.start).days - 1, 0)
+
+    def _key(self, task_id):
+        task = self.tasks[task_id]
+        return (self._deadline(task), -task_weight(task), task_id)
+
+    def _schedulable(self, task):
+        return task["est"] > 0 and task["date"] >= self.start
+
+    def _capacity(self, deadline):
+        return self.budget * (deadline + 1)
+
+    def _grow_slack(self, deadline):
+        # slack[D] = budget x (D + 1) - minutes of kept tasks due by day D
+        while len(self.slack) <= deadline:
+            last = self.slack[-1] if self.slack else 0
+            self.slack.append(last + self.budget)
+
+    # ---------- choosing what fits ----------
+    def _greedy_keep(self, ids):
+        keep = []  # min-heap of (weight, -est, -id): the first to give up
+        load = 0
+        for task_id in sorted(ids, key=self._key):
+            task = self.tasks[task_id]
+            heapq.heappush(keep, (task_weight(task), -task["est"], -task_id))
+            load += task["est"]
+            while load > self._capacity(self._deadline(task)):
+                _, neg_est, _ = heapq.heappop(keep)
+                load += neg_est
+        return {-neg_id for _, _, neg_id in keep}
+
+    def _exact_keep(self, ids):
+        """Highest total weight (then most minutes) set that fits."""
+        order = sorted(ids, key=lambda i: (-task_weight(self.tasks[i]), i))
+        weights = [task_weight(self.tasks[i]) for i in order]
+        deadlines = [self._deadline(self.tasks[i]) for i in order]
+        ests = [self.tasks[i]["est"] for i in order]
+        remaining = [sum(weights[k:]) for k in range(len(order) + 1)]
+        slack = [self._capacity(d) for d in range(max(deadlines, default=0) + 1)]
+        best = [(-1, 0), []]
+        chosen = []
+
+        def search(k, weight, minutes):
+            if k == len(order):
+                if (weight, minutes) > best[0]:
+                    best[0], best[1] = (weight, minutes), list(chosen)
+                return
+            if weight + remaining[k] < best[0][0]:
+                return
+            d, est = deadlines[k], ests[k]
+            if min(slack[d:]) >= est:
+                for D in range(d, len(slack)):
+                    slack[D] -= est
+                chosen.append(order[k])
+                search(k + 1, weight + weights[k], minutes + est)
+                chosen.pop()
+                for D in range(d, len(slack)):
+                    slack[D] += est
+            search(k + 1, weight, minutes)
+
+        search(0, 0, 0)
+        return set(best[1])
+
+    def rebuild(self):
+        """Re-solves the whole plan (after the budget or task list changes)."""
+        ids = [i for i, task in self.tasks.items() if self._schedulable(task)]
+        if len(ids) <= self.exact_max:
+            kept = self._exact_keep(ids)
+        else:
+            kept = self._greedy_keep(ids)
+
+        self.order = sorted(self._key(i) for i in kept)
+        self.at_risk = sorted(self._key(i) for i in set(ids) - kept)
+        due_by = [0] * (max((key[0] for key in self.order), default=0) + 1)
+        for deadline, _, task_id in self.order:
+            due_by[deadline] += self.tasks[task_id]["est"]
+        self.slack = []
+        load = 0
+        for deadline, minutes in enumerate(due_by):
+            load += minutes
+            self.slack.append(self._capacity(deadline) - load)
+
+        # days[i] = [(task id, minutes), ...]; day_starts[i] = (order index, minutes
+        # of that task already done before day i)
+        self.days = []
+        self.day_starts = []
+        self._cut_days(0, 0)
+
+    def _cut_days(self, index, done):
+        """Lays order[index:] out into days, appending from day len(self.days)."""
+        while index < len(self.order):
+            self.day_starts.append((index, done))
+            day, left = [], self.budget
+            while left and index < len(self.order):
+                task_id = self.order[index][2]
+                minutes = min(self.tasks[task_id]["est"] - done, left)
+                day.append((task_id, minutes))
+                left -= minutes
+                done += minutes
+                if done == self.tasks[task_id]["est"]:
+                    index, done = index + 1, 0
+            self.days.append(day)
+
+    # ---------- incremental ----------
+    def add(self, task):
+        """Adds one new task, re-planning as little as possible."""
+        if task["date"] < self.start:
+            return  # already past, not part of this plan
+        self.tasks[task["id"]] = task
+        if not self._schedulable(task):
+            return
+        deadline = self._deadline(task)
+        key = self._key(task["id"])
+        self._grow_slack(deadline)
+        first_changed = len(self.order)
+        if min(self.slack[deadline:]) < task["est"]:
+            if len(self.order) + len(self.at_risk) < self.exact_max:
+                self.rebuild()
+                return
+            first_changed = self._make_room(task)
+            if first_changed is None:
+                insort(self.at_risk, key)
+                return
+
+        for D in range(deadline, len(self.slack)):
+            self.slack[D] -= task["est"]
+        position = bisect_left(self.order, key)
+        self.order.insert(position, key)
+        self._recut(min(position, first_changed))
+
+    def _make_room(self, task):
+        """
+        Drops less valuable tasks due no later than task (least valuable,
+        then longest, first) until it fits. Returns the lowest order index
+        that changed, or None (and drops nothing) if it can't fit that way.
+        """
+        deadline, weight = self._deadline(task), task_weight(task)
+        need = task["est"] - min(self.slack[deadline:])
+        due_by_then = bisect_left(self.order, (deadline + 1,))
+        cheaper = sorted(
+            (key for key in self.order[:due_by_then] if -key[1] < weight),
+            key=lambda key: (-key[1], -self.tasks[key[2]]["est"]),
+        )
+        drop, freed = [], 0
+        for key in cheaper:
+            if freed >= need:
+                break
+            drop.append(key)
+            freed += self.tasks[key[2]]["est"]
+        if freed < need:
+            return None
+
+        first_changed = len(self.order)
+        for key in drop:
+            position = bisect_left(self.order, key)
+            del self.order[position]
+            first_changed = min(first_changed, position)
+            for D in range(key[0], len(self.slack)):
+                self.slack[D] += self.tasks[key[2]]["est"]
+            insort(self.at_risk, key)
+        return first_changed
+
+    def _recut(self, position):
+        """Re-cuts the days from the one holding order[position] onward."""
+        # Days that start before position don't change
+        first_day = max(bisect_right(self.day_starts, (position, 0)) - 1, 0)
+        if first_day < len(self.day_starts):
+            index, done = self.day_starts[first_day]
+        else:
+            index, done = position, 0
+        del self.days[first_day:]
+        del self.day_starts[first_day:]
+        self._cut_days(index, done)
+
+    # ---------- reading the plan ----------
+    def plan_days(self, limit=None):
+        """
+        (date, [(task, minutes), ...]) for each day with work, tests and
+        high-priority work first within a day.
+        """
+        for i, day in enumerate(self.days[:limit]):
+            chunks = sorted(day, key=lambda chunk: -task_weight(self.tasks[chunk[0]]))
+            yield self.start + timedelta(days=i), [(self.tasks[t], m) for t, m in chunks]
+
+    def at_risk_tasks(self):
+        return [self.tasks[key[2]] for key in self.at_risk]